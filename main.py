@@ -1,4 +1,5 @@
 """PyInstaller entry point for Spec Critic."""
+import multiprocessing
 import sys
 import os
 from pathlib import Path
@@ -10,7 +11,12 @@ else:
     base_path = os.path.dirname(os.path.abspath(__file__))
     sys.path.insert(0, base_path)
 
-from src.gui.gui import main
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Cold DOCX extraction may fan out to a process pool; in the frozen
+    # Windows build each spawned worker re-runs this executable, and
+    # freeze_support() hands it to the worker loop instead of the GUI. The
+    # GUI import stays under the guard so spawned workers never load Tk.
+    multiprocessing.freeze_support()
+    from src.gui.gui import main
+
+    main()
@@ -13,9 +13,15 @@ The GUI build is windowed (``console=False``), so ``sys.stdout`` may be ``None``
 in the frozen app; ``_emit`` writes results to the file named by
 ``SPEC_CRITIC_SELFCHECK_OUT`` (set by CI) as well as printing when it can,
 so the smoke step can read the outcome regardless.
+
+``main`` calls ``multiprocessing.freeze_support()`` first: extraction and
+preprocessing fan out to spawn-based process pools, and in the frozen exe a
+spawned worker re-runs this script — without the call each worker would
+start another GUI instead of running its task.
 """
 from __future__ import annotations
 
+import multiprocessing
 import os
 import sys
 
@@ -58,6 +64,7 @@ def _selfcheck() -> int:
 
 
 def main() -> int:
+    multiprocessing.freeze_support()
     args = sys.argv[1:]
     if "--version" in args:
         return _print_version()
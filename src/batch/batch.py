@@ -220,6 +220,7 @@ def submit_review_batch(
                 paragraph_map=spec.paragraph_map,
                 pre_detected_alerts=spec_pre_detected,
                 retry_instruction=retry_instruction,
+                run_spec_count=len(specs),
             )
         )
         if built.allow_extended_output:
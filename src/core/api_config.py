@@ -303,6 +303,31 @@ def _bounded_worker_env(name: str, *, default: int, ceiling: int) -> int:
     return max(1, min(ceiling, value))
 
 
+# Opt-in switches for features that persist spec text or change an output
+# format. Stricter than the disable-token convention: only an explicit
+# affirmative turns one on, so a typo leaves the feature off.
+_ENABLE_TOKENS = frozenset({"1", "true", "yes", "on"})
+
+
+def env_flag_enabled(name: str) -> bool:
+    """Whether ``name`` is set to ``1`` / ``true`` / ``yes`` / ``on``."""
+    raw = os.environ.get(name)
+    return raw is not None and raw.strip().lower() in _ENABLE_TOKENS
+
+
+def env_megabytes(name: str, *, default: int) -> int:
+    """Read a size cap in MiB from ``name``, returned in bytes (minimum 1 MiB).
+
+    Unset, blank or malformed values fall back to ``default``.
+    """
+    raw = os.environ.get(name)
+    try:
+        mb = int(raw) if raw is not None and raw.strip() else default
+    except ValueError:
+        mb = default
+    return max(1, mb) * 1024 * 1024
+
+
 # Program-level concurrency.  These caps are deliberately separate from the
 # per-request model settings above: routed programs may contain several child
 # modules, each of which already has internal fan-out.  The outer scheduler
@@ -365,6 +390,82 @@ def realtime_collection_max_calls() -> int:
     )
 
 
+# Cold DOCX extraction fan-out. python-docx walks the XML tree in pure Python,
+# so the extraction thread pool is GIL-bound: beyond a handful of cold files it
+# parses roughly one spec at a time. A process pool scales with cores, but
+# each worker pays an interpreter spawn + ``python-docx`` import (hundreds of
+# milliseconds on Windows), so it only wins once enough files miss the
+# extraction cache in one call.
+ENV_EXTRACTION_PROCESSES = "SPEC_CRITIC_EXTRACTION_PROCESSES"
+EXTRACTION_PROCESS_MIN_FILES = 8
+_EXTRACTION_PROCESSES_CEILING = 8
+
+
+def _process_pool_workers(env_name: str, items: int, *, min_items: int, ceiling: int) -> int:
+    """Shared sizing rule for the opt-out CPU process pools (0 = stay in-process)."""
+    if items < 2:
+        return 0
+    cpus = os.cpu_count() or 1
+    raw = (os.environ.get(env_name) or "").strip().lower()
+    if raw in _DISABLE_TOKENS:
+        return 0
+    if raw:
+        try:
+            forced = int(raw)
+        except ValueError:
+            forced = None
+        if forced is not None:
+            if forced <= 0:
+                return 0
+            return min(ceiling, forced, items)
+    if cpus < 2 or items < min_items:
+        return 0
+    return min(cpus, ceiling, items)
+
+
+def extraction_process_workers(cold_files: int) -> int:
+    """Process-pool size for ``cold_files`` uncached DOCX parses (0 = threads).
+
+    ``SPEC_CRITIC_EXTRACTION_PROCESSES`` unset or blank: automatic — a pool
+    of ``min(cpu_count, 8, cold_files)`` once at least
+    ``EXTRACTION_PROCESS_MIN_FILES`` files are cold, otherwise threads. A
+    disable token (``0`` / ``false`` / ``no`` / ``off``) or any other
+    non-positive integer always uses threads; a positive integer forces a
+    pool of that size (capped at 8).
+    Malformed values fall back to automatic. Read fresh on each call.
+    """
+    return _process_pool_workers(
+        ENV_EXTRACTION_PROCESSES,
+        cold_files,
+        min_items=EXTRACTION_PROCESS_MIN_FILES,
+        ceiling=_EXTRACTION_PROCESSES_CEILING,
+    )
+
+
+# Local detector pass (``preprocess_spec``) fan-out. The detectors are pure
+# regex over each spec's text — CPU-bound and GIL-bound, but only tens of
+# milliseconds per spec, so the pool's spawn cost (workers import the module
+# registry) is only recovered on large projects.
+ENV_PREPROCESS_PROCESSES = "SPEC_CRITIC_PREPROCESS_PROCESSES"
+PREPROCESS_PROCESS_MIN_SPECS = 24
+_PREPROCESS_PROCESSES_CEILING = 8
+
+
+def preprocess_process_workers(spec_count: int) -> int:
+    """Process-pool size for preprocessing ``spec_count`` specs (0 = serial).
+
+    Same contract as :func:`extraction_process_workers`, read from
+    ``SPEC_CRITIC_PREPROCESS_PROCESSES`` with an automatic threshold of
+    ``PREPROCESS_PROCESS_MIN_SPECS``.
+    """
+    return _process_pool_workers(
+        ENV_PREPROCESS_PROCESSES,
+        spec_count,
+        min_items=PREPROCESS_PROCESS_MIN_SPECS,
+        ceiling=_PREPROCESS_PROCESSES_CEILING,
+    )
+
+
 def cross_check_max_tokens(*, model: str = CROSS_CHECK_MODEL_DEFAULT) -> int:
     return phase_output_cap(PHASE_CROSS_CHECK, model=model)
 
@@ -923,11 +1024,13 @@ class CachePolicy:
 
     ``cache_system`` and ``cache_tools`` independently control whether the
     system prompt and the trailing tool block carry ``cache_control``
-    breakpoints.
+    breakpoints. ``cache_user_prefix`` adds a third breakpoint after the
+    run-wide head of the user message (see :func:`user_content_with_cache`).
     """
 
     cache_system: bool
     cache_tools: bool
+    cache_user_prefix: bool = False
 
     @property
     def caches_anything(self) -> bool:
@@ -937,7 +1040,11 @@ class CachePolicy:
 _DEFAULT_PHASE_CACHE_POLICY = CachePolicy(cache_system=True, cache_tools=True)
 
 _PHASE_CACHE_POLICY: dict[str, CachePolicy] = {
-    PHASE_REVIEW: CachePolicy(cache_system=True, cache_tools=True),
+    # Review: every spec's user message opens with the same intro and
+    # <project_context> block, which can run to tens of thousands of tokens
+    # once research and drawing digests are spliced in, so it gets its own
+    # breakpoint behind the system/tool prefix (3 of the API's 4).
+    PHASE_REVIEW: CachePolicy(cache_system=True, cache_tools=True, cache_user_prefix=True),
     PHASE_CROSS_CHECK: CachePolicy(cache_system=True, cache_tools=True),
     PHASE_VERIFICATION: CachePolicy(cache_system=True, cache_tools=True),
     PHASE_VERIFICATION_RETRY: CachePolicy(cache_system=True, cache_tools=True),
@@ -1009,6 +1116,31 @@ def system_prompt_with_cache(prompt: str, *, phase: str | None = None):
     ]
 
 
+def user_content_with_cache(
+    prefix: str, rest: str, *, spec_count: int, phase: str | None = None
+):
+    """Return user-message content with a breakpoint after ``prefix``.
+
+    ``prefix`` is the part of the message shared by every request in the
+    run; ``rest`` is the per-request remainder. When the phase policy
+    permits and ``spec_count`` requests share the head, the content is two
+    text blocks with ``cache_control`` on the first, so later requests read
+    the shared head from cache. Otherwise (an empty prefix, or a single
+    request that would only pay the cache-write premium) it is the plain
+    joined string.
+    """
+    if (
+        not prefix
+        or spec_count < 2
+        or not cache_policy_for(phase).cache_user_prefix
+    ):
+        return prefix + rest
+    return [
+        {"type": "text", "text": prefix, "cache_control": _cache_control_block()},
+        {"type": "text", "text": rest},
+    ]
+
+
 def tools_with_cache(tools: list[dict], *, phase: str | None = None) -> list[dict]:
     """Attach a cache breakpoint to the last tool definition.
 
@@ -1060,6 +1192,25 @@ def token_count_preflight_enabled() -> bool:
     return True
 
 
+# ---------------------------------------------------------------------------
+# Identical-spec collapse
+# ---------------------------------------------------------------------------
+
+ENV_SKIP_DUPLICATE_SPECS = "SPEC_CRITIC_SKIP_DUPLICATE_SPECS"
+
+
+def skip_duplicate_specs_enabled() -> bool:
+    """Whether specs whose extracted text is identical are reviewed once.
+
+    Enabled by default: a second copy of the same text (a renamed or
+    re-saved duplicate in the selection) would be billed for a byte-
+    identical review. Set ``SPEC_CRITIC_SKIP_DUPLICATE_SPECS=0`` to review
+    every selected file regardless.
+    """
+    raw = (os.environ.get(ENV_SKIP_DUPLICATE_SPECS) or "").strip().lower()
+    return raw not in _DISABLE_TOKENS
+
+
 # ---------------------------------------------------------------------------
 # Web-search tool configuration
 # ---------------------------------------------------------------------------
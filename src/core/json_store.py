@@ -0,0 +1,72 @@
+"""Shared helpers for the app's on-disk JSON files.
+
+The caches, the pending-batch manifest and the report sidecars all write
+JSON the same way, and the disk caches all bound their directories the
+same way; both live here so the rules are stated once.
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def write_json_bytes(path: Path, data: Any, *, ensure_ascii: bool = True) -> None:
+    """Atomically write ``data`` to ``path`` as compact UTF-8 JSON.
+
+    The document is encoded with one ``json.dumps`` call and written as
+    bytes. Both ``json.dump`` to a file handle and any ``indent`` route
+    through the pure-Python chunked encoder instead of the C one, so these
+    machine-read files are written compact. The bytes go to a temp file in
+    the target directory that is renamed over ``path``, so a crash
+    mid-write never leaves a truncated file. The parent directory is
+    created on demand; ``OSError`` propagates to the caller.
+    """
+    text = json.dumps(data, ensure_ascii=ensure_ascii, separators=(",", ":"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{path.stem}.", suffix=".tmp", dir=str(path.parent)
+    )
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(text.encode("utf-8"))
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def prune_lru_dir(root: Path, max_bytes: int, *, suffix: str = ".json") -> None:
+    """Delete the least-recently-used ``*suffix`` files until under ``max_bytes``.
+
+    Recency is the file mtime, which cache readers refresh on every hit.
+    Best-effort: I/O errors leave the directory as it is.
+    """
+    try:
+        entries = []
+        total = 0
+        with os.scandir(root) as it:
+            for entry in it:
+                if not entry.name.endswith(suffix):
+                    continue
+                st = entry.stat()
+                entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                total += st.st_size
+        if total <= max_bytes:
+            return
+        entries.sort()
+        for _mtime, size, entry_path in entries:
+            if total <= max_bytes:
+                break
+            try:
+                os.unlink(entry_path)
+                total -= size
+            except OSError:
+                pass
+    except OSError:
+        return
@@ -23,12 +23,11 @@ because the cross-checker sends ALL spec content in a single call.
 """
 from __future__ import annotations
 
+import functools
 import logging
 import math
 from typing import Any, Optional
 
-import tiktoken
-
 _log = logging.getLogger(__name__)
 
 
@@ -169,8 +168,18 @@ def exceeds_per_call_limit_for_model(
     return padded > RECOMMENDED_MAX
 
 
+@functools.lru_cache(maxsize=1)
 def get_encoder():
-    """Get the tokenizer used for approximate token estimates."""
+    """Get the tokenizer used for approximate token estimates.
+
+    Memoized: ``count_tokens`` runs on every gauge refresh and preflight
+    pass, and ``tiktoken.get_encoding`` takes a registry lock per lookup.
+    ``tiktoken`` itself is imported here rather than at module load: the
+    GUI and the pipeline import this module for its limits and helpers at
+    startup, long before anything is counted.
+    """
+    import tiktoken
+
     return tiktoken.get_encoding("cl100k_base")
 
 
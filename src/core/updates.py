@@ -50,7 +50,6 @@ import os
 import re
 import subprocess
 import sys
-import urllib.request
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -295,6 +294,10 @@ def fetch_manifest(url: str, *, timeout: float = DEFAULT_MANIFEST_TIMEOUT) -> di
         # on the installer URL) so a SPEC_CRITIC_UPDATE_URL override can never
         # downgrade the manifest fetch to http.
         raise UpdateError("refusing to fetch the update manifest over a non-https URL")
+    # Imported here: urllib.request drags in http.client and the email
+    # package, and nothing needs them until the first update check.
+    import urllib.request
+
     request = urllib.request.Request(
         url, headers={"User-Agent": _USER_AGENT, "Accept": "application/json"}
     )
@@ -401,6 +404,8 @@ def _installer_filename(url: str) -> str:
 
 
 def _open_url(url: str, *, timeout: float):
+    import urllib.request
+
     request = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
     resp = urllib.request.urlopen(request, timeout=timeout)  # noqa: S310 - https enforced by caller
     # Same redirect-downgrade guard as fetch_manifest. The sha256 check would
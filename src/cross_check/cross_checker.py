@@ -18,9 +18,9 @@ from ..review.prompt_serialization import (
     TAG_PRIOR_FINDING,
     TAG_PROJECT_CONTEXT,
     TAG_SPEC,
+    document_block_parts,
     element_ids_enabled,
     escape_attr,
-    render_blocks,
     render_spec_with_ids,
     wrap_data_block,
     wrap_document_block,
@@ -87,12 +87,15 @@ def _sanitize_narrative(text: str) -> str:
 def render_corpus_block(specs: list[ExtractedSpec]) -> str:
     """Render the ``<corpus>`` block over a list of extracted specs.
 
-    Each spec is serialized through :func:`wrap_document_block` so
-    a literal ``</spec>`` (or any other reserved character) inside a spec
-    body cannot close the wrapper. Filename and finding-attribute values
+    Each spec is serialized through :func:`document_block_parts` (the
+    pieces of :func:`wrap_document_block`) so a literal ``</spec>`` (or
+    any other reserved character) inside a spec body cannot close the
+    wrapper. Filename and finding-attribute values
     flow through :func:`escape_attr` so attribute-breaking characters
-    cannot truncate the opening tag either. ``render_blocks`` joins the
-    pieces with newlines, dropping empties.
+    cannot truncate the opening tag either. Every piece lands in one flat
+    fragment list joined once with newlines (empties dropped), so the
+    corpus text — often the largest string in a run — is copied a single
+    time rather than once per wrapped spec and again per enclosing join.
 
     When element ids are enabled and the spec has a paragraph
     map, the body is rendered with one id-tagged element per paragraph /
@@ -104,22 +107,25 @@ def render_corpus_block(specs: list[ExtractedSpec]) -> str:
     this same helper so the two passes cannot drift on spec serialization.
     """
     use_ids = element_ids_enabled()
-    spec_blocks: list[str] = []
+    parts: list[str] = [f"<{TAG_CORPUS}>"]
     for spec in specs:
         if use_ids and spec.paragraph_map:
-            spec_blocks.append(
-                render_spec_with_ids(
-                    spec.content, spec.paragraph_map, filename=spec.filename,
-                )
+            block = render_spec_with_ids(
+                spec.content, spec.paragraph_map, filename=spec.filename,
             )
+            if block:
+                parts.append(block)
         else:
-            spec_blocks.append(
-                wrap_document_block(
+            parts.extend(
+                document_block_parts(
                     TAG_SPEC, spec.content, attrs={"filename": spec.filename},
                 )
             )
-    corpus_inner = render_blocks(spec_blocks)
-    return f"<{TAG_CORPUS}>\n{corpus_inner}\n</{TAG_CORPUS}>"
+    if len(parts) == 1:
+        # Historical empty-corpus shape: an empty line between the tags.
+        parts.append("")
+    parts.append(f"</{TAG_CORPUS}>")
+    return "\n".join(parts)
 
 
 def render_already_identified_block(existing_findings: list[Finding]) -> str:
@@ -225,13 +231,19 @@ def _get_cross_check_user_message(spec_input: str, file_count: int, project_cont
     return f"Review the following {file_count} specs for cross-spec coordination only.\n{ctx}\n{spec_input}"
 
 
-def run_cross_check(specs: list[ExtractedSpec], existing_findings: list[Finding], *, project_context: str = "", max_retries: int = 3, verbose: bool = False, stream_callback: StreamCallback | None = None, cycle: CodeCycle = DEFAULT_CYCLE, model: str = CROSS_CHECK_MODEL_DEFAULT, _trace_parent=None) -> ReviewResult:
+def run_cross_check(specs: list[ExtractedSpec], existing_findings: list[Finding], *, project_context: str = "", max_retries: int = 3, verbose: bool = False, stream_callback: StreamCallback | None = None, cycle: CodeCycle = DEFAULT_CYCLE, model: str = CROSS_CHECK_MODEL_DEFAULT, _trace_parent=None, _prepared_input: tuple[str, int] | None = None) -> ReviewResult:
     """Single-pass cross-check.
 
     ``_trace_parent``: when set (by ``run_chunked_cross_check``), the
     function does NOT open its own ``cross_check`` span — it emits its
     api_call under the caller's chunk span instead. When ``None`` (direct
     callers, tests), opens a fresh ``cross_check`` span.
+
+    ``_prepared_input``: ``(user_message, total_input_tokens)`` already
+    built and counted by ``run_chunked_cross_check`` for the same specs,
+    findings, context and cycle. The combined corpus is the largest string
+    in a run, so reusing it skips a second render and a second tokenizer
+    pass over it. ``None`` builds and counts here.
     """
     # Tracing: open the outer cross_check span only when not nested under
     # a chunk span. The "skipped — fewer than 2 specs" early return still
@@ -246,8 +258,11 @@ def run_cross_check(specs: list[ExtractedSpec], existing_findings: list[Finding]
         return result
 
     system_prompt = _cross_system_prompt(cycle)
-    user_message = _get_cross_check_user_message(_build_cross_check_input(specs, existing_findings), len(specs), project_context=project_context)
-    total_input_tokens = count_tokens(system_prompt) + count_tokens(user_message)
+    if _prepared_input is not None:
+        user_message, total_input_tokens = _prepared_input
+    else:
+        user_message = _get_cross_check_user_message(_build_cross_check_input(specs, existing_findings), len(specs), project_context=project_context)
+        total_input_tokens = count_tokens(system_prompt) + count_tokens(user_message)
     if total_input_tokens > CROSS_CHECK_RECOMMENDED_MAX:
         result = ReviewResult(findings=[], thinking=f"Combined input ({total_input_tokens:,}) exceeds cross-check limit ({CROSS_CHECK_RECOMMENDED_MAX:,}).", model=model, cross_check_status="skipped")
         _trace.capture_cross_check_end(own_cross_check_span, finding_count=0, status="skipped")
@@ -657,6 +672,7 @@ def run_chunked_cross_check(
             specs, existing_findings,
             project_context=project_context, max_retries=max_retries,
             verbose=verbose, stream_callback=stream_callback, cycle=cycle, model=model,
+            _prepared_input=(full_user, total_tokens),
         )
 
     groups = module_for_cycle(cycle).cross_check_chunk_groups
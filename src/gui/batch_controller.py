@@ -63,7 +63,11 @@ from ..orchestration.pipeline import (
     _persist_verification_cache,
 )
 from ..review.reviewer import REVIEW_MODEL_DEFAULT
-from .review_run_controller import _maybe_start_recorder, _stop_recorder
+from .review_run_controller import (
+    _cancel_pending_reset,
+    _maybe_start_recorder,
+    _stop_recorder,
+)
 
 _BATCH_TIMING_COPY = "Usually 45 min to 2 hrs, 24 hrs maximum (Extremely Rare)"
 
@@ -1282,6 +1286,7 @@ def _begin_reconnect_run(
     if input_dir:
         app.input_dir = input_dir
 
+    _cancel_pending_reset(app)
     app.is_processing = True
     if hasattr(app, "module_selector"):
         app.module_selector.configure(state="disabled")
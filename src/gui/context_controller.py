@@ -24,16 +24,6 @@ from tkinter import filedialog, messagebox
 import customtkinter as ctk
 
 from ..input.extractor import CONTEXT_ATTACHMENT_EXTENSIONS, extract_context_text
-from ..input.drawing_digest import (
-    DrawingDigestError,
-    DRAWING_DIGEST_MODEL_DEFAULT,
-    build_digest_chunks,
-    format_digest_confirm_message,
-    preflight_digest_cost,
-    run_drawing_digest,
-    validate_drawing_files,
-    wrapped_digest_block,
-)
 from ..core.tokenizer import count_tokens, PROJECT_CONTEXT_MAX_TOKENS
 from .context_attachment import (
     context_has_drawing_digest,
@@ -43,6 +33,7 @@ from .context_attachment import (
     merge_into_context,
     wrap_attachment,
 )
+from .ui_queue import post_to_ui
 from .widgets import COLORS
 
 _CONTEXT_PLACEHOLDER = "Describe your project (optional)"
@@ -242,7 +233,7 @@ def attach_drawing_files(app) -> None:
     background ``count_tokens`` preflight feeding a cost-confirm dialog,
     and only then the digest call itself on a second background thread.
     All tkinter mutation is marshaled back to the main thread via
-    ``app.after(0, ...)``; a running flag + button disable prevents
+    ``post_to_ui(app, ...)``; a running flag + button disable prevents
     concurrent digests. A review started mid-digest is safe — the review
     snapshots Project Context at submit time.
     """
@@ -271,6 +262,19 @@ def attach_drawing_files(app) -> None:
         return
     paths = [Path(f) for f in files]
 
+    # Function-local: the digest pipeline pulls in the Anthropic SDK (via the
+    # retry taxonomy), which the window should not pay for at startup.
+    from ..input.drawing_digest import (
+        DrawingDigestError,
+        DRAWING_DIGEST_MODEL_DEFAULT,
+        build_digest_chunks,
+        format_digest_confirm_message,
+        preflight_digest_cost,
+        run_drawing_digest,
+        validate_drawing_files,
+        wrapped_digest_block,
+    )
+
     try:
         app.configure(cursor="watch")
         app.update_idletasks()
@@ -304,7 +308,7 @@ def attach_drawing_files(app) -> None:
 
     def _log(msg: str, level: str = "info", **_kwargs) -> None:
         if hasattr(app, "log"):
-            app.after(0, lambda m=msg, l=level: app.log.log(m, level=l))
+            post_to_ui(app, lambda m=msg, l=level: app.log.log(m, level=l))
 
     def _reset() -> None:
         app._drawing_digest_running = False
@@ -321,9 +325,9 @@ def attach_drawing_files(app) -> None:
             # Bind via default arg: Python clears ``exc`` when the except
             # block exits, so a plain closure would NameError when the Tk
             # callback fires later — and the reset/error path would never run.
-            app.after(0, lambda e=exc: _on_preflight_failed(e))
+            post_to_ui(app, lambda e=exc: _on_preflight_failed(e))
             return
-        app.after(0, lambda: _on_preflight_done(preflight))
+        post_to_ui(app, lambda: _on_preflight_done(preflight))
 
     def _on_preflight_failed(exc: Exception) -> None:
         _reset()
@@ -371,15 +375,15 @@ def attach_drawing_files(app) -> None:
             )
         except DrawingDigestError as exc:
             # Default-arg binding, same reason as the preflight worker.
-            app.after(0, lambda msg=str(exc): _on_digest_failed(msg))
+            post_to_ui(app, lambda msg=str(exc): _on_digest_failed(msg))
             return
         except Exception as exc:  # noqa: BLE001 — surfaced to the operator
-            app.after(
-                0,
+            post_to_ui(
+                app,
                 lambda msg=f"{type(exc).__name__}: {exc}": _on_digest_failed(msg),
             )
             return
-        app.after(0, lambda: _on_digest_done(result))
+        post_to_ui(app, lambda: _on_digest_done(result))
 
     def _on_digest_failed(error: str) -> None:
         _reset()
@@ -7,6 +7,8 @@ routing widget updates through ``app.after`` via the existing
 """
 from __future__ import annotations
 
+import threading
+
 from .widgets import DiagnosticsWindow
 
 _UI_LEVEL_MAP = {
@@ -40,12 +42,29 @@ def make_diag_log(app, phase: str, run_epoch: int):
 
 
 def make_diag_progress(app, phase: str, run_epoch: int):
-    """Return a progress callback that writes to both UI and diagnostics."""
+    """Return a progress callback that writes to both UI and diagnostics.
+
+    Every step message is logged, but progress-bar updates are coalesced:
+    while one bar update is still queued for the UI thread, later calls just
+    replace its value, so a burst of progress from the worker pool costs one
+    redraw at the latest percentage instead of one per call.
+    """
     default_phase = phase
+    lock = threading.Lock()
+    pending: list[float] = []
+
+    def _apply_bar():
+        with lock:
+            pct = pending.pop()
+        app.progress_bar.set(max(0.0, min(pct / 100.0, 1.0)))
 
     def _on_progress(pct, msg, *, phase: str | None = None, **_extra):
         app._dispatch_if_current(run_epoch, lambda m=msg: app.log.log_step(m))
-        app._dispatch_if_current(run_epoch, lambda p=pct: app.progress_bar.set(max(0.0, min(p / 100.0, 1.0))))
+        with lock:
+            already_queued = bool(pending)
+            pending[:] = [pct]
+        if not already_queued:
+            app._dispatch_if_current(run_epoch, _apply_bar)
         if app._diagnostics_report:
             app._diagnostics_report.log(phase or default_phase, "step", msg, {"progress_pct": round(pct, 1)})
 
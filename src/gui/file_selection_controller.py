@@ -26,10 +26,11 @@ collision; it stays a silent no-op.
 """
 from __future__ import annotations
 
+import os
 import shlex
 from pathlib import Path
 
-from ..input.extractor import SUPPORTED_EXTENSIONS
+from ..input.extractor import is_spec_filename
 
 _SPEC_FILETYPES = [
     ("Word Specifications", "*.docx"),
@@ -38,7 +39,7 @@ _SPEC_FILETYPES = [
 
 
 def is_supported_spec(filepath: Path) -> bool:
-    return filepath.suffix.lower() in SUPPORTED_EXTENSIONS
+    return is_spec_filename(filepath.name)
 
 
 def parse_dropped_paths(tk_root, payload: str) -> list[Path]:
@@ -140,6 +141,73 @@ def filter_name_collisions(
     return accepted, rejected
 
 
+def snapshot_spec_dirs(
+    paths: list[Path],
+    snapshot: dict[str, tuple[int, frozenset[str]]] | None = None,
+    *,
+    selected: list[Path] | None = None,
+) -> dict[str, tuple[int, frozenset[str]]]:
+    """Record ``(st_mtime_ns, listed names)`` for each parent folder of ``paths``.
+
+    Taken when a selection is applied. ``find_missing_specs`` compares
+    against it so the Run click stats one directory per folder instead of
+    every selected file. The folder is listed as well as stamped: a dropped
+    or typed path is only filtered by name, so the snapshot vouches for a
+    file only if the listing actually contained it.
+
+    When extending a selection, pass its ``snapshot`` and the already
+    ``selected`` files: their folders keep the original entry (or stay
+    unsnapshotted) rather than being re-stamped now, which would vouch for
+    a file deleted since it was selected.
+    """
+    snapshot = dict(snapshot or {})
+    vouched = {str(p.parent) for p in selected or ()}
+    for p in paths:
+        parent = str(p.parent)
+        if parent in snapshot or parent in vouched:
+            continue
+        try:
+            # Stamp before listing: a change in between moves the mtime, so
+            # the entry can only under-vouch, never over-vouch.
+            mtime = os.stat(parent).st_mtime_ns
+            with os.scandir(parent) as it:
+                names = frozenset(entry.name for entry in it)
+        except OSError:
+            continue
+        snapshot[parent] = (mtime, names)
+    return snapshot
+
+
+def find_missing_specs(
+    paths: list[Path], snapshot: dict[str, tuple[int, frozenset[str]]] | None
+) -> list[Path]:
+    """Return the selected files that no longer exist, in selection order.
+
+    A delete or rename inside a folder bumps that folder's mtime, so a file
+    listed in the snapshot of a folder whose mtime still matches is
+    known-present and skipped. Everything else — changed or unsnapshotted
+    folders, names the listing never contained — falls back to a per-file
+    ``exists()`` check.
+    """
+    snapshot = snapshot or {}
+    unchanged: dict[str, frozenset[str]] = {}
+    missing: list[Path] = []
+    for p in paths:
+        parent = str(p.parent)
+        if parent not in unchanged:
+            entry = snapshot.get(parent)
+            try:
+                current = os.stat(parent).st_mtime_ns
+            except OSError:
+                current = None
+            unchanged[parent] = (
+                entry[1] if entry is not None and entry[0] == current else frozenset()
+            )
+        if p.name not in unchanged[parent] and not p.exists():
+            missing.append(p)
+    return missing
+
+
 def browse_for_specs(parent) -> list[Path]:
     """Open a file picker. Returns selected paths (possibly empty)."""
     # Imported lazily so the module (and its pure path-merge helpers) stays
@@ -188,6 +256,11 @@ def apply_selected_specs(app, candidate_paths: list[Path]) -> None:
     if existing:
         app.log.log_step(f"Added {added} file(s) — {len(merged)} total")
     app._selected_files = merged
+    app._selected_dir_snapshot = snapshot_spec_dirs(
+        merged[len(existing):],
+        getattr(app, "_selected_dir_snapshot", None),
+        selected=existing,
+    )
     app.input_dir = merged[0].parent
     app.input_dir_entry.delete(0, "end")
     app.input_dir_entry.insert(
@@ -228,6 +301,7 @@ def clear_selection(app) -> None:
         app._exact_token_refresh_timer_id = None
     had_files = bool(getattr(app, "_selected_files", None))
     app._selected_files = []
+    app._selected_dir_snapshot = {}
     app.input_dir = None
     app.input_dir_entry.delete(0, "end")
     clear_file_state(app)
@@ -13,10 +13,12 @@ delegates all workflow concerns to focused controller modules:
 - ``report_controller`` — report export and the report window
 - ``diagnostics_controller`` — diagnostics callbacks and window
 """
+from __future__ import annotations
+
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import customtkinter as ctk
 
@@ -36,11 +38,14 @@ base_path = os.path.dirname(os.path.abspath(__file__))
 exe_dir = Path(base_path).parent
 sys.path.insert(0, str(exe_dir))
 
-# Type annotations on method signatures
-from src.batch.batch import BatchStatus
-from src.orchestration.diagnostics import DiagnosticsReport
-from src.input.extractor import ExtractedSpec
-from src.orchestration.pipeline import BatchSubmission
+# Type annotations on method signatures only. Kept out of the runtime import
+# graph: these modules pull in the Anthropic SDK / python-docx, and nothing
+# here needs them before the window is on screen.
+if TYPE_CHECKING:
+    from src.batch.batch import BatchStatus
+    from src.orchestration.diagnostics import DiagnosticsReport
+    from src.input.extractor import ExtractedSpec
+    from src.orchestration.pipeline import BatchSubmission
 
 # Constants used by widgets
 from src.core.api_config import (
@@ -82,6 +87,7 @@ from src.gui.widgets import (
     EnhancedLog,
     FileListPanel,
     TokenGauge,
+    cached_font,
 )
 
 # Persistence helpers (also re-exported for backward compatibility with
@@ -96,16 +102,6 @@ from src.gui.about_usage_dialogs import (
     show_trust_dialog,
     show_usage_dialog,
 )
-from src.gui.batch_controller import (
-    collect_batch_results,
-    offer_batch_resume,
-    on_batch_submitted,
-    poll_and_collect_thread,
-    poll_batch,
-    recover_batch_dialog,
-    submit_batch_thread,
-    update_poll_progress,
-)
 from src.gui.context_controller import (
     attach_context_files,
     attach_drawing_files,
@@ -133,7 +129,6 @@ from src.gui.file_selection_controller import (
     parse_dropped_paths,
     set_file_data,
 )
-from src.gui.report_controller import export_html_report_to_file, export_report_to_file
 from src.gui.realtime_cost_gate import (
     REALTIME_WORKER_TRADEOFF_TEXT,
     should_warn_before_live_run,
@@ -151,6 +146,7 @@ from src.gui.token_analysis_controller import (
     analyze_tokens,
     on_file_selection_change,
     refresh_exact_token_count,
+    shutdown_analysis_pool,
 )
 from src.gui.update_controller import (
     build_footer,
@@ -162,6 +158,34 @@ from src.gui.update_controller import (
     show_update_dialog,
     start_update_check,
 )
+from src.gui.ui_queue import start_ui_queue, stop_ui_queue
+
+
+def _batch_controller():
+    """Import the batch controller on first use.
+
+    It pulls in the whole review pipeline (Anthropic SDK, python-docx,
+    tokenizer) at module scope. Nothing needs it until the first submit /
+    resume prompt, which always happens after the window is on screen, so
+    deferring it keeps that import cost off the cold start.
+    """
+    from src.gui import batch_controller
+
+    return batch_controller
+
+
+def _report_controller():
+    """Import the report controller on first use.
+
+    The DOCX / HTML exporters pull in python-docx, lxml and (through the
+    research renderers) the Anthropic SDK. Exports only happen after a run
+    completes, so the import stays off the cold start like the batch
+    controller's.
+    """
+    from src.gui import report_controller
+
+    return report_controller
+
 
 _CONTEXT_PLACEHOLDER = "Describe your project (optional)"
 
@@ -203,6 +227,10 @@ class SpecReviewApp(_CTkDnDRoot):
         ek = os.environ.get("ANTHROPIC_API_KEY", "")
         self.api_key = fk if fk else ek
         self._selected_files: list[Path] = []
+        # Parent-folder mtimes and listings captured when the selection was
+        # applied; lets validate_inputs skip per-file existence checks on
+        # unchanged folders.
+        self._selected_dir_snapshot: dict[str, tuple[int, frozenset[str]]] = {}
         self._loaded_file_data: list[dict] = []
         self._system_prompt_tokens: int = 0
         self._selected_files_for_review: list[Path] = []
@@ -242,6 +270,10 @@ class SpecReviewApp(_CTkDnDRoot):
         # the network fetch/download always runs off the UI thread. See
         # core/updates.py and docs/RELEASE_WINDOWS.md.
         init_update_state(self)
+        # Worker threads marshal UI work through one queue drained by a
+        # single repeating after-poll (see gui/ui_queue.py) rather than a
+        # separate after(0, ...) per event.
+        start_ui_queue(self)
         self._create_ui()
         # The silent once/day update check is scheduled by main()'s startup
         # sequence AFTER the batch-resume prompt resolves — a timer stagger
@@ -250,6 +282,11 @@ class SpecReviewApp(_CTkDnDRoot):
         # loop. The footer's "Check for Updates" button runs the same path
         # on demand with visible results.
 
+    def destroy(self):
+        stop_ui_queue(self)
+        shutdown_analysis_pool()
+        super().destroy()
+
     def _create_ui(self):
         c = ctk.CTkFrame(self, fg_color="transparent")
         c.pack(fill="both", expand=True, padx=24, pady=24)
@@ -265,7 +302,7 @@ class SpecReviewApp(_CTkDnDRoot):
         self.save_html_btn = ctk.CTkButton(
             self.check_update_btn.master, text="Save HTML Report…",
             width=150, height=28,
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=cached_font(family="Segoe UI", size=12),
             fg_color=COLORS["bg_input"], hover_color=COLORS["border"],
             border_width=1, border_color=COLORS["border"],
             text_color=COLORS["text_secondary"],
@@ -279,43 +316,43 @@ class SpecReviewApp(_CTkDnDRoot):
         self.hdr.pack(fill="x", pady=(0, 8))
         hdr_title_row = ctk.CTkFrame(self.hdr, fg_color="transparent")
         hdr_title_row.pack(fill="x")
-        ctk.CTkLabel(hdr_title_row, text="Spec Critic", font=ctk.CTkFont(family="Segoe UI", size=28, weight="bold"), text_color=COLORS["text_primary"]).pack(side="left")
+        ctk.CTkLabel(hdr_title_row, text="Spec Critic", font=cached_font(family="Segoe UI", size=28, weight="bold"), text_color=COLORS["text_primary"]).pack(side="left")
         ctk.CTkButton(
             hdr_title_row, text="How It Works", width=110, height=30,
-            font=ctk.CTkFont(family="Segoe UI", size=11),
+            font=cached_font(family="Segoe UI", size=11),
             fg_color=COLORS["bg_card"], hover_color=COLORS["border"],
             border_width=1, border_color=COLORS["border"],
             text_color=COLORS["text_secondary"], command=self._show_about_dialog,
         ).pack(side="right", pady=(4, 0))
         ctk.CTkButton(
             hdr_title_row, text="How to Use", width=100, height=30,
-            font=ctk.CTkFont(family="Segoe UI", size=11),
+            font=cached_font(family="Segoe UI", size=11),
             fg_color=COLORS["bg_card"], hover_color=COLORS["border"],
             border_width=1, border_color=COLORS["border"],
             text_color=COLORS["text_secondary"], command=self._show_usage_dialog,
         ).pack(side="right", padx=(0, 8), pady=(4, 0))
         ctk.CTkButton(
             hdr_title_row, text="Why Trust It?", width=110, height=30,
-            font=ctk.CTkFont(family="Segoe UI", size=11),
+            font=cached_font(family="Segoe UI", size=11),
             fg_color=COLORS["bg_card"], hover_color=COLORS["border"],
             border_width=1, border_color=COLORS["border"],
             text_color=COLORS["text_secondary"], command=self._show_trust_dialog,
         ).pack(side="right", padx=(0, 8), pady=(4, 0))
         ctk.CTkButton(
             hdr_title_row, text="About", width=80, height=30,
-            font=ctk.CTkFont(family="Segoe UI", size=11),
+            font=cached_font(family="Segoe UI", size=11),
             fg_color=COLORS["bg_card"], hover_color=COLORS["border"],
             border_width=1, border_color=COLORS["border"],
             text_color=COLORS["text_secondary"], command=self._show_license_dialog,
         ).pack(side="right", padx=(0, 8), pady=(4, 0))
-        self._header_subtitle = ctk.CTkLabel(self.hdr, text=self._module_subtitle(), font=ctk.CTkFont(family="Segoe UI", size=13), text_color=COLORS["text_secondary"])
+        self._header_subtitle = ctk.CTkLabel(self.hdr, text=self._module_subtitle(), font=cached_font(family="Segoe UI", size=13), text_color=COLORS["text_secondary"])
         self._header_subtitle.pack(anchor="w", pady=(4, 0))
 
         # Program selector: one user-facing choice may route specifications
         # among multiple independently versioned review modules.
         module_row = ctk.CTkFrame(self.hdr, fg_color="transparent")
         module_row.pack(fill="x", pady=(6, 0))
-        ctk.CTkLabel(module_row, text="Review program", font=ctk.CTkFont(family="Segoe UI", size=12), text_color=COLORS["text_secondary"]).pack(side="left", padx=(0, 10))
+        ctk.CTkLabel(module_row, text="Review program", font=cached_font(family="Segoe UI", size=12), text_color=COLORS["text_secondary"]).pack(side="left", padx=(0, 10))
         self._module_names_by_display = {
             p.display_name: p.program_id for p in AVAILABLE_PROGRAMS.values()
         }
@@ -327,7 +364,7 @@ class SpecReviewApp(_CTkDnDRoot):
             values=list(self._module_names_by_display.keys()),
             variable=self._module_selector_var,
             command=self._on_module_selected,
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=cached_font(family="Segoe UI", size=12),
             fg_color=COLORS["bg_input"], button_color=COLORS["border"],
             button_hover_color=COLORS["accent"], text_color=COLORS["text_primary"],
             height=30,
@@ -337,14 +374,14 @@ class SpecReviewApp(_CTkDnDRoot):
         # --- Accessibility row: sits between header and inputs card ---
         accessibility_bar = ctk.CTkFrame(c, fg_color="transparent")
         accessibility_bar.pack(fill="x", pady=(8, 12))
-        ctk.CTkLabel(accessibility_bar, text="Accessibility", font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_secondary"]).pack(side="left", padx=(0, 12))
+        ctk.CTkLabel(accessibility_bar, text="Accessibility", font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_secondary"]).pack(side="left", padx=(0, 12))
         self._font_scale_var = ctk.StringVar(value=self._font_scale_label)
         self.font_size_selector = ctk.CTkSegmentedButton(
             accessibility_bar,
             values=list(_FONT_SCALE_OPTIONS.keys()),
             variable=self._font_scale_var,
             command=self._on_font_scale_change,
-            font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE),
+            font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE),
             selected_color=COLORS["accent"], selected_hover_color=COLORS["accent_hover"],
             unselected_color=COLORS["bg_input"], unselected_hover_color=COLORS["border"],
             fg_color=COLORS["bg_input"], text_color=COLORS["text_primary"],
@@ -365,7 +402,7 @@ class SpecReviewApp(_CTkDnDRoot):
         self.log.pack(fill="both", expand=True, pady=(16, 0))
         self.diagnostics_button = ctk.CTkButton(
             c, text="Diagnostics", height=32,
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=cached_font(family="Segoe UI", size=12),
             fg_color=COLORS["bg_input"], hover_color=COLORS["border"],
             border_width=1, border_color=COLORS["border"],
             text_color=COLORS["text_secondary"],
@@ -374,7 +411,7 @@ class SpecReviewApp(_CTkDnDRoot):
         self.diagnostics_button.pack(fill="x", pady=(8, 0))
         self.recover_button = ctk.CTkButton(
             c, text="Recover batch…", height=32,
-            font=ctk.CTkFont(family="Segoe UI", size=12),
+            font=cached_font(family="Segoe UI", size=12),
             fg_color=COLORS["bg_input"], hover_color=COLORS["border"],
             border_width=1, border_color=COLORS["border"],
             text_color=COLORS["text_secondary"],
@@ -389,29 +426,29 @@ class SpecReviewApp(_CTkDnDRoot):
         header = ctk.CTkFrame(self.inputs_card, fg_color="transparent", cursor="hand2")
         header.pack(fill="x", padx=16, pady=12)
         header.bind("<Button-1>", self._toggle_inputs_card)
-        self.inputs_expand_label = ctk.CTkLabel(header, text="\u25bc", font=ctk.CTkFont(family="Consolas", size=12), text_color=COLORS["text_muted"], width=20)
+        self.inputs_expand_label = ctk.CTkLabel(header, text="\u25bc", font=cached_font(family="Consolas", size=12), text_color=COLORS["text_muted"], width=20)
         self.inputs_expand_label.pack(side="left")
         self.inputs_expand_label.bind("<Button-1>", self._toggle_inputs_card)
-        lbl = ctk.CTkLabel(header, text="INPUTS", font=ctk.CTkFont(family="Segoe UI", size=11, weight="bold"), text_color=COLORS["text_muted"])
+        lbl = ctk.CTkLabel(header, text="INPUTS", font=cached_font(family="Segoe UI", size=11, weight="bold"), text_color=COLORS["text_muted"])
         lbl.pack(side="left", padx=(4, 0))
         lbl.bind("<Button-1>", self._toggle_inputs_card)
         self.inputs_content = ctk.CTkFrame(self.inputs_card, fg_color="transparent")
         self.inputs_content.pack(fill="x", padx=16, pady=(0, 16))
 
         # --- Row 0: API Key ---
-        ctk.CTkLabel(self.inputs_content, text="API Key", font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_secondary"], width=100, anchor="w").grid(row=0, column=0, sticky="w", pady=8)
-        self.api_key_entry = ctk.CTkEntry(self.inputs_content, placeholder_text="sk-ant-...", font=ctk.CTkFont(family="Consolas", size=_UI_FONT_SIZE), fg_color=COLORS["bg_input"], border_color=COLORS["border"], text_color=COLORS["text_primary"], height=36, show="\u2022")
+        ctk.CTkLabel(self.inputs_content, text="API Key", font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_secondary"], width=100, anchor="w").grid(row=0, column=0, sticky="w", pady=8)
+        self.api_key_entry = ctk.CTkEntry(self.inputs_content, placeholder_text="sk-ant-...", font=cached_font(family="Consolas", size=_UI_FONT_SIZE), fg_color=COLORS["bg_input"], border_color=COLORS["border"], text_color=COLORS["text_primary"], height=36, show="\u2022")
         self.api_key_entry.grid(row=0, column=1, sticky="ew", padx=(8, 0), pady=8)
         if self.api_key: self.api_key_entry.insert(0, self.api_key)
 
         # --- Row 1: Specs ---
-        ctk.CTkLabel(self.inputs_content, text="Specs", font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_secondary"], width=100, anchor="w").grid(row=1, column=0, sticky="w", pady=8)
+        ctk.CTkLabel(self.inputs_content, text="Specs", font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_secondary"], width=100, anchor="w").grid(row=1, column=0, sticky="w", pady=8)
         ef = ctk.CTkFrame(self.inputs_content, fg_color="transparent")
         ef.grid(row=1, column=1, sticky="ew", padx=(8, 0), pady=8)
         ef.columnconfigure(0, weight=1)
-        self.input_dir_entry = ctk.CTkEntry(ef, placeholder_text="Select or drop .docx specification files", font=ctk.CTkFont(family="Consolas", size=_UI_FONT_SIZE), fg_color=COLORS["bg_input"], border_color=COLORS["border"], text_color=COLORS["text_primary"], height=36)
+        self.input_dir_entry = ctk.CTkEntry(ef, placeholder_text="Select or drop .docx specification files", font=cached_font(family="Consolas", size=_UI_FONT_SIZE), fg_color=COLORS["bg_input"], border_color=COLORS["border"], text_color=COLORS["text_primary"], height=36)
         self.input_dir_entry.grid(row=0, column=0, sticky="ew")
-        bkw = {"height": 36, "font": ctk.CTkFont(size=_UI_FONT_SIZE), "fg_color": COLORS["bg_input"], "hover_color": COLORS["border"], "border_width": 1, "border_color": COLORS["border"], "text_color": COLORS["text_secondary"]}
+        bkw = {"height": 36, "font": cached_font(size=_UI_FONT_SIZE), "fg_color": COLORS["bg_input"], "hover_color": COLORS["border"], "border_width": 1, "border_color": COLORS["border"], "text_color": COLORS["text_secondary"]}
         ctk.CTkButton(ef, text="Browse", width=70, command=self._browse_files, **bkw).grid(row=0, column=1, padx=(8, 0))
         ctk.CTkButton(ef, text="Clear", width=60, command=self._clear_files, **bkw).grid(row=0, column=2, padx=(8, 0))
         self._register_specs_drop_target()
@@ -419,10 +456,10 @@ class SpecReviewApp(_CTkDnDRoot):
         # --- Row 2: Project Context ---
         ctx_label_frame = ctk.CTkFrame(self.inputs_content, fg_color="transparent")
         ctx_label_frame.grid(row=2, column=0, sticky="nw", pady=8)
-        ctk.CTkLabel(ctx_label_frame, text="Project Context", font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_secondary"], width=100, anchor="nw").pack(anchor="nw")
-        ctk.CTkButton(ctx_label_frame, text="Expand", width=80, height=24, font=ctk.CTkFont(size=11), fg_color=COLORS["bg_input"], hover_color=COLORS["border"], border_width=1, border_color=COLORS["border"], text_color=COLORS["text_secondary"], command=self._open_context_modal).pack(anchor="nw", pady=(4, 0))
-        ctk.CTkButton(ctx_label_frame, text="Attach Files…", width=80, height=24, font=ctk.CTkFont(size=11), fg_color=COLORS["bg_input"], hover_color=COLORS["border"], border_width=1, border_color=COLORS["border"], text_color=COLORS["text_secondary"], command=self._attach_context_files).pack(anchor="nw", pady=(4, 0))
-        self.attach_drawings_button = ctk.CTkButton(ctx_label_frame, text="Attach Drawings…", width=80, height=24, font=ctk.CTkFont(size=11), fg_color=COLORS["bg_input"], hover_color=COLORS["border"], border_width=1, border_color=COLORS["border"], text_color=COLORS["text_secondary"], command=self._attach_drawing_files)
+        ctk.CTkLabel(ctx_label_frame, text="Project Context", font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_secondary"], width=100, anchor="nw").pack(anchor="nw")
+        ctk.CTkButton(ctx_label_frame, text="Expand", width=80, height=24, font=cached_font(size=11), fg_color=COLORS["bg_input"], hover_color=COLORS["border"], border_width=1, border_color=COLORS["border"], text_color=COLORS["text_secondary"], command=self._open_context_modal).pack(anchor="nw", pady=(4, 0))
+        ctk.CTkButton(ctx_label_frame, text="Attach Files…", width=80, height=24, font=cached_font(size=11), fg_color=COLORS["bg_input"], hover_color=COLORS["border"], border_width=1, border_color=COLORS["border"], text_color=COLORS["text_secondary"], command=self._attach_context_files).pack(anchor="nw", pady=(4, 0))
+        self.attach_drawings_button = ctk.CTkButton(ctx_label_frame, text="Attach Drawings…", width=80, height=24, font=cached_font(size=11), fg_color=COLORS["bg_input"], hover_color=COLORS["border"], border_width=1, border_color=COLORS["border"], text_color=COLORS["text_secondary"], command=self._attach_drawing_files)
         self.attach_drawings_button.pack(anchor="nw", pady=(4, 0))
         ctx_field_frame = ctk.CTkFrame(self.inputs_content, fg_color="transparent")
         ctx_field_frame.grid(row=2, column=1, sticky="ew", padx=(8, 0), pady=8)
@@ -430,7 +467,7 @@ class SpecReviewApp(_CTkDnDRoot):
         self.context_textbox = ctk.CTkTextbox(
             ctx_field_frame, fg_color=COLORS["bg_input"], border_color=COLORS["border"],
             border_width=2, text_color=COLORS["text_primary"],
-            font=ctk.CTkFont(family="Consolas", size=_UI_FONT_SIZE), height=80, wrap="word",
+            font=cached_font(family="Consolas", size=_UI_FONT_SIZE), height=80, wrap="word",
         )
         self.context_textbox.grid(row=0, column=0, sticky="ew")
         self._context_has_placeholder = True
@@ -442,14 +479,14 @@ class SpecReviewApp(_CTkDnDRoot):
         self.context_token_label = ctk.CTkLabel(
             ctx_field_frame,
             text=f"0 / {PROJECT_CONTEXT_MAX_TOKENS:,} tokens",
-            font=ctk.CTkFont(family="Segoe UI", size=11),
+            font=cached_font(family="Segoe UI", size=11),
             text_color=COLORS["text_muted"],
             anchor="e",
         )
         self.context_token_label.grid(row=1, column=0, sticky="e", pady=(4, 0))
 
         # --- Row 3: Options ---
-        ctk.CTkLabel(self.inputs_content, text="Options", font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_secondary"], width=100, anchor="w").grid(row=3, column=0, sticky="w", pady=8)
+        ctk.CTkLabel(self.inputs_content, text="Options", font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_secondary"], width=100, anchor="w").grid(row=3, column=0, sticky="w", pady=8)
         options_frame = ctk.CTkFrame(self.inputs_content, fg_color="transparent")
         options_frame.grid(row=3, column=1, sticky="w", padx=(8, 0), pady=8)
         options_line1 = ctk.CTkFrame(options_frame, fg_color="transparent")
@@ -457,7 +494,7 @@ class SpecReviewApp(_CTkDnDRoot):
         self._cross_check_var = ctk.BooleanVar(value=False)
         self._cross_check_cb = ctk.CTkCheckBox(
             options_line1, text="Cross-spec coordination check", variable=self._cross_check_var,
-            font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE), fg_color=COLORS["accent"],
+            font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE), fg_color=COLORS["accent"],
             hover_color=COLORS["accent_hover"], border_color=COLORS["border"],
             checkmark_color=COLORS["text_primary"], text_color=COLORS["text_secondary"],
             checkbox_width=20, checkbox_height=20,
@@ -469,7 +506,7 @@ class SpecReviewApp(_CTkDnDRoot):
         _cc_label = _cc_price.label if _cc_price else CROSS_CHECK_MODEL_DEFAULT
         self._cross_check_hint = ctk.CTkLabel(options_line1,
             text=f"{_cc_label} \u2022 full content \u2022 finds inter-spec conflicts",
-            font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_muted"])
+            font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_muted"])
         self._cross_check_hint.pack(side="left", padx=(12, 0))
 
         # Review transport toggle (second options line). Batch is the
@@ -483,7 +520,7 @@ class SpecReviewApp(_CTkDnDRoot):
         self._realtime_cb = ctk.CTkCheckBox(
             options_line2, text="Real-time review (streaming)", variable=self._realtime_var,
             command=self._on_transport_toggle,
-            font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE), fg_color=COLORS["accent"],
+            font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE), fg_color=COLORS["accent"],
             hover_color=COLORS["accent_hover"], border_color=COLORS["border"],
             checkmark_color=COLORS["text_primary"], text_color=COLORS["text_secondary"],
             checkbox_width=20, checkbox_height=20,
@@ -491,7 +528,7 @@ class SpecReviewApp(_CTkDnDRoot):
         self._realtime_cb.pack(side="left")
         self._realtime_hint = ctk.CTkLabel(options_line2,
             text="results now \u2022 full API price (batch saves 50%) \u2022 no crash resume",
-            font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_muted"])
+            font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_muted"])
         self._realtime_hint.pack(side="left", padx=(12, 0))
 
         # Explicit real-time review concurrency. This is one GLOBAL pool across
@@ -503,7 +540,7 @@ class SpecReviewApp(_CTkDnDRoot):
         ctk.CTkLabel(
             options_line3,
             text="Concurrent live spec reviews",
-            font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE),
+            font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE),
             text_color=COLORS["text_secondary"],
         ).pack(side="left")
         self._realtime_workers_var = ctk.StringVar(
@@ -514,7 +551,7 @@ class SpecReviewApp(_CTkDnDRoot):
             values=[str(value) for value in REALTIME_REVIEW_WORKER_CHOICES],
             variable=self._realtime_workers_var,
             command=self._on_realtime_workers_selected,
-            font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE),
+            font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE),
             selected_color=COLORS["accent"],
             selected_hover_color=COLORS["accent_hover"],
             unselected_color=COLORS["bg_input"],
@@ -532,7 +569,7 @@ class SpecReviewApp(_CTkDnDRoot):
                 "Real-time only; Anthropic manages batch concurrency. "
                 + REALTIME_WORKER_TRADEOFF_TEXT
             ),
-            font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE),
+            font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE),
             text_color=COLORS["text_muted"],
             wraplength=580,
             justify="left",
@@ -549,7 +586,7 @@ class SpecReviewApp(_CTkDnDRoot):
         self._show_tracing_cb = ctk.CTkCheckBox(
             options_line4, text="Show agent tracing tools", variable=self._show_tracing_var,
             command=self._on_show_tracing_toggle,
-            font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE), fg_color=COLORS["accent"],
+            font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE), fg_color=COLORS["accent"],
             hover_color=COLORS["accent_hover"], border_color=COLORS["border"],
             checkmark_color=COLORS["text_primary"], text_color=COLORS["text_secondary"],
             checkbox_width=20, checkbox_height=20,
@@ -557,11 +594,11 @@ class SpecReviewApp(_CTkDnDRoot):
         self._show_tracing_cb.pack(side="left")
         self._show_tracing_hint = ctk.CTkLabel(options_line4,
             text="developer / diagnostics",
-            font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_muted"])
+            font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_muted"])
         self._show_tracing_hint.pack(side="left", padx=(12, 0))
 
         # --- Row 4: Agent tracing (hidden unless the reveal toggle is on) ---
-        self._tracing_label = ctk.CTkLabel(self.inputs_content, text="Tracing", font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_secondary"], width=100, anchor="w")
+        self._tracing_label = ctk.CTkLabel(self.inputs_content, text="Tracing", font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE), text_color=COLORS["text_secondary"], width=100, anchor="w")
         self._tracing_label.grid(row=4, column=0, sticky="w", pady=8)
         self._tracing_frame = ctk.CTkFrame(self.inputs_content, fg_color="transparent")
         self._tracing_frame.grid(row=4, column=1, sticky="w", padx=(8, 0), pady=8)
@@ -570,7 +607,7 @@ class SpecReviewApp(_CTkDnDRoot):
         self._trace_cb = ctk.CTkCheckBox(
             tracing_frame, text="Record agent trace", variable=self._trace_var,
             command=self._on_trace_toggle,
-            font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE), fg_color=COLORS["accent"],
+            font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE), fg_color=COLORS["accent"],
             hover_color=COLORS["accent_hover"], border_color=COLORS["border"],
             checkmark_color=COLORS["text_primary"], text_color=COLORS["text_secondary"],
             checkbox_width=20, checkbox_height=20,
@@ -580,7 +617,7 @@ class SpecReviewApp(_CTkDnDRoot):
         self._trace_deep_cb = ctk.CTkCheckBox(
             tracing_frame, text="Deep mode", variable=self._trace_deep_var,
             command=self._on_trace_toggle,
-            font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE), fg_color=COLORS["accent"],
+            font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE), fg_color=COLORS["accent"],
             hover_color=COLORS["accent_hover"], border_color=COLORS["border"],
             checkmark_color=COLORS["text_primary"], text_color=COLORS["text_secondary"],
             checkbox_width=20, checkbox_height=20,
@@ -589,7 +626,7 @@ class SpecReviewApp(_CTkDnDRoot):
         self._trace_show_btn = ctk.CTkButton(
             tracing_frame, text="Show folder", width=110,
             command=self._on_show_trace_folder,
-            font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE),
+            font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE),
             fg_color=COLORS["border"], hover_color=COLORS["accent_hover"],
             text_color=COLORS["text_primary"],
         )
@@ -597,7 +634,7 @@ class SpecReviewApp(_CTkDnDRoot):
         self._trace_viewer_btn = ctk.CTkButton(
             tracing_frame, text="Open viewer", width=110,
             command=self._on_open_trace_viewer,
-            font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE),
+            font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE),
             fg_color=COLORS["border"], hover_color=COLORS["accent_hover"],
             text_color=COLORS["text_primary"],
         )
@@ -623,7 +660,7 @@ class SpecReviewApp(_CTkDnDRoot):
     def _create_project_profile_row(self) -> None:
         """Build the (initially hidden) project city/state/country/client row."""
         self._profile_label = ctk.CTkLabel(
-            self.inputs_content, text="Project", font=ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE),
+            self.inputs_content, text="Project", font=cached_font(family="Segoe UI", size=_UI_FONT_SIZE),
             text_color=COLORS["text_secondary"], width=100, anchor="nw",
         )
         self._profile_label.grid(row=5, column=0, sticky="nw", pady=8)
@@ -633,18 +670,18 @@ class SpecReviewApp(_CTkDnDRoot):
         self._profile_frame.columnconfigure(3, weight=1)
 
         ekw = {
-            "font": ctk.CTkFont(family="Consolas", size=_UI_FONT_SIZE),
+            "font": cached_font(family="Consolas", size=_UI_FONT_SIZE),
             "fg_color": COLORS["bg_input"], "border_color": COLORS["border"],
             "text_color": COLORS["text_primary"], "height": 32,
         }
         mkw = {
-            "font": ctk.CTkFont(family="Segoe UI", size=_UI_FONT_SIZE),
+            "font": cached_font(family="Segoe UI", size=_UI_FONT_SIZE),
             "fg_color": COLORS["bg_input"], "button_color": COLORS["border"],
             "button_hover_color": COLORS["accent"], "text_color": COLORS["text_primary"],
             "height": 32,
         }
         lkw = {
-            "font": ctk.CTkFont(family="Segoe UI", size=11),
+            "font": cached_font(family="Segoe UI", size=11),
             "text_color": COLORS["text_muted"],
         }
 
@@ -914,10 +951,12 @@ class SpecReviewApp(_CTkDnDRoot):
         try:
             if platform.system() == "Windows":
                 os.startfile(str(path))  # type: ignore[attr-defined]
+            # Popen, not run: the launcher hands off to the file manager, and
+            # waiting on it would block the UI thread.
             elif platform.system() == "Darwin":
-                subprocess.run(["open", str(path)], check=False)
+                subprocess.Popen(["open", str(path)])
             else:
-                subprocess.run(["xdg-open", str(path)], check=False)
+                subprocess.Popen(["xdg-open", str(path)])
         except Exception as exc:
             self.log.log_warning(f"Could not open trace folder ({exc}). Path: {path}")
 
@@ -1051,7 +1090,7 @@ class SpecReviewApp(_CTkDnDRoot):
         on_review_complete(self, result)
 
     def _export_report_to_file(self, result) -> str:
-        return export_report_to_file(self, result)
+        return _report_controller().export_report_to_file(self, result)
 
     # ``_last_result`` is assigned by review_run_controller.on_review_complete
     # when a run finishes. Intercepting the assignment here (instead of adding
@@ -1082,7 +1121,7 @@ class SpecReviewApp(_CTkDnDRoot):
         if result is None:
             self.log.log_warning("No completed review in this session yet.")
             return
-        export_html_report_to_file(self, result)
+        _report_controller().export_html_report_to_file(self, result)
 
     def _on_review_error(self, err):
         on_review_error(self, err)
@@ -1090,22 +1129,22 @@ class SpecReviewApp(_CTkDnDRoot):
     # ----- Batch mode -----
 
     def _submit_batch_thread(self, run_epoch: int):
-        submit_batch_thread(self, run_epoch)
+        _batch_controller().submit_batch_thread(self, run_epoch)
 
     def _on_batch_submitted(self, submission: BatchSubmission):
-        on_batch_submitted(self, submission)
+        _batch_controller().on_batch_submitted(self, submission)
 
     def _poll_batch(self):
-        poll_batch(self)
+        _batch_controller().poll_batch(self)
 
     def _update_poll_progress(self, status: BatchStatus):
-        update_poll_progress(self, status)
+        _batch_controller().update_poll_progress(self, status)
 
     def _poll_and_collect_thread(self, run_epoch: int):
-        poll_and_collect_thread(self, run_epoch)
+        _batch_controller().poll_and_collect_thread(self, run_epoch)
 
     def _collect_batch_results(self):
-        collect_batch_results(self)
+        _batch_controller().collect_batch_results(self)
 
     def _reset_ui(self):
         reset_ui(self)
@@ -1126,10 +1165,10 @@ class SpecReviewApp(_CTkDnDRoot):
         show_license_dialog(self)
 
     def _maybe_offer_batch_resume(self):
-        offer_batch_resume(self)
+        _batch_controller().offer_batch_resume(self)
 
     def _recover_batch_dialog(self):
-        recover_batch_dialog(self)
+        _batch_controller().recover_batch_dialog(self)
 
     # ----- Self-update (Windows desktop build) -----
 
@@ -5,6 +5,10 @@ logging) and writes the machine-readable edit-instructions sidecar beside
 the report on success. Returns status strings ("canceled" / "success" /
 "error") so the caller can decide what to log.
 
+The JSON sidecars are written only after the report export succeeds, so a
+failed export leaves any sidecars from an earlier save of the same report
+untouched.
+
 ``export_html_report_to_file`` is the additive post-run HTML action: it
 consumes the already-completed result retained on ``app._last_result``
 read-only and writes one self-contained HTML file. It runs only when the
@@ -14,8 +18,9 @@ leaves the retained result and every existing export intact.
 """
 from __future__ import annotations
 
+import threading
+import time
 import webbrowser
-from datetime import datetime
 from pathlib import Path
 from tkinter import filedialog
 
@@ -28,7 +33,7 @@ from ..output.edit_sidecar import (
 
 
 def export_report_to_file(app, result) -> str:
-    default_name = f"spec-critic-report-{datetime.now().strftime('%Y-%m-%d')}.docx"
+    default_name = f"spec-critic-report-{time.strftime('%Y-%m-%d')}.docx"
     path = filedialog.asksaveasfilename(
         title="Save Review Report",
         defaultextension=".docx",
@@ -63,6 +68,13 @@ def export_report_to_file(app, result) -> str:
         return "error"
 
 
+def _open_in_browser(uri: str) -> None:
+    try:
+        webbrowser.open(uri)
+    except Exception:
+        pass  # opening the browser is a convenience, never a failure
+
+
 def export_html_report_to_file(app, result) -> str:
     """Save the completed result as a self-contained HTML report.
 
@@ -71,7 +83,7 @@ def export_html_report_to_file(app, result) -> str:
     result usable; on success the report is opened in the default browser as
     a nonfatal convenience.
     """
-    default_name = f"spec-critic-report-{datetime.now().strftime('%Y-%m-%d')}.html"
+    default_name = f"spec-critic-report-{time.strftime('%Y-%m-%d')}.html"
     path = filedialog.asksaveasfilename(
         title="Save HTML Report",
         defaultextension=".html",
@@ -86,10 +98,12 @@ def export_html_report_to_file(app, result) -> str:
         app.log.log_step(f"Exporting HTML report to {output_path.name}...")
         write_html_report(result, output_path)
         app.log.log_success(f"HTML report saved: {output_path}")
-        try:
-            webbrowser.open(output_path.resolve().as_uri())
-        except Exception:
-            pass  # opening the browser is a convenience, never a failure
+        # Launching the browser goes through the OS shell (ShellExecute on
+        # Windows) and can stall for a noticeable moment; keep it off the
+        # UI thread.
+        threading.Thread(
+            target=_open_in_browser, args=(output_path.resolve().as_uri(),), daemon=True
+        ).start()
         return "success"
     except Exception as e:
         app.log.log_error(f"HTML export failed: {e}")
@@ -32,8 +32,10 @@ from ..core.api_config import REALTIME_REVIEW_WORKER_CHOICES
 from ..core.pricing import friendly_model_name
 from ..core.tokenizer import count_tokens, PROJECT_CONTEXT_MAX_TOKENS
 from ..core.ui_state import load_realtime_review_workers, save_project_profile
+from .file_selection_controller import find_missing_specs
 from .project_profile_inputs import completeness_error
 from .realtime_cost_gate import should_warn_before_live_run
+from .ui_queue import post_to_ui
 from ..tracing.session import (
     start_run_recorder,
     stop_run_recorder as _stop_recorder,
@@ -54,6 +56,21 @@ def _selected_realtime_review_workers(app) -> int:
     return selected if selected in REALTIME_REVIEW_WORKER_CHOICES else fallback
 
 
+def _cancel_pending_reset(app) -> None:
+    """Drop the delayed post-run ``_reset_ui`` before a new run takes the UI.
+
+    Otherwise a reset scheduled by the previous completion can fire mid-run
+    and flip the button / progress bar back to idle.
+    """
+    after_id = getattr(app, "_reset_after_id", None)
+    app._reset_after_id = None
+    if after_id is not None:
+        try:
+            app.after_cancel(after_id)
+        except Exception:
+            pass
+
+
 def _maybe_start_recorder(*, run_id: str, mode: str, model: str, cycle_label: str, files: list, module_id: str = "", project_profile: dict | None = None):
     """Thin wrapper over ``tracing.session.start_run_recorder`` (kept for
     the existing call sites / signature)."""
@@ -70,7 +87,11 @@ def validate_inputs(app) -> bool:
     if not app._selected_files:
         app.log.log_error("Select .docx specification files")
         return False
-    missing = [f for f in app._selected_files if not f.exists()]
+    # Only re-stat files the folder snapshot taken in apply_selected_specs
+    # cannot vouch for (changed folder, or a name its listing lacked).
+    missing = find_missing_specs(
+        app._selected_files, getattr(app, "_selected_dir_snapshot", None)
+    )
     if missing:
         app.log.log_error(f"File not found: {missing[0].name}")
         return False
@@ -114,7 +135,7 @@ def next_run_epoch(app) -> int:
 
 
 def dispatch_if_current(app, epoch: int, fn) -> None:
-    app.after(0, lambda: fn() if app._run_epoch == epoch else None)
+    post_to_ui(app, lambda: fn() if app._run_epoch == epoch else None)
 
 
 def _revert_run_to_batch(app) -> None:
@@ -343,6 +364,7 @@ def start_review(app) -> None:
             f"Project: {app._project_profile_for_review.display_line()}",
             level="info",
         )
+    _cancel_pending_reset(app)
     app.is_processing = True
     if hasattr(app, "module_selector"):
         app.module_selector.configure(state="disabled")
@@ -481,7 +503,7 @@ def on_review_complete(app, result) -> None:
         app.run_button.set_complete_with_errors()
     else:
         app.run_button.set_complete()
-    app.after(2500, app._reset_ui)
+    app._reset_after_id = app.after(2500, app._reset_ui)
 
 
 def on_review_error(app, err) -> None:
@@ -495,6 +517,7 @@ def on_review_error(app, err) -> None:
 
 
 def reset_ui(app) -> None:
+    app._reset_after_id = None
     app.run_button.set_ready()
     # Mode-aware idle label; hand-built test doubles without the helper
     # keep the legacy batch text.
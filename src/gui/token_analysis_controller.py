@@ -15,15 +15,21 @@ pays for an exact ``count_tokens`` call. Stale-result protection inside
 """
 from __future__ import annotations
 
+import logging
 import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import NamedTuple
 
 from ..modules import get_module, require_module
 from ..programs import get_program
-from ..input.extractor import ExtractedSpec, extract_text
-from ..review.prompts import get_system_prompt
+from ..input.extractor import ExtractedSpec
+from ..input.extraction_cache import cache_enabled, extract_multiple_specs_cached
+from ..core.api_config import extraction_process_workers
+from ..review.prompts import system_prompt_tokens
 from ..core.tokenizer import count_tokens, exceeds_per_call_limit
+from .ui_queue import post_to_ui
 
+_log = logging.getLogger(__name__)
 
 # 300–500 ms recommended by the delta plan. 400 ms balances
 # perceived responsiveness against absorbing typical file-toggle bursts;
@@ -32,6 +38,35 @@ from ..core.tokenizer import count_tokens, exceeds_per_call_limit
 # (drops + browse) which is naturally slower than keystroke typing.
 EXACT_TOKEN_REFRESH_DEBOUNCE_MS = 400
 
+# Every file add / accumulation reload re-analyzes the whole selection, so
+# the extract+count workers are kept warm across analyses rather than built
+# and torn down per pass. Pool threads are not daemon threads: a superseded
+# analysis cancels its queued work, and the window's destroy path shuts the
+# pool down so closing the app never waits on a queue of extractions.
+_ANALYSIS_MAX_WORKERS = 8
+_analysis_executor: ThreadPoolExecutor | None = None
+_analysis_executor_lock = threading.Lock()
+
+
+def _analysis_pool() -> ThreadPoolExecutor:
+    global _analysis_executor
+    with _analysis_executor_lock:
+        if _analysis_executor is None:
+            _analysis_executor = ThreadPoolExecutor(
+                max_workers=_ANALYSIS_MAX_WORKERS,
+                thread_name_prefix="spec-analysis",
+            )
+        return _analysis_executor
+
+
+def shutdown_analysis_pool() -> None:
+    """Drop queued extract+count work and release the pool (window teardown)."""
+    global _analysis_executor
+    with _analysis_executor_lock:
+        executor, _analysis_executor = _analysis_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
 
 def _token_cycle_for_app(app):
     """Use the largest routed-module prompt as the program's safe gauge basis.
@@ -48,7 +83,7 @@ def _token_cycle_for_app(app):
     ]
     return max(
         modules,
-        key=lambda module: count_tokens(get_system_prompt(module.cycle)),
+        key=lambda module: system_prompt_tokens(module.cycle),
     ).cycle
 
 
@@ -134,6 +169,23 @@ def select_biggest_spec(file_data, extracted_specs):
     return spec
 
 
+def _extract_and_count(path, is_current=None) -> tuple[ExtractedSpec, int] | None:
+    """Worker body for token analysis: extract one spec and estimate it.
+
+    Goes through the extraction cache so the parse done here for the gauge
+    is the one the review run reuses when the user presses Run, instead of
+    every selected spec being parsed twice. ``is_current`` is checked before
+    each step; work queued by a superseded analysis returns ``None`` without
+    parsing or counting.
+    """
+    if is_current is not None and not is_current():
+        return None
+    spec = extract_multiple_specs_cached([path])[0]
+    if is_current is not None and not is_current():
+        return None
+    return spec, count_tokens(spec.content)
+
+
 def analyze_tokens(app, file_paths) -> None:
     if not file_paths:
         app.log.log_warning("No supported files found")
@@ -160,32 +212,85 @@ def analyze_tokens(app, file_paths) -> None:
     # results.
     app._analysis_epoch += 1
     captured_epoch = app._analysis_epoch
+    # Drop the previous analysis's queued extractions so they don't run
+    # ahead of this one on the shared pool.
+    cancel_previous = getattr(app, "_cancel_analysis", None)
+    if cancel_previous is not None:
+        cancel_previous()
+    submitted: list = []
+
+    def _cancel() -> None:
+        for fut in submitted:
+            fut.cancel()
+
+    app._cancel_analysis = _cancel
 
     def _is_current() -> bool:
         return app._analysis_epoch == captured_epoch
 
     def _dispatch_if_current(fn):
-        app.after(0, lambda: fn() if _is_current() else None)
+        post_to_ui(app, lambda: fn() if _is_current() else None)
 
     def analyze():
         try:
             _dispatch_if_current(lambda: app._clear_file_state())
             file_data = []
-            processed_names: list[str] = []
-            sys_tokens = count_tokens(get_system_prompt(cycle))
+            sys_tokens = system_prompt_tokens(cycle)
             ctx_tokens = count_tokens(project_context) if project_context else 0
             extracted_specs: list[ExtractedSpec] = []
-            for f in file_paths:
+            # Large selections: warm the extraction cache in one bulk call,
+            # which parses cold files in worker processes (python-docx is
+            # GIL-bound, so the thread pool below cannot scale it). The
+            # per-file loop then hits the cache and still reports each
+            # unreadable file on its own, so a bulk failure is only logged
+            # here. A superseded analysis skips the warm-up entirely.
+            if (
+                _is_current()
+                and cache_enabled()
+                and extraction_process_workers(len(file_paths))
+            ):
                 try:
-                    spec = extract_text(f)
-                    tokens = count_tokens(spec.content)
-                    file_data.append({"path": f, "filename": spec.filename, "tokens": tokens, "content": spec.content})
-                    processed_names.append(f.name)
-                    extracted_specs.append(spec)
-                except Exception as e:
-                    _dispatch_if_current(lambda err=str(e), n=f.name: app.log.log_warning(f"Could not read {n}: {err}"))
-            if processed_names:
-                _dispatch_if_current(lambda names=processed_names: app.log.log_file_batch(names))
+                    extract_multiple_specs_cached(list(file_paths))
+                except Exception:
+                    _log.debug("Bulk extraction warm-up failed", exc_info=True)
+            # Extract + count on the shared pool and log files as they land
+            # (wait/FIRST_COMPLETED) so the user sees progress instead of one
+            # burst at the end. Results are slotted by input index, so
+            # file_data / extracted_specs keep the selection order regardless
+            # of which file finished first.
+            results: list[tuple[ExtractedSpec, int] | None] = [None] * len(file_paths)
+            pool = _analysis_pool()
+            futures = {}
+            for i, f in enumerate(file_paths):
+                fut = pool.submit(_extract_and_count, f, _is_current)
+                submitted.append(fut)
+                futures[fut] = i
+            # Everything that finished since the last wake-up is posted as
+            # one batched log line set, not one UI callback per file.
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                if not _is_current():
+                    _cancel()
+                    return
+                landed: list[str] = []
+                for fut in sorted(done, key=futures.__getitem__):
+                    i = futures[fut]
+                    name = file_paths[i].name
+                    try:
+                        results[i] = fut.result()
+                    except Exception as e:
+                        _dispatch_if_current(lambda err=str(e), n=name: app.log.log_warning(f"Could not read {n}: {err}"))
+                        continue
+                    landed.append(name)
+                if landed:
+                    _dispatch_if_current(lambda names=landed: app.log.log_file_batch(names))
+            for f, result in zip(file_paths, results):
+                if result is None:
+                    continue
+                spec, tokens = result
+                file_data.append({"path": f, "filename": spec.filename, "tokens": tokens, "content": spec.content})
+                extracted_specs.append(spec)
             if file_data:
                 _dispatch_if_current(lambda fd=file_data, es=extracted_specs, st=sys_tokens, ct=ctx_tokens:
                     app._set_file_data(fd, es, st, ct))
@@ -344,5 +449,5 @@ def on_file_selection_change(app) -> None:
             _token_cycle_for_app(app),
             getattr(app, "_system_prompt_tokens", 0),
             getattr(app, "_project_context_tokens", 0),
-            lambda fn: app.after(0, fn),
+            lambda fn: post_to_ui(app, fn),
         )
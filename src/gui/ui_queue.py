@@ -0,0 +1,93 @@
+"""Single-drain UI work queue (tkinter-free).
+
+Worker threads used to marshal every UI mutation with its own
+``app.after(0, fn)``. Each of those calls takes the Tcl interpreter lock from
+a non-UI thread and registers a separate timer, so a chatty run (per-spec
+log lines, progress ticks, token-analysis results) queued hundreds of
+one-shot callbacks and contended with the event loop for the lock.
+
+Instead, workers now ``post_to_ui`` into a thread-safe ``queue.SimpleQueue``
+and the UI thread drains it from ONE repeating ``after`` poll. Only the UI
+thread ever touches Tk; the worker side is a lock-free ``put``. Each tick
+runs at most ``UI_DRAIN_BATCH`` callbacks so a burst cannot starve
+redraws/input, and a tick that hits the cap re-polls immediately instead of
+waiting a full interval. The next tick is armed before any callback runs, so
+a callback that opens a modal dialog (``wait_window`` spins a nested event
+loop) does not stall the queue until the dialog closes.
+
+Staleness guards (``_run_epoch`` / ``_analysis_epoch``) are unchanged: the
+callers still wrap ``fn`` in their epoch check, which is evaluated when the
+callback RUNS on the UI thread, exactly as it was under ``after(0, ...)``.
+
+Apps (and test doubles) that never called ``start_ui_queue`` fall back to the
+old ``app.after(0, fn)`` path, so hermetic controller tests keep working.
+"""
+from __future__ import annotations
+
+import queue
+import sys
+
+# Poll cadence for the drain loop. 50 ms is below the threshold where a log
+# line or progress tick reads as laggy, and idles at ~20 cheap wakeups/s.
+UI_POLL_INTERVAL_MS: int = 50
+# Upper bound on callbacks executed per tick.
+UI_DRAIN_BATCH: int = 100
+
+
+def post_to_ui(app, fn) -> None:
+    """Schedule ``fn`` to run on the UI thread. Safe from any thread."""
+    ui_queue = getattr(app, "_ui_queue", None)
+    if ui_queue is None:
+        app.after(0, fn)
+        return
+    ui_queue.put(fn)
+
+
+def start_ui_queue(app) -> None:
+    """Create the app's work queue and start the drain loop (UI thread only)."""
+    app._ui_queue = queue.SimpleQueue()
+    app._ui_queue_after_id = app.after(UI_POLL_INTERVAL_MS, lambda: drain_ui_queue(app))
+
+
+def stop_ui_queue(app) -> None:
+    """Cancel the pending drain tick (used on window teardown)."""
+    after_id = getattr(app, "_ui_queue_after_id", None)
+    app._ui_queue_after_id = None
+    if after_id is not None:
+        try:
+            app.after_cancel(after_id)
+        except Exception:
+            pass
+
+
+def drain_ui_queue(app) -> int:
+    """Run up to ``UI_DRAIN_BATCH`` queued callbacks, then re-arm the poll.
+
+    Returns the number of callbacks executed. A callback that raises is
+    routed to Tk's ``report_callback_exception`` (the same hook an
+    ``after(0, fn)`` exception would have reached) and never stops the loop.
+    """
+    ui_queue = app._ui_queue
+    # Armed up front: a modal opened by a callback below runs a nested event
+    # loop, and this tick keeps draining inside it.
+    app._ui_queue_after_id = app.after(UI_POLL_INTERVAL_MS, lambda: drain_ui_queue(app))
+    ran = 0
+    while ran < UI_DRAIN_BATCH:
+        try:
+            fn = ui_queue.get_nowait()
+        except queue.Empty:
+            break
+        ran += 1
+        try:
+            fn()
+        except Exception:
+            report = getattr(app, "report_callback_exception", None)
+            if report is not None:
+                report(*sys.exc_info())
+    # A full batch means more work is probably waiting — come straight back
+    # (``after(1)`` still yields to pending redraws/input) instead of idling.
+    # ``stop_ui_queue`` may have run inside a callback; stay stopped then.
+    if ran >= UI_DRAIN_BATCH and app._ui_queue_after_id is not None:
+        stop_ui_queue(app)
+        app._ui_queue_after_id = app.after(1, lambda: drain_ui_queue(app))
+    return ran
@@ -3,8 +3,8 @@
 Bridges the pure updater module (``src/core/updates.py``) and the GUI shell,
 following the controller pattern: every function takes ``app`` (the
 ``SpecReviewApp``) as its first argument, network/disk work runs on daemon
-threads, and every tkinter mutation is marshaled back with ``app.after(0,
-lambda ...)`` using default-argument capture.
+threads, and every tkinter mutation is marshaled back with ``post_to_ui(app,
+lambda ...)`` (``gui/ui_queue.py``) using default-argument capture.
 
 Lifecycle guards (learned on the sibling Drawing Analyzer app):
 
@@ -31,6 +31,7 @@ import customtkinter as ctk
 
 from .. import __version__
 from ..core import updates
+from .ui_queue import post_to_ui
 from .widgets import COLORS
 
 
@@ -135,7 +136,7 @@ def _update_check_worker(app, manual: bool) -> None:
         updates.save_state(app._update_state_path, state)
     except Exception:  # noqa: BLE001 - best-effort state write
         pass
-    app.after(0, lambda: on_update_check_done(app, result, manual))
+    post_to_ui(app, lambda: on_update_check_done(app, result, manual))
 
 
 def on_update_check_done(app, result, manual: bool) -> None:
@@ -364,13 +365,13 @@ def _update_download_worker(app, info) -> None:
         dest_dir = updates.default_download_dir()
 
         def _progress(done: int, total: int) -> None:
-            app.after(0, lambda d=done, t=total: on_update_download_progress(app, d, t))
+            post_to_ui(app, lambda d=done, t=total: on_update_download_progress(app, d, t))
 
         path = updates.download_installer(info, dest_dir, progress=_progress)
     except Exception as exc:  # noqa: BLE001 - surfaced in the dialog
-        app.after(0, lambda e=str(exc): on_update_download_error(app, e))
+        post_to_ui(app, lambda e=str(exc): on_update_download_error(app, e))
         return
-    app.after(0, lambda p=path: on_update_download_done(app, p))
+    post_to_ui(app, lambda p=path: on_update_download_done(app, p))
 
 
 def on_update_download_progress(app, done: int, total: int) -> None:
@@ -5,6 +5,8 @@ Contains: TokenGauge, FileListPanel, EnhancedLog,
 AnimatedButton, DiagnosticsWindow.
 """
 import math
+import time
+from functools import lru_cache
 from datetime import datetime
 from collections import deque
 
@@ -60,6 +62,14 @@ LOG_COLORS = {
     "muted": COLORS["text_muted"],
 }
 
+_TIMELINE_LEVEL_ICONS = {
+    "info": "  ",
+    "success": "+ ",
+    "warning": "! ",
+    "error": "X ",
+    "step": "> ",
+}
+
 ANIM = {
     "log_file_delay": 200, "log_status_delay": 400, "gauge_step": 33,
     "gauge_duration": 700, "fade_duration": 200, "fade_steps": 8,
@@ -72,6 +82,15 @@ ANIM = {
 # UTILITY FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=None)
+def cached_font(**kwargs):
+    """Shared ``CTkFont`` per distinct spec.
+
+    Constructing a CTkFont measures it through Tk; widgets rebuilt per row or
+    per window reuse one instance instead (CTk widgets can share a font).
+    """
+    return ctk.CTkFont(**kwargs)
+
 def lerp(start, end, t): return start + (end - start) * t
 def ease_out_cubic(t): return 1 - pow(1 - t, 3)
 def hex_to_rgb(h):
@@ -105,11 +124,11 @@ class TokenGauge(ctk.CTkFrame):
         self.header_frame = ctk.CTkFrame(self, fg_color="transparent", cursor="hand2")
         self.header_frame.pack(fill="x", padx=16, pady=(12, 8))
         self.header_frame.bind("<Button-1>", self._toggle)
-        self.expand_label = ctk.CTkLabel(self.header_frame, text="\u25bc", font=ctk.CTkFont(family="Consolas", size=12), text_color=COLORS["text_muted"], width=20)
+        self.expand_label = ctk.CTkLabel(self.header_frame, text="\u25bc", font=cached_font(family="Consolas", size=12), text_color=COLORS["text_muted"], width=20)
         self.expand_label.pack(side="left"); self.expand_label.bind("<Button-1>", self._toggle)
-        self.title_label = ctk.CTkLabel(self.header_frame, text="LARGEST SPEC CAPACITY (approx)", font=ctk.CTkFont(family="Segoe UI", size=11, weight="bold"), text_color=COLORS["text_muted"])
+        self.title_label = ctk.CTkLabel(self.header_frame, text="LARGEST SPEC CAPACITY (approx)", font=cached_font(family="Segoe UI", size=11, weight="bold"), text_color=COLORS["text_muted"])
         self.title_label.pack(side="left", padx=(4, 0)); self.title_label.bind("<Button-1>", self._toggle)
-        self.count_label = ctk.CTkLabel(self.header_frame, text=f"\u2014 / {max_tokens:,}", font=ctk.CTkFont(family="Consolas", size=12), text_color=COLORS["text_secondary"])
+        self.count_label = ctk.CTkLabel(self.header_frame, text=f"\u2014 / {max_tokens:,}", font=cached_font(family="Consolas", size=12), text_color=COLORS["text_secondary"])
         self.count_label.pack(side="right"); self.count_label.bind("<Button-1>", self._toggle)
 
         self.content_container = ctk.CTkFrame(self, fg_color="transparent"); self.content_container.pack(fill="x")
@@ -117,7 +136,14 @@ class TokenGauge(ctk.CTkFrame):
         bar_frame.pack(fill="x", padx=16, pady=(0, 8)); bar_frame.pack_propagate(False)
         self.progress_bar = ctk.CTkFrame(bar_frame, fg_color=COLORS["accent"], corner_radius=4, height=8, width=0)
         self.progress_bar.place(x=0, y=0, relheight=1); self.bar_frame = bar_frame
-        self.status_label = ctk.CTkLabel(self.content_container, text="Select specs to analyze token usage", font=ctk.CTkFont(family="Segoe UI", size=11), text_color=COLORS["text_muted"])
+        # Track the track width from <Configure> so animation frames never
+        # round-trip to Tk (winfo_width forces a geometry query each call).
+        self._bar_width = 0; bar_frame.bind("<Configure>", self._on_bar_configure)
+        # Last values pushed to Tk; a CTk colour/text configure repaints the
+        # whole rounded canvas, so unchanged values are not re-sent.
+        self._shown_bar = (0, COLORS["accent"]); self._shown_title = None; self._shown_status = None
+        self._shown_update = None; self._max_suffix = f" / {max_tokens:,}"
+        self.status_label = ctk.CTkLabel(self.content_container, text="Select specs to analyze token usage", font=cached_font(family="Segoe UI", size=11), text_color=COLORS["text_muted"])
         self.status_label.pack(padx=16, pady=(0, 12))
 
     def _toggle(self, event=None): self.collapse() if self._expanded else self.expand()
@@ -136,16 +162,19 @@ class TokenGauge(ctk.CTkFrame):
                 of the implementation plan asked the GUI to distinguish
                 approximate from exact counts.
         """
+        key = (largest_call_tokens, file_count, is_exact)
+        if key == self._shown_update: return
+        self._shown_update = key
         self.token_count = largest_call_tokens; raw_pct = largest_call_tokens / self.max_tokens
         self._target_pct = min(raw_pct, 1.0); self.is_over_limit = raw_pct > 1.0
-        title_suffix = "" if is_exact else " (approx)"
-        self.title_label.configure(text=f"LARGEST SPEC CAPACITY{title_suffix}")
-        self.count_label.configure(text=f"{largest_call_tokens:,} / {self.max_tokens:,}")
+        title = "LARGEST SPEC CAPACITY" if is_exact else "LARGEST SPEC CAPACITY (approx)"
+        if title != self._shown_title: self._shown_title = title; self.title_label.configure(text=title)
+        self.count_label.configure(text=f"{largest_call_tokens:,}{self._max_suffix}")
         if raw_pct > 1.0: self._target_color, status, sc = COLORS["error"], "\u26a0 Largest spec exceeds per-call limit!", COLORS["error"]
         elif raw_pct > 0.9: self._target_color, status, sc = COLORS["warning"], f"\u26a0 {raw_pct*100:.0f}% \u2014 largest spec approaching limit \u2022 {file_count} files", COLORS["warning"]
         elif raw_pct > 0.7: self._target_color, status, sc = COLORS["warning"], f"\u2713 {raw_pct*100:.0f}% \u2014 {file_count} files ready", COLORS["text_secondary"]
         else: self._target_color, status, sc = COLORS["success"], f"\u2713 {raw_pct*100:.0f}% \u2014 {file_count} files ready", COLORS["text_secondary"]
-        self.status_label.configure(text=status, text_color=sc)
+        if (status, sc) != self._shown_status: self._shown_status = (status, sc); self.status_label.configure(text=status, text_color=sc)
         if not self._animating: self._animating = True; self._animate_gauge(0)
 
     def _animate_gauge(self, step):
@@ -154,17 +183,21 @@ class TokenGauge(ctk.CTkFrame):
         self._current_pct = lerp(0, self._target_pct, ease_out_cubic(step / total)); self._update_bar()
         self.after(ANIM["gauge_step"], lambda: self._animate_gauge(step + 1))
 
+    def _on_bar_configure(self, event):
+        self._bar_width = event.width
+        if not self._animating: self._update_bar()
+
     def _update_bar(self):
-        w = self.bar_frame.winfo_width()
-        if w > 1: self.progress_bar.configure(width=int(w * self._current_pct))
+        w = self._bar_width; width, color = self._shown_bar
+        if w > 1: width = int(w * self._current_pct)
         c = blend_colors(COLORS["accent"], self._target_color, self._current_pct / max(self._target_pct, 0.01))
-        self.progress_bar.configure(fg_color=c)
+        if (width, c) != self._shown_bar: self._shown_bar = (width, c); self.progress_bar.configure(width=width, fg_color=c)
 
     def reset(self):
         self.token_count = 0; self._target_pct = self._current_pct = 0.0
-        self.count_label.configure(text=f"\u2014 / {self.max_tokens:,}")
-        self.progress_bar.configure(width=0, fg_color=COLORS["accent"])
-        self.status_label.configure(text="Select specs to analyze token usage", text_color=COLORS["text_muted"])
+        self._shown_update = None; self.count_label.configure(text=f"\u2014{self._max_suffix}")
+        self._shown_bar = (0, COLORS["accent"]); self.progress_bar.configure(width=0, fg_color=COLORS["accent"])
+        self._shown_status = None; self.status_label.configure(text="Select specs to analyze token usage", text_color=COLORS["text_muted"])
 
 
 # ============================================================================
@@ -177,20 +210,21 @@ class FileListPanel(ctk.CTkFrame):
         self._expanded = False; self._animating = False; self._file_data = []; self._drawing_data = []
         self._on_selection_change = on_selection_change; self._pack_after = pack_after
         self._is_over_limit = False; self._glow_animation_id = None
+        self._rows: list[dict] = []; self._loading = False
 
         self.header = ctk.CTkFrame(self, fg_color="transparent", cursor="hand2")
         self.header.pack(fill="x", padx=16, pady=12); self.header.bind("<Button-1>", self._toggle)
-        self.expand_label = ctk.CTkLabel(self.header, text="\u25b6", font=ctk.CTkFont(family="Consolas", size=12), text_color=COLORS["text_muted"], width=20)
+        self.expand_label = ctk.CTkLabel(self.header, text="\u25b6", font=cached_font(family="Consolas", size=12), text_color=COLORS["text_muted"], width=20)
         self.expand_label.pack(side="left"); self.expand_label.bind("<Button-1>", self._toggle)
-        self.title_label = ctk.CTkLabel(self.header, text="FILES", font=ctk.CTkFont(family="Segoe UI", size=11, weight="bold"), text_color=COLORS["text_muted"])
+        self.title_label = ctk.CTkLabel(self.header, text="FILES", font=cached_font(family="Segoe UI", size=11, weight="bold"), text_color=COLORS["text_muted"])
         self.title_label.pack(side="left", padx=(4, 0)); self.title_label.bind("<Button-1>", self._toggle)
-        self.drawings_label = ctk.CTkLabel(self.header, text="", font=ctk.CTkFont(family="Segoe UI", size=11), text_color=COLORS["accent"])
+        self.drawings_label = ctk.CTkLabel(self.header, text="", font=cached_font(family="Segoe UI", size=11), text_color=COLORS["accent"])
         self.drawings_label.pack(side="left", padx=(8, 0)); self.drawings_label.bind("<Button-1>", self._toggle)
-        self.count_label = ctk.CTkLabel(self.header, text="", font=ctk.CTkFont(family="Segoe UI", size=11), text_color=COLORS["text_secondary"])
+        self.count_label = ctk.CTkLabel(self.header, text="", font=cached_font(family="Segoe UI", size=11), text_color=COLORS["text_secondary"])
         self.count_label.pack(side="right"); self.count_label.bind("<Button-1>", self._toggle)
         btn_frame = ctk.CTkFrame(self.header, fg_color="transparent"); btn_frame.pack(side="right", padx=(0, 16))
-        ctk.CTkButton(btn_frame, text="All", width=40, height=22, font=ctk.CTkFont(size=10), fg_color="transparent", hover_color=COLORS["bg_input"], text_color=COLORS["text_muted"], command=self._select_all).pack(side="left", padx=(0, 4))
-        ctk.CTkButton(btn_frame, text="None", width=40, height=22, font=ctk.CTkFont(size=10), fg_color="transparent", hover_color=COLORS["bg_input"], text_color=COLORS["text_muted"], command=self._select_none).pack(side="left")
+        ctk.CTkButton(btn_frame, text="All", width=40, height=22, font=cached_font(size=10), fg_color="transparent", hover_color=COLORS["bg_input"], text_color=COLORS["text_muted"], command=self._select_all).pack(side="left", padx=(0, 4))
+        ctk.CTkButton(btn_frame, text="None", width=40, height=22, font=cached_font(size=10), fg_color="transparent", hover_color=COLORS["bg_input"], text_color=COLORS["text_muted"], command=self._select_none).pack(side="left")
         self.content_container = ctk.CTkFrame(self, fg_color="transparent")
         self.file_list = ctk.CTkScrollableFrame(self.content_container, fg_color=COLORS["bg_input"], corner_radius=4, height=150)
         self.file_list.pack(fill="both", expand=True, padx=16, pady=(0, 12))
@@ -207,21 +241,40 @@ class FileListPanel(ctk.CTkFrame):
         # accumulation reload. Missing/None entries default to checked, so
         # any other caller keeps the original "all selected" behavior.
         sel = selection or {}
-        for w in self.file_list.winfo_children(): w.destroy()
-        self._file_data.clear()
-        for data in file_data:
-            checked = bool(sel.get(data["path"], True))
-            var = ctk.BooleanVar(value=checked); var.trace_add("write", lambda *a: self._on_checkbox_change())
-            row = ctk.CTkFrame(self.file_list, fg_color="transparent"); row.pack(fill="x", pady=2)
-            ctk.CTkCheckBox(row, text="", variable=var, width=24, height=24, checkbox_width=18, checkbox_height=18, corner_radius=4, border_width=2, fg_color=COLORS["accent"], hover_color=COLORS["accent_hover"], border_color=COLORS["border"], checkmark_color=COLORS["text_primary"]).pack(side="left")
-            nl = ctk.CTkLabel(row, text=data["filename"], font=ctk.CTkFont(family="Segoe UI", size=11), text_color=COLORS["text_secondary"] if checked else COLORS["text_muted"], anchor="w")
-            nl.pack(side="left", padx=(8, 0), fill="x", expand=True)
-            ctk.CTkLabel(row, text=f"{data['tokens']:,}", font=ctk.CTkFont(family="Consolas", size=10), text_color=COLORS["text_muted"], width=60, anchor="e").pack(side="right", padx=(8, 4))
-            self._file_data.append({"path": data["path"], "filename": data["filename"], "tokens": data["tokens"], "var": var, "name_label": nl})
+        self._release_rows(); self._file_data.clear()
+        # Rows are pooled: a reload reconfigures the widgets it already built
+        # and only constructs the ones a larger selection needs. Writes to a
+        # reused row's var must not fire the selection callback mid-load.
+        self._loading = True
+        try:
+            for i, data in enumerate(file_data):
+                checked = bool(sel.get(data["path"], True))
+                r = self._rows[i] if i < len(self._rows) else self._build_row()
+                r["var"].set(checked)
+                r["name_label"].configure(text=data["filename"], text_color=COLORS["text_secondary"] if checked else COLORS["text_muted"])
+                r["tokens_label"].configure(text=f"{data['tokens']:,}")
+                r["frame"].pack(fill="x", pady=2)
+                self._file_data.append({"path": data["path"], "filename": data["filename"], "tokens": data["tokens"], "var": r["var"], "name_label": r["name_label"]})
+        finally:
+            self._loading = False
         self._update_count()
         self._pack_self()
         self._expanded = False; self.expand_label.configure(text="\u25b6")
 
+    def _build_row(self):
+        var = ctk.BooleanVar(value=True); var.trace_add("write", lambda *a: self._on_checkbox_change())
+        row = ctk.CTkFrame(self.file_list, fg_color="transparent")
+        ctk.CTkCheckBox(row, text="", variable=var, width=24, height=24, checkbox_width=18, checkbox_height=18, corner_radius=4, border_width=2, fg_color=COLORS["accent"], hover_color=COLORS["accent_hover"], border_color=COLORS["border"], checkmark_color=COLORS["text_primary"]).pack(side="left")
+        nl = ctk.CTkLabel(row, text="", font=cached_font(family="Segoe UI", size=11), text_color=COLORS["text_secondary"], anchor="w")
+        nl.pack(side="left", padx=(8, 0), fill="x", expand=True)
+        tl = ctk.CTkLabel(row, text="", font=cached_font(family="Consolas", size=10), text_color=COLORS["text_muted"], width=60, anchor="e")
+        tl.pack(side="right", padx=(8, 4))
+        r = {"frame": row, "var": var, "name_label": nl, "tokens_label": tl}
+        self._rows.append(r); return r
+
+    def _release_rows(self):
+        for r in self._rows[:len(self._file_data)]: r["frame"].pack_forget()
+
     def selection_state_by_path(self):
         """Snapshot ``{path: is_checked}`` for the currently-loaded files.
 
@@ -233,6 +286,7 @@ class FileListPanel(ctk.CTkFrame):
     def get_selected_files(self): return [d["path"] for d in self._file_data if d["var"].get()]
     def get_selected_count(self): return sum(1 for d in self._file_data if d["var"].get())
     def _on_checkbox_change(self):
+        if self._loading: return
         self._update_count()
         for d in self._file_data: d["name_label"].configure(text_color=COLORS["text_secondary"] if d["var"].get() else COLORS["text_muted"])
         if self._on_selection_change: self._on_selection_change()
@@ -266,13 +320,13 @@ class FileListPanel(ctk.CTkFrame):
             self.drawings_label.configure(text=""); self.drawings_section.pack_forget(); return
         self.drawings_label.configure(text=f"◆ {n} drawing{'s' if n != 1 else ''}")
         hdr = ctk.CTkFrame(self.drawings_section, fg_color="transparent"); hdr.pack(fill="x", padx=16, pady=(4, 2))
-        ctk.CTkLabel(hdr, text="DRAWINGS (in Project Context)", font=ctk.CTkFont(family="Segoe UI", size=10, weight="bold"), text_color=COLORS["text_muted"]).pack(side="left")
+        ctk.CTkLabel(hdr, text="DRAWINGS (in Project Context)", font=cached_font(family="Segoe UI", size=10, weight="bold"), text_color=COLORS["text_muted"]).pack(side="left")
         for d in self._drawing_data:
             row = ctk.CTkFrame(self.drawings_section, fg_color="transparent"); row.pack(fill="x", padx=16, pady=1)
-            ctk.CTkLabel(row, text="◆", font=ctk.CTkFont(size=11), text_color=COLORS["accent"], width=18).pack(side="left")
-            ctk.CTkLabel(row, text=d.get("name", ""), font=ctk.CTkFont(family="Segoe UI", size=11), text_color=COLORS["text_secondary"], anchor="w").pack(side="left", padx=(4, 0), fill="x", expand=True)
+            ctk.CTkLabel(row, text="◆", font=cached_font(size=11), text_color=COLORS["accent"], width=18).pack(side="left")
+            ctk.CTkLabel(row, text=d.get("name", ""), font=cached_font(family="Segoe UI", size=11), text_color=COLORS["text_secondary"], anchor="w").pack(side="left", padx=(4, 0), fill="x", expand=True)
             pages = d.get("pages")
-            if pages: ctk.CTkLabel(row, text=pages, font=ctk.CTkFont(family="Consolas", size=10), text_color=COLORS["text_muted"], width=60, anchor="e").pack(side="right", padx=(8, 4))
+            if pages: ctk.CTkLabel(row, text=pages, font=cached_font(family="Consolas", size=10), text_color=COLORS["text_muted"], width=60, anchor="e").pack(side="right", padx=(8, 4))
         self.drawings_section.pack(fill="x", pady=(0, 12))
     def _select_all(self):
         for d in self._file_data: d["var"].set(True)
@@ -305,8 +359,7 @@ class FileListPanel(ctk.CTkFrame):
         # it is cleared separately when the digest leaves Project Context.
         if self._glow_animation_id: self.after_cancel(self._glow_animation_id); self._glow_animation_id = None
         self._is_over_limit = False; self.title_label.configure(text_color=COLORS["text_muted"])
-        for w in self.file_list.winfo_children(): w.destroy()
-        self._file_data.clear(); self._update_count()
+        self._release_rows(); self._file_data.clear(); self._update_count()
         if self._drawing_data: self._pack_self()
         else: self.pack_forget()
 
@@ -317,18 +370,20 @@ class FileListPanel(ctk.CTkFrame):
 
 class EnhancedLog(ctk.CTkFrame):
     _COLLAPSED_HEIGHT = 48
+    _MAX_LINES = 5000
     def __init__(self, master, **kwargs):
         super().__init__(master, fg_color=COLORS["bg_card"], corner_radius=8, **kwargs)
         self._log_queue: deque = deque(); self._processing_queue = False; self._queue_after_id = None; self._expanded = True
+        self._scroll_pending = False; self._stamp_sec = -1; self._stamp = ""
         self.header = ctk.CTkFrame(self, fg_color="transparent", height=36, cursor="hand2")
         self.header.pack(fill="x", padx=16, pady=(12, 0)); self.header.pack_propagate(False)
         self.header.bind("<Button-1>", self._toggle)
-        self.expand_label = ctk.CTkLabel(self.header, text="\u25bc", font=ctk.CTkFont(family="Consolas", size=12), text_color=COLORS["text_muted"], width=20)
+        self.expand_label = ctk.CTkLabel(self.header, text="\u25bc", font=cached_font(family="Consolas", size=12), text_color=COLORS["text_muted"], width=20)
         self.expand_label.pack(side="left"); self.expand_label.bind("<Button-1>", self._toggle)
-        ctk.CTkLabel(self.header, text="ACTIVITY LOG", font=ctk.CTkFont(family="Segoe UI", size=11, weight="bold"), text_color=COLORS["text_muted"]).pack(side="left", padx=(4, 0))
-        ctk.CTkButton(self.header, text="Clear", width=50, height=24, font=ctk.CTkFont(size=11), fg_color="transparent", hover_color=COLORS["bg_input"], text_color=COLORS["text_muted"], command=self.clear).pack(side="right")
+        ctk.CTkLabel(self.header, text="ACTIVITY LOG", font=cached_font(family="Segoe UI", size=11, weight="bold"), text_color=COLORS["text_muted"]).pack(side="left", padx=(4, 0))
+        ctk.CTkButton(self.header, text="Clear", width=50, height=24, font=cached_font(size=11), fg_color="transparent", hover_color=COLORS["bg_input"], text_color=COLORS["text_muted"], command=self.clear).pack(side="right")
         self.content_container = ctk.CTkFrame(self, fg_color="transparent"); self.content_container.pack(fill="both", expand=True)
-        self._textbox = ctk.CTkTextbox(self.content_container, fg_color=COLORS["bg_input"], corner_radius=4, font=ctk.CTkFont(family="Consolas", size=12), text_color=COLORS["text_secondary"], wrap="word", state="disabled", activate_scrollbars=True)
+        self._textbox = ctk.CTkTextbox(self.content_container, fg_color=COLORS["bg_input"], corner_radius=4, font=cached_font(family="Consolas", size=12), text_color=COLORS["text_secondary"], wrap="word", state="disabled", activate_scrollbars=True)
         self._textbox.pack(fill="both", expand=True, padx=16, pady=12)
         inner_text = self._textbox._textbox
         for level, color in LOG_COLORS.items(): inner_text.tag_configure(level, foreground=color)
@@ -346,6 +401,15 @@ class EnhancedLog(ctk.CTkFrame):
         self._queue_after_id = None
         if not self._log_queue: self._processing_queue = False; return
         self._processing_queue = True; msg, level, ts, delay = self._log_queue.popleft()
+        if level == "file" and not ts:
+            # Drain any file lines already waiting behind this one into the
+            # same insert: a large selection otherwise trickles out one Tk
+            # render per pacing tick and holds back the status lines queued
+            # after it. Files that land one at a time still appear singly.
+            batch = [msg]
+            while self._log_queue and self._log_queue[0][1] == "file" and not self._log_queue[0][2]:
+                batch.append(self._log_queue.popleft()[0])
+            msg = "\n         ".join(batch)
         try:
             self._append_line(msg, level, ts)
         finally:
@@ -354,10 +418,28 @@ class EnhancedLog(ctk.CTkFrame):
             # which would silently freeze the log for the rest of the run).
             self._queue_after_id = self.after(delay, self._process_queue)
     def _append_line(self, msg: str, level: str, ts: bool):
-        txt = f"[{datetime.now().strftime('%H:%M:%S')}]  {msg}" if ts else f"         {msg}"
+        if ts:
+            # Bursts land within the same second; format the stamp once per second.
+            now = int(time.time())
+            if now != self._stamp_sec: self._stamp_sec = now; self._stamp = time.strftime("%H:%M:%S", time.localtime(now))
+            txt = f"[{self._stamp}]  {msg}"
+        else: txt = f"         {msg}"
         self._textbox.configure(state="normal"); inner = self._textbox._textbox
+        # Only follow the tail when the user is already looking at it, so
+        # scrolling back through a long run is not yanked to the bottom.
+        follow = inner.yview()[1] >= 0.999
         if inner.index("end-1c") != "1.0": inner.insert("end", "\n", ())
-        inner.insert("end", txt, (level,)); self._textbox.configure(state="disabled"); inner.see("end")
+        inner.insert("end", txt, (level,))
+        # Keep the widget bounded: Tk's layout and redraw cost grows with the
+        # number of lines held, and a long review never needs its whole history.
+        excess = int(inner.index("end-1c").split(".")[0]) - self._MAX_LINES
+        if excess > 0: inner.delete("1.0", f"{excess + 1}.0")
+        self._textbox.configure(state="disabled")
+        # Scrolling forces a relayout; a burst of lines needs only one.
+        if follow and not self._scroll_pending:
+            self._scroll_pending = True; self.after_idle(self._flush_scroll)
+    def _flush_scroll(self):
+        self._scroll_pending = False; self._textbox._textbox.see("end")
 
     def log(self, msg, level="info", timestamp=True, paced=True):
         if paced: self._queue_log(msg, level, timestamp, ANIM["log_status_delay"])
@@ -393,7 +475,7 @@ class EnhancedLog(ctk.CTkFrame):
 class AnimatedButton(ctk.CTkButton):
     def __init__(self, master, **kwargs):
         self.default_text = kwargs.pop("text", "Run")
-        super().__init__(master, text=self.default_text, font=ctk.CTkFont(family="Segoe UI", size=14, weight="bold"), height=44, corner_radius=8, fg_color=COLORS["accent"], hover_color=COLORS["accent_hover"], **kwargs)
+        super().__init__(master, text=self.default_text, font=cached_font(family="Segoe UI", size=14, weight="bold"), height=44, corner_radius=8, fg_color=COLORS["accent"], hover_color=COLORS["accent_hover"], **kwargs)
         self._state = "ready"; self._pulse_active = False; self._pulse_step = 0; self._glow_active = False
 
     def set_processing(self):
@@ -461,12 +543,12 @@ class DiagnosticsWindow(ctk.CTkToplevel):
         tb_inner.pack(fill="x", padx=16, pady=8)
         ctk.CTkLabel(
             tb_inner, text="Diagnostics Report",
-            font=ctk.CTkFont(family="Segoe UI", size=14, weight="bold"),
+            font=cached_font(family="Segoe UI", size=14, weight="bold"),
             text_color=COLORS["text_primary"],
         ).pack(side="left")
 
         btn_kw = {
-            "height": 30, "font": ctk.CTkFont(size=12),
+            "height": 30, "font": cached_font(size=12),
             "fg_color": COLORS["bg_input"], "hover_color": COLORS["border"],
             "border_width": 1, "border_color": COLORS["border"],
             "text_color": COLORS["text_secondary"],
@@ -493,7 +575,7 @@ class DiagnosticsWindow(ctk.CTkToplevel):
 
         ctk.CTkLabel(
             inner, text="RUN CONFIGURATION",
-            font=ctk.CTkFont(family="Segoe UI", size=13, weight="bold"),
+            font=cached_font(family="Segoe UI", size=13, weight="bold"),
             text_color=COLORS["accent"],
         ).pack(anchor="w")
 
@@ -520,7 +602,7 @@ class DiagnosticsWindow(ctk.CTkToplevel):
 
         ctk.CTkLabel(
             inner, text="\n".join(lines),
-            font=ctk.CTkFont(family="Consolas", size=12),
+            font=cached_font(family="Consolas", size=12),
             text_color=COLORS["text_secondary"],
             justify="left", anchor="w",
         ).pack(anchor="w", pady=(6, 0))
@@ -533,7 +615,7 @@ class DiagnosticsWindow(ctk.CTkToplevel):
 
         ctk.CTkLabel(
             inner, text="SUMMARY",
-            font=ctk.CTkFont(family="Segoe UI", size=13, weight="bold"),
+            font=cached_font(family="Segoe UI", size=13, weight="bold"),
             text_color=COLORS["accent"],
         ).pack(anchor="w")
 
@@ -558,35 +640,35 @@ class DiagnosticsWindow(ctk.CTkToplevel):
             color = COLORS["error"] if label == "Errors" and s["errors"] > 0 else \
                     COLORS["warning"] if label == "Warnings" and s["warnings"] > 0 else \
                     COLORS["text_primary"]
-            ctk.CTkLabel(cell, text=value, font=ctk.CTkFont(family="Consolas", size=14, weight="bold"), text_color=color).place(relx=0.5, rely=0.35, anchor="center")
-            ctk.CTkLabel(cell, text=label, font=ctk.CTkFont(size=10), text_color=COLORS["text_muted"]).place(relx=0.5, rely=0.72, anchor="center")
+            ctk.CTkLabel(cell, text=value, font=cached_font(family="Consolas", size=14, weight="bold"), text_color=color).place(relx=0.5, rely=0.35, anchor="center")
+            ctk.CTkLabel(cell, text=label, font=cached_font(size=10), text_color=COLORS["text_muted"]).place(relx=0.5, rely=0.72, anchor="center")
         stats_frame.grid_columnconfigure(list(range(len(stat_items))), weight=1)
 
         # Severity counts
         if s["severity_counts"]:
             sev_frame = ctk.CTkFrame(inner, fg_color="transparent")
             sev_frame.pack(fill="x", pady=(10, 0))
-            ctk.CTkLabel(sev_frame, text="Findings:", font=ctk.CTkFont(family="Consolas", size=12), text_color=COLORS["text_secondary"]).pack(side="left")
+            ctk.CTkLabel(sev_frame, text="Findings:", font=cached_font(family="Consolas", size=12), text_color=COLORS["text_secondary"]).pack(side="left")
             for sev, cnt in s["severity_counts"].items():
                 color = SEVERITY_COLORS.get(sev, COLORS["text_secondary"])
-                ctk.CTkLabel(sev_frame, text=f"  {sev}: {cnt}", font=ctk.CTkFont(family="Consolas", size=12, weight="bold"), text_color=color).pack(side="left")
+                ctk.CTkLabel(sev_frame, text=f"  {sev}: {cnt}", font=cached_font(family="Consolas", size=12, weight="bold"), text_color=color).pack(side="left")
 
         # Verdict breakdown
         if s["verification_verdicts"]:
             verd_frame = ctk.CTkFrame(inner, fg_color="transparent")
             verd_frame.pack(fill="x", pady=(4, 0))
-            ctk.CTkLabel(verd_frame, text="Verdicts:", font=ctk.CTkFont(family="Consolas", size=12), text_color=COLORS["text_secondary"]).pack(side="left")
+            ctk.CTkLabel(verd_frame, text="Verdicts:", font=cached_font(family="Consolas", size=12), text_color=COLORS["text_secondary"]).pack(side="left")
             for verdict, cnt in s["verification_verdicts"].items():
                 color = VERDICT_COLORS.get(verdict, COLORS["text_secondary"])
-                ctk.CTkLabel(verd_frame, text=f"  {verdict}: {cnt}", font=ctk.CTkFont(family="Consolas", size=12, weight="bold"), text_color=color).pack(side="left")
+                ctk.CTkLabel(verd_frame, text=f"  {verdict}: {cnt}", font=cached_font(family="Consolas", size=12, weight="bold"), text_color=color).pack(side="left")
 
         # Phase durations
         if s["phase_durations"]:
             pd_frame = ctk.CTkFrame(inner, fg_color="transparent")
             pd_frame.pack(fill="x", pady=(8, 0))
-            ctk.CTkLabel(pd_frame, text="Phase Durations:", font=ctk.CTkFont(family="Consolas", size=12), text_color=COLORS["text_secondary"]).pack(anchor="w")
+            ctk.CTkLabel(pd_frame, text="Phase Durations:", font=cached_font(family="Consolas", size=12), text_color=COLORS["text_secondary"]).pack(anchor="w")
             for phase, dur in s["phase_durations"].items():
-                ctk.CTkLabel(pd_frame, text=f"  {phase:22s} {dur:.1f}s", font=ctk.CTkFont(family="Consolas", size=12), text_color=COLORS["text_muted"]).pack(anchor="w")
+                ctk.CTkLabel(pd_frame, text=f"  {phase:22s} {dur:.1f}s", font=cached_font(family="Consolas", size=12), text_color=COLORS["text_muted"]).pack(anchor="w")
 
         # Phase 7.3: actionable diagnostics — render the fields previously
         # only available in the Save-as-Text/JSON exports.
@@ -602,13 +684,13 @@ class DiagnosticsWindow(ctk.CTkToplevel):
             cache_frame.pack(fill="x", pady=(8, 0))
             ctk.CTkLabel(
                 cache_frame, text="Prompt Cache:",
-                font=ctk.CTkFont(family="Consolas", size=12),
+                font=cached_font(family="Consolas", size=12),
                 text_color=COLORS["text_secondary"],
             ).pack(side="left")
             ctk.CTkLabel(
                 cache_frame,
                 text=f"  created={cache_creation:,}  read={cache_read:,}",
-                font=ctk.CTkFont(family="Consolas", size=12),
+                font=cached_font(family="Consolas", size=12),
                 text_color=COLORS["text_muted"],
             ).pack(side="left")
 
@@ -619,7 +701,7 @@ class DiagnosticsWindow(ctk.CTkToplevel):
             evi_frame.pack(fill="x", pady=(4, 0))
             ctk.CTkLabel(
                 evi_frame, text="Verification Evidence:",
-                font=ctk.CTkFont(family="Consolas", size=12),
+                font=cached_font(family="Consolas", size=12),
                 text_color=COLORS["text_secondary"],
             ).pack(anchor="w")
             evi_pairs = [
@@ -637,7 +719,7 @@ class DiagnosticsWindow(ctk.CTkToplevel):
                     continue
                 ctk.CTkLabel(
                     evi_frame, text=f"  {label:18s} {val:>6}",
-                    font=ctk.CTkFont(family="Consolas", size=12),
+                    font=cached_font(family="Consolas", size=12),
                     text_color=COLORS["text_muted"],
                 ).pack(anchor="w")
 
@@ -648,13 +730,13 @@ class DiagnosticsWindow(ctk.CTkToplevel):
             fs_frame.pack(fill="x", pady=(8, 0))
             ctk.CTkLabel(
                 fs_frame, text="Specs:",
-                font=ctk.CTkFont(family="Consolas", size=12),
+                font=cached_font(family="Consolas", size=12),
                 text_color=COLORS["text_secondary"],
             ).pack(anchor="w")
             ctk.CTkLabel(
                 fs_frame,
                 text=f"  failed   ({len(failed)}): {', '.join(failed[:6])}{' ...' if len(failed) > 6 else ''}",
-                font=ctk.CTkFont(family="Consolas", size=12),
+                font=cached_font(family="Consolas", size=12),
                 text_color=COLORS["error"],
             ).pack(anchor="w")
 
@@ -670,7 +752,7 @@ class DiagnosticsWindow(ctk.CTkToplevel):
                     f"p50={ot.get('p50', 0):,}  p95={ot.get('p95', 0):,}  "
                     f"truncated={ot.get('truncated_calls', 0)}"
                 ),
-                font=ctk.CTkFont(family="Consolas", size=12),
+                font=cached_font(family="Consolas", size=12),
                 text_color=COLORS["text_secondary"],
             ).pack(anchor="w")
 
@@ -685,7 +767,7 @@ class DiagnosticsWindow(ctk.CTkToplevel):
                     f"max={sb.get('max_observed', 0)}  p50={sb.get('p50', 0)}  "
                     f"p95={sb.get('p95', 0)}  saturated={sb.get('saturated_calls', 0)}"
                 ),
-                font=ctk.CTkFont(family="Consolas", size=12),
+                font=cached_font(family="Consolas", size=12),
                 text_color=COLORS["text_secondary"],
             ).pack(anchor="w")
 
@@ -694,7 +776,7 @@ class DiagnosticsWindow(ctk.CTkToplevel):
             ctk.CTkLabel(
                 parent,
                 text=f"⚠ {dropped:,} events dropped (event cap)",
-                font=ctk.CTkFont(family="Consolas", size=12),
+                font=cached_font(family="Consolas", size=12),
                 text_color=COLORS["warning"],
             ).pack(anchor="w", pady=(4, 0))
         truncated = summary.get("events_truncated_by_size", 0)
@@ -702,7 +784,7 @@ class DiagnosticsWindow(ctk.CTkToplevel):
             ctk.CTkLabel(
                 parent,
                 text=f"⚠ {truncated:,} events truncated (per-event byte cap)",
-                font=ctk.CTkFont(family="Consolas", size=12),
+                font=cached_font(family="Consolas", size=12),
                 text_color=COLORS["warning"],
             ).pack(anchor="w", pady=(2, 0))
         secrets_red = summary.get("secrets_redacted", 0)
@@ -710,7 +792,7 @@ class DiagnosticsWindow(ctk.CTkToplevel):
             ctk.CTkLabel(
                 parent,
                 text=f"🔒 {secrets_red:,} secret-shaped values redacted",
-                font=ctk.CTkFont(family="Consolas", size=12),
+                font=cached_font(family="Consolas", size=12),
                 text_color=COLORS["text_secondary"],
             ).pack(anchor="w", pady=(2, 0))
 
@@ -722,29 +804,14 @@ class DiagnosticsWindow(ctk.CTkToplevel):
 
         ctk.CTkLabel(
             inner, text=f"EVENT TIMELINE  ({len(self._report.events)} events)",
-            font=ctk.CTkFont(family="Segoe UI", size=13, weight="bold"),
+            font=cached_font(family="Segoe UI", size=13, weight="bold"),
             text_color=COLORS["accent"],
         ).pack(anchor="w")
 
-        level_colors = {
-            "info": COLORS["text_secondary"],
-            "success": COLORS["success"],
-            "warning": COLORS["warning"],
-            "error": COLORS["error"],
-            "step": COLORS["accent"],
-        }
-        level_icons = {
-            "info": "  ",
-            "success": "+ ",
-            "warning": "! ",
-            "error": "X ",
-            "step": "> ",
-        }
-
         # Use a textbox for efficient rendering of many events
         textbox = ctk.CTkTextbox(
             inner, fg_color=COLORS["bg_input"], corner_radius=4,
-            font=ctk.CTkFont(family="Consolas", size=12),
+            font=cached_font(family="Consolas", size=12),
             text_color=COLORS["text_secondary"],
             wrap="word", state="disabled", activate_scrollbars=True,
             height=400,
@@ -752,28 +819,30 @@ class DiagnosticsWindow(ctk.CTkToplevel):
         textbox.pack(fill="x", pady=(8, 0))
 
         inner_text = textbox._textbox
-        for level, color in level_colors.items():
+        for level, color in LOG_COLORS.items():
             inner_text.tag_configure(level, foreground=color)
         inner_text.tag_configure("data_tag", foreground=COLORS["text_muted"])
         inner_text.tag_configure("phase_tag", foreground=COLORS["coordination"])
 
-        textbox.configure(state="normal")
+        # Collect (text, tags) pairs and hand them to Tk in one insert call;
+        # a Tcl round-trip per fragment dominates for long timelines.
+        chunks: list = []
         for i, e in enumerate(self._report.events):
             if i > 0:
-                inner_text.insert("end", "\n", ())
-            ts = datetime.fromtimestamp(e.timestamp).strftime("%H:%M:%S")
-            elapsed = f"{e.elapsed:7.1f}s"
-            icon = level_icons.get(e.level, "  ")
-            phase_str = f"[{e.phase}]" if e.phase else ""
-
-            inner_text.insert("end", f"{ts} {elapsed} ", ("info",))
-            inner_text.insert("end", icon, (e.level,))
-            if phase_str:
-                inner_text.insert("end", f"{phase_str:20s} ", ("phase_tag",))
-            inner_text.insert("end", e.message, (e.level,))
+                chunks += ("\n", ())
+            ts = time.strftime("%H:%M:%S", time.localtime(e.timestamp))
+            icon = _TIMELINE_LEVEL_ICONS.get(e.level, "  ")
+            chunks += (f"{ts} {e.elapsed:7.1f}s ", ("info",), icon, (e.level,))
+            if e.phase:
+                chunks += (f"{f'[{e.phase}]':20s} ", ("phase_tag",))
+            chunks += (e.message, (e.level,))
             if e.data:
                 for k, v in e.data.items():
-                    inner_text.insert("end", f"\n{'':38s}{k}: {v}", ("data_tag",))
+                    chunks += (f"\n{'':38s}{k}: {v}", ("data_tag",))
+
+        textbox.configure(state="normal")
+        if chunks:
+            inner_text.insert("end", *chunks)
         textbox.configure(state="disabled")
 
     # ------------------------------------------------------------------
@@ -15,9 +15,13 @@ Design notes:
       bytes only when the cheap stat-based key is ambiguous (mtime collision
       across writes within the same nanosecond — rare but easy to defeat by
       checking content hash).
-    * The cache is not persisted to disk. Crash recovery is handled by the
-      resume-state subsystem; mixing the two would force a sensitive-data
-      retention decision (Phase 6).
+    * The in-process cache is not persisted to disk. Crash recovery is
+      handled by the resume-state subsystem; mixing the two would force a
+      sensitive-data retention decision (Phase 6). A separate, opt-in disk
+      tier (``SPEC_CRITIC_EXTRACTION_CACHE_PERSIST=1``) keys extraction
+      results on a BLAKE2b hash of the full file bytes so reopening the same
+      project in a new session skips the DOCX parse. It stays off by default
+      because it writes spec text to the user's profile.
     * ``ExtractedSpec`` instances are mutable, so we deep-copy on hit to
       prevent a caller mutation (e.g. setting ``paragraph_map`` to ``None``
       for a derived view) from leaking into the next consumer.
@@ -25,14 +29,20 @@ Design notes:
 from __future__ import annotations
 
 import copy
+import dataclasses
 import hashlib
+import json
+import os
 import threading
 from collections import OrderedDict
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
-from .extractor import ExtractedSpec
+from .. import __version__
+from ..core.api_config import env_flag_enabled, env_megabytes, extraction_process_workers
+from ..core.json_store import prune_lru_dir, write_json_bytes
+from .extractor import ExtractedSpec, ParagraphMapping, _derive_document_id
 
 
 _DEFAULT_MAX_ENTRIES = 64
@@ -236,6 +246,155 @@ def cache_enabled() -> bool:
     return True
 
 
+# ---------------------------------------------------------------------------
+# Opt-in on-disk tier. Entries are JSON (never pickle: the directory is
+# user-writable, and unpickling it would be a code-execution vector) named
+# by the content digest, under a per-release directory so an extractor
+# change in a new version never serves stale text.
+# ---------------------------------------------------------------------------
+
+_DEFAULT_DISK_MAX_MB = 256
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def disk_cache_enabled() -> bool:
+    """Whether extraction results persist to disk between sessions.
+
+    Disabled by default. Set ``SPEC_CRITIC_EXTRACTION_CACHE_PERSIST=1`` to
+    opt in; the cached entries contain the extracted spec text.
+    """
+    return env_flag_enabled("SPEC_CRITIC_EXTRACTION_CACHE_PERSIST")
+
+
+def disk_cache_max_bytes() -> int:
+    """Size cap for the disk tier. ``SPEC_CRITIC_EXTRACTION_CACHE_MAX_MB``."""
+    return env_megabytes(
+        "SPEC_CRITIC_EXTRACTION_CACHE_MAX_MB", default=_DEFAULT_DISK_MAX_MB
+    )
+
+
+def default_disk_cache_dir() -> Path:
+    """Return the versioned on-disk cache directory.
+
+    Overridable via ``SPEC_CRITIC_EXTRACTION_CACHE_DIR``. The default is
+    ``~/.spec_critic/extraction_cache/v<version>``; the version suffix is
+    always appended so upgrades start from an empty namespace.
+    """
+    override = os.environ.get("SPEC_CRITIC_EXTRACTION_CACHE_DIR")
+    if override and override.strip():
+        base = Path(os.path.expandvars(os.path.expanduser(override.strip())))
+    else:
+        base = Path.home() / ".spec_critic" / "extraction_cache"
+    return base / f"v{__version__}"
+
+
+def _file_digest(path: Path) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(_HASH_CHUNK_BYTES), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class _DiskExtractionCache:
+    """Content-addressed JSON store for ``ExtractedSpec`` results.
+
+    Only the content-derived fields are trusted from disk: ``filename``,
+    ``source_path`` and ``document_id`` are re-derived from the requesting
+    path, so a renamed or copied file still hits. Every I/O or decode
+    failure degrades to a miss — the disk tier can never fail a run.
+    Eviction is least-recently-used by mtime (refreshed on every hit), run
+    after each write once the directory exceeds the size cap.
+    """
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self._root = root
+        self._max_bytes = int(max_bytes)
+
+    def digest(self, path: Path) -> str | None:
+        try:
+            return _file_digest(path)
+        except OSError:
+            return None
+
+    def get(self, path: Path, digest: str) -> Optional[ExtractedSpec]:
+        entry = self._root / f"{digest}.json"
+        try:
+            data = json.loads(entry.read_text(encoding="utf-8"))
+            raw_map = data.pop("paragraph_map", None)
+            spec = ExtractedSpec(
+                filename=path.name,
+                source_path=str(path),
+                document_id=_derive_document_id(path.name),
+                paragraph_map=(
+                    [ParagraphMapping(**m) for m in raw_map]
+                    if raw_map is not None
+                    else None
+                ),
+                **data,
+            )
+            os.utime(entry)
+        except (OSError, ValueError, TypeError):
+            return None
+        return spec
+
+    def put(self, digest: str, spec: ExtractedSpec) -> None:
+        data = dataclasses.asdict(spec)
+        for path_field in ("filename", "source_path", "document_id"):
+            data.pop(path_field, None)
+        try:
+            write_json_bytes(self._root / f"{digest}.json", data, ensure_ascii=False)
+        except OSError:
+            return
+        prune_lru_dir(self._root, self._max_bytes)
+
+
+def _disk_cache() -> _DiskExtractionCache | None:
+    if not disk_cache_enabled():
+        return None
+    return _DiskExtractionCache(default_disk_cache_dir(), disk_cache_max_bytes())
+
+
+def _extract_in_processes(
+    paths: list[Path], workers: int
+) -> dict[int, ExtractedSpec | BaseException] | None:
+    """Extract ``paths`` on a process pool; one outcome per position.
+
+    ``ExtractedSpec`` (and its ``ParagraphMapping`` list) is a plain
+    dataclass, so results pickle back cheaply relative to a DOCX parse.
+    Per-file extraction errors are captured as that position's outcome,
+    exactly like the thread path. Returns ``None`` when the pool itself
+    fails (spawn refused, a worker died) so the caller can retry on threads.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    from .extractor import extract_text
+
+    outcomes: dict[int, ExtractedSpec | BaseException] = {}
+    try:
+        # ``spawn`` everywhere: this runs on GUI / pipeline worker threads,
+        # and forking a multi-threaded process can deadlock the child.
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            futures = {
+                pool.submit(extract_text, path): position
+                for position, path in enumerate(paths)
+            }
+            for completed in as_completed(futures):
+                position = futures[completed]
+                try:
+                    outcomes[position] = completed.result()
+                except BrokenProcessPool:
+                    raise
+                except BaseException as exc:
+                    outcomes[position] = exc
+    except (BrokenProcessPool, OSError):
+        return None
+    return outcomes
+
+
 def extract_multiple_specs_cached(
     filepaths: list[Path],
     *,
@@ -292,24 +451,68 @@ def extract_multiple_specs_cached(
             return result[0]
 
         outcomes: dict[int, ExtractedSpec | BaseException] = {}
-        if workers == 1:
+        disk = _disk_cache()
+        digests: dict[int, str] = {}
+        if disk is not None:
             for position, (_idx, path, _key, _future) in enumerate(leaders):
-                try:
-                    outcomes[position] = extract_one(path)
-                except BaseException as exc:
-                    outcomes[position] = exc
-        else:
-            with ThreadPoolExecutor(max_workers=workers) as pool:
-                futures = {
-                    pool.submit(extract_one, path): position
-                    for position, (_idx, path, _key, _future) in enumerate(leaders)
-                }
-                for completed in as_completed(futures):
-                    position = futures[completed]
+                digest = disk.digest(path)
+                if digest is None:
+                    continue
+                digests[position] = digest
+                cached = disk.get(path, digest)
+                if cached is not None:
+                    outcomes[position] = cached
+        cold = [position for position in range(len(leaders)) if position not in outcomes]
+        workers = max(1, min(workers, len(cold))) if cold else 1
+
+        fresh: dict[int, ExtractedSpec | BaseException] | None = None
+        process_workers = extraction_process_workers(len(cold)) if workers > 1 else 0
+        if process_workers:
+            # Many cold files: parse in worker processes so the pure-Python
+            # python-docx tree walk scales past the GIL. ``None`` means the
+            # pool could not start or broke — fall through to threads.
+            by_index = _extract_in_processes(
+                [leaders[position][1] for position in cold], process_workers
+            )
+            if by_index is not None:
+                fresh = {cold[i]: outcome for i, outcome in by_index.items()}
+        if fresh is None:
+            fresh = {}
+            if workers == 1:
+                for position in cold:
                     try:
-                        outcomes[position] = completed.result()
+                        fresh[position] = extract_one(leaders[position][1])
                     except BaseException as exc:
-                        outcomes[position] = exc
+                        fresh[position] = exc
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = {
+                        pool.submit(extract_one, leaders[position][1]): position
+                        for position in cold
+                    }
+                    for completed in as_completed(futures):
+                        position = futures[completed]
+                        try:
+                            fresh[position] = completed.result()
+                        except BaseException as exc:
+                            fresh[position] = exc
+        if disk is not None:
+            for position, outcome in fresh.items():
+                key = leaders[position][2]
+                if position not in digests or key is None or isinstance(outcome, BaseException):
+                    continue
+                # A file saved mid-parse must not file the new text under the
+                # old bytes' digest. The identity key (stat + head/tail
+                # fingerprint) was taken before the digest read, so an
+                # unchanged key after the parse vouches for the digest without
+                # a second full pass over the file.
+                try:
+                    unchanged = _ExtractionCache._key(leaders[position][1]) == key
+                except OSError:
+                    unchanged = False
+                if unchanged:
+                    disk.put(digests[position], outcome)
+        outcomes.update(fresh)
 
         first_error: BaseException | None = None
         for position, (idx, path, key, future) in enumerate(leaders):
@@ -3,13 +3,40 @@ attachments (DOCX / PDF / Markdown / plain text)."""
 
 from pathlib import Path
 from dataclasses import dataclass, field
-from docx import Document
-from docx.opc.exceptions import PackageNotFoundError
-from docx.oxml import parse_xml
-from docx.oxml.ns import qn
-from docx.table import Table as DocxTable
+
+# python-docx (and lxml beneath it) is imported inside the functions that
+# parse a document. Importers that only need the dataclasses, the filename
+# predicate, or the extension sets — the GUI file picker, the pipeline's
+# folder discovery, the extraction cache — no longer pay for that import at
+# startup.
+
+# WordprocessingML namespace. ``qn`` is the Clark-notation expansion
+# ``docx.oxml.ns.qn`` performs, limited to the ``w:`` prefix (the only one
+# this module uses), so the module-level tag constants below need no import.
+_W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def qn(tag: str) -> str:
+    prefix, local = tag.split(":", 1)
+    if prefix != "w":
+        raise KeyError(prefix)
+    return f"{{{_W_NAMESPACE}}}{local}"
+
 
 SUPPORTED_EXTENSIONS = {".docx"}
+# ``str.endswith`` takes a tuple, so the spec-file test below is one C-level
+# call instead of a ``Path`` suffix parse or a glob pattern per file.
+_SPEC_SUFFIXES = tuple(sorted(SUPPORTED_EXTENSIONS))
+
+
+def is_spec_filename(name: str) -> bool:
+    """True for a reviewable spec file name (not a Word ``~$`` lock file).
+
+    The single "is this a real .docx spec" test shared by folder discovery
+    (``pipeline._get_spec_files``) and the GUI selection filter, so the two
+    can never disagree about lock files or suffix case.
+    """
+    return name.lower().endswith(_SPEC_SUFFIXES) and not name.startswith("~$")
 
 # Project-context attachments are reviewed as background reference material
 # (not edited by the spec pipeline), so several read-only formats are accepted
@@ -280,6 +307,8 @@ def _collect_note_mappings(
     note_part = _find_part_by_content_type(doc_part, content_type)
     if note_part is None:
         return []
+    from docx.oxml import parse_xml
+
     try:
         root = parse_xml(note_part.blob)
     except Exception:
@@ -422,14 +451,67 @@ def _accept_all_paragraph_text(p_el) -> str:
     return "".join(parts)
 
 
-def _accept_all_cell_text(cell) -> str:
-    """Accept-All text for a whole table cell.
+_W_P = qn("w:p")
+_W_TR = qn("w:tr")
+_W_TC = qn("w:tc")
+_W_TR_PR = qn("w:trPr")
+_W_TC_PR = qn("w:tcPr")
+_W_GRID_BEFORE = qn("w:gridBefore")
+_W_GRID_SPAN = qn("w:gridSpan")
+_W_V_MERGE = qn("w:vMerge")
+_W_VAL = qn("w:val")
+
+
+def _decimal_property(props, tag: str, default: int) -> int:
+    """``props/<tag>/@w:val`` as an int, ``default`` when either is absent."""
+    if props is None:
+        return default
+    el = props.find(tag)
+    return default if el is None else int(el.get(_W_VAL))
 
-    Matches python-docx ``_Cell.text`` (its paragraphs joined by newlines, not
-    descending into nested tables) but resolves each paragraph through the
-    revision-aware walk.
+
+def _table_row_texts(tbl) -> list[list[str]]:
+    """Accept-All cell texts for each row of a ``<w:tbl>`` element.
+
+    Mirrors python-docx ``_Row.cells`` + ``_Cell.text`` read straight off
+    the XML: a cell spanning N grid columns repeats N times, and a
+    ``vMerge="continue"`` cell repeats the text of the cell that starts the
+    vertical span. python-docx resolves each continuation with XPath
+    sibling walks and rebuilds a proxy per grid position; here the span
+    roots of the previous row are kept by grid offset and each ``<w:tc>``
+    is rendered once. Empty cells are dropped, as the caller always did.
     """
-    return "\n".join(_accept_all_paragraph_text(p._p) for p in cell.paragraphs)
+    rows: list[list[str]] = []
+    rendered: dict = {}  # content tc -> (stripped text, grid span)
+    above: dict[int, object] = {}  # grid offset -> content tc, previous row
+    for tr in tbl.iterchildren(_W_TR):
+        offset = _decimal_property(tr.find(_W_TR_PR), _W_GRID_BEFORE, 0)
+        current: dict[int, object] = {}
+        row_text: list[str] = []
+        for tc in tr.iterchildren(_W_TC):
+            tc_pr = tc.find(_W_TC_PR)
+            content_tc = tc
+            v_merge = tc_pr.find(_W_V_MERGE) if tc_pr is not None else None
+            if v_merge is not None and v_merge.get(_W_VAL, "continue") == "continue":
+                content_tc = above.get(offset)
+                if content_tc is None:
+                    raise ValueError(
+                        f"no tc at grid offset {offset} in the row above a merged cell"
+                    )
+            current[offset] = content_tc
+            entry = rendered.get(content_tc)
+            if entry is None:
+                text = "\n".join(
+                    _accept_all_paragraph_text(p) for p in content_tc.iterchildren(_W_P)
+                ).strip()
+                span = _decimal_property(content_tc.find(_W_TC_PR), _W_GRID_SPAN, 1)
+                entry = rendered[content_tc] = (text, span)
+            if entry[0]:
+                row_text.extend([entry[0]] * entry[1])
+            offset += _decimal_property(tc_pr, _W_GRID_SPAN, 1)
+        rows.append(row_text)
+        above = current
+    return rows
 
 
 def _element_has_tracked_changes(el) -> bool:
@@ -457,6 +539,8 @@ def _document_has_tracked_changes(doc) -> bool:
         for container in (section.header, section.footer):
             if any(_element_has_tracked_changes(p._p) for p in container.paragraphs):
                 return True
+    from docx.oxml import parse_xml
+
     for content_type in (_FOOTNOTES_CONTENT_TYPE, _ENDNOTES_CONTENT_TYPE):
         note_part = _find_part_by_content_type(doc.part, content_type)
         if note_part is None:
@@ -471,13 +555,29 @@ def _document_has_tracked_changes(doc) -> bool:
 
 
 def extract_text_from_docx(filepath: Path) -> ExtractedSpec:
-    if not filepath.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
+    # No up-front ``exists()``: reading the file is the existence check, so
+    # the happy path costs no extra ``stat``. The package is read in one
+    # ``read_bytes`` and parsed from memory: handed a path, python-docx
+    # probes the file with ``is_zipfile`` and then seeks/reads every ZIP
+    # member through a small-buffered handle — slow on network shares,
+    # where project spec folders often live.
     if filepath.suffix.lower() != ".docx":
         raise ValueError(f"Not a .docx file: {filepath}")
+    import io
+    import zipfile
+
+    from docx import Document
+    from docx.opc.exceptions import PackageNotFoundError
+
+    try:
+        data = filepath.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filepath}")
+    except OSError as e:
+        raise ValueError(f"Could not read .docx file: {filepath} — {e}")
     try:
-        doc = Document(filepath)
-    except PackageNotFoundError:
+        doc = Document(io.BytesIO(data))
+    except (zipfile.BadZipFile, PackageNotFoundError):
         raise ValueError(f"Invalid or corrupted .docx file: {filepath}")
     except Exception as e:
         raise ValueError(f"Could not read .docx file: {filepath} — {e}")
@@ -511,13 +611,7 @@ def extract_text_from_docx(filepath: Path) -> ExtractedSpec:
                     )
                 )
         elif child.tag.endswith("}tbl"):
-            table = DocxTable(child, doc)
-            for row_index, row in enumerate(table.rows):
-                row_text = [
-                    cell_text
-                    for cell in row.cells
-                    if (cell_text := _accept_all_cell_text(cell).strip())
-                ]
+            for row_index, row_text in enumerate(_table_row_texts(child)):
                 if row_text:
                     joined_text = " | ".join(row_text)
                     paragraphs.append(joined_text)
@@ -613,8 +707,13 @@ def extract_text_from_docx(filepath: Path) -> ExtractedSpec:
     )
 
     content = "\n\n".join(paragraphs)
-    reconstructed = "\n\n".join(m.text for m in paragraph_map)
-    if reconstructed != content:
+    # The map must reconstruct ``content`` exactly. Both lists are built in
+    # lockstep, so compare them element-wise (mostly identity hits) rather
+    # than joining a second full-document string just to compare it.
+    if len(paragraph_map) != len(paragraphs) or any(
+        m.text != text for m, text in zip(paragraph_map, paragraphs)
+    ):
+        reconstructed = "\n\n".join(m.text for m in paragraph_map)
         # Controlled error preserves context (audit Issue 10). The raw assert
         # version was stripped under -O and produced an opaque AssertionError.
         raise ValueError(
@@ -642,7 +741,10 @@ def extract_text_from_docx(filepath: Path) -> ExtractedSpec:
     return ExtractedSpec(
         filename=filepath.name,
         content=content,
-        word_count=len(content.split()),
+        # Words never span the "\n\n" joins, so counting per paragraph
+        # equals ``len(content.split())`` without materializing one list
+        # holding every word of the document.
+        word_count=sum(map(len, map(str.split, paragraphs))),
         source_path=str(filepath),
         source_format="docx",
         paragraph_map=paragraph_map,
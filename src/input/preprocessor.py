@@ -26,11 +26,16 @@ Usage:
 """
 from __future__ import annotations
 
+import copy
+import hashlib
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from functools import lru_cache
+from functools import lru_cache, partial
 from typing import Iterable, Optional
 
+from ..core.api_config import preprocess_process_workers
 from ..core.code_cycles import CodeCycle
 from ..modules import DetectorVocabulary, module_for_cycle
 
@@ -141,6 +146,141 @@ PLACEHOLDER_PATTERNS: list[tuple[str, str]] = [
 # -----------------------------------------------------------------------------
 # Detection Functions
 # -----------------------------------------------------------------------------
+_QUANTIFIER_CHARS = frozenset("?*+{")
+# ``re`` IGNORECASE pairs these with ASCII "i" although their casefold does
+# not reduce to it; mapped first so the folded-text check stays exact.
+_DOTTED_I_FOLD = {0x130: "i", 0x131: "i"}
+
+
+def _casefold_for_scan(content: str) -> str:
+    """Casefolded ``content`` for the IGNORECASE literal checks.
+
+    :func:`preprocess_spec` folds once and hands the copy to the LEED,
+    placeholder and template-marker tables via ``folded=``.
+    """
+    return content.translate(_DOTTED_I_FOLD).casefold()
+
+
+def _required_literal(pattern: str) -> str:
+    """Longest plain-text run every match of ``pattern`` must contain.
+
+    Only top-level, unquantified runs of letters, digits and spaces count;
+    anything inside a group, a character class, a ``{m,n}`` bound or an
+    escape is skipped, and a top-level ``|`` or verbose mode yields ``""``
+    (no prefilter). Conservative by design: a missed literal only costs a
+    regex pass, never a missed match.
+    """
+    if pattern.startswith("(?") and ")" in pattern:
+        flags = pattern[2:pattern.index(")")]
+        if flags.isalpha():
+            if "x" in flags:
+                return ""
+            pattern = pattern[len(flags) + 3:]
+    best, run, depth, i = "", "", 0, 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch.isascii() and (ch.isalnum() or ch == " "):
+            nxt = pattern[i + 1] if i + 1 < len(pattern) else ""
+            if depth == 0 and nxt not in _QUANTIFIER_CHARS:
+                run += ch
+                i += 1
+                continue
+        if len(run) > len(best):
+            best = run
+        run = ""
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "[":
+            i += 2 if pattern[i + 1:i + 2] == "]" else 1
+            if pattern[i:i + 2] == "^]":
+                i += 2
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+        elif ch == "{":
+            while i < len(pattern) and pattern[i] != "}":
+                i += 1
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            return ""
+        i += 1
+    if len(run) > len(best):
+        best = run
+    return best
+
+
+def _literal_leads_match(pattern: str, literal: str) -> bool:
+    """Whether every match of ``pattern`` starts with ``literal``.
+
+    True when the pattern, past its inline flags and any leading ``\\b``,
+    begins with the literal itself — the match then starts exactly where
+    an occurrence of the literal does.
+    """
+    if not literal:
+        return False
+    if pattern.startswith("(?") and ")" in pattern:
+        flags = pattern[2:pattern.index(")")]
+        if flags.isalpha():
+            pattern = pattern[len(flags) + 3:]
+    while pattern.startswith("\\b"):
+        pattern = pattern[2:]
+    return pattern.startswith(literal)
+
+
+def _iter_literal_led(
+    pattern: re.Pattern, literal: str, content: str, haystack: str
+):
+    """``pattern.finditer(content)`` driven by ``str.find`` on ``literal``.
+
+    ``haystack`` is ``content`` itself or its position-aligned casefold.
+    Every match starts at an occurrence of ``literal``, so anchoring the
+    regex at each occurrence (left to right, skipping any inside the
+    previous match) yields exactly the ``finditer`` sequence while the scan
+    between occurrences runs in C. This matters for IGNORECASE patterns,
+    which ``re`` otherwise tries at every position.
+    """
+    pos = haystack.find(literal)
+    while pos != -1:
+        match = pattern.match(content, pos)
+        if match is not None:
+            yield match
+            pos = max(match.end(), pos + 1)
+        else:
+            pos += 1
+        pos = haystack.find(literal, pos)
+
+
+@lru_cache(maxsize=32)
+def _compiled_patterns(
+    patterns: tuple[tuple[str, str], ...],
+) -> tuple[tuple[re.Pattern, str, str, bool], ...]:
+    """Compile a detector table once; invalid patterns are dropped.
+
+    Each entry carries its required literal (casefolded for IGNORECASE
+    patterns) so a pattern whose literal is absent from the text is skipped
+    without a regex pass, and whether that literal leads every match (see
+    :func:`_iter_literal_led`). Each pattern keeps its own pass: a single
+    alternation over the table loses ``re``'s per-pattern literal-prefix
+    scan and measured slower on spec-sized text, and it would also change
+    which overlapping span wins.
+    """
+    compiled: list[tuple[re.Pattern, str, str, bool]] = []
+    for pattern, description in patterns:
+        try:
+            regex = re.compile(pattern)
+        except re.error:
+            continue
+        literal = _required_literal(pattern)
+        leads = _literal_leads_match(pattern, literal)
+        if regex.flags & re.IGNORECASE:
+            literal = literal.casefold()
+        compiled.append((regex, description, literal, leads))
+    return tuple(compiled)
+
+
 def _find_matches(
     patterns: Iterable[tuple[str, str]],
     content: str,
@@ -148,6 +288,7 @@ def _find_matches(
     max_matches: int,
     *,
     rule_id: str = "",
+    folded: Optional[str] = None,
 ) -> list[dict]:
     """Find all matches for a set of regex patterns in content.
 
@@ -159,41 +300,63 @@ def _find_matches(
     Every alert is stamped with ``deterministic_rule = rule_id`` so
     downstream consumers can branch on the rule without keyword-sniffing
     the human-readable ``type`` string.
+
+    ``folded`` is the precomputed :func:`_casefold_for_scan` of ``content``;
+    when omitted it is computed on first need.
     """
     alerts: list[dict] = []
     seen_spans: list[tuple[int, int]] = []
-    for pattern, description in patterns:
-        try:
-            for match in re.finditer(pattern, content):
-                m_start, m_end = match.start(), match.end()
-                # Skip if this span overlaps with an already-seen span
-                if any(s <= m_start and m_end <= e for s, e in seen_spans):
-                    continue
-                seen_spans.append((m_start, m_end))
-
-                ctx_start = max(0, m_start - 60)
-                ctx_end = min(len(content), m_end + 60)
-                ctx = content[ctx_start:ctx_end].replace("\n", " ").strip()
-
-                alerts.append(
-                    {
-                        "filename": filename,
-                        "type": description,
-                        "match": match.group(0),
-                        "context": ctx,
-                        "position": m_start,
-                        "deterministic_rule": rule_id,
-                    }
-                )
-
-                if len(alerts) >= max_matches:
-                    return alerts
-        except re.error:
-            continue
+    alerts_append = alerts.append
+    seen_spans_append = seen_spans.append
+    for pattern, description, literal, leads in _compiled_patterns(tuple(patterns)):
+        haystack = content
+        if literal:
+            if pattern.flags & re.IGNORECASE:
+                if folded is None:
+                    folded = _casefold_for_scan(content)
+                haystack = folded
+            if literal not in haystack:
+                continue
+        # Folding can lengthen text ("ß" -> "ss"); offsets then no longer
+        # line up with ``content`` and the plain regex scan is used.
+        if leads and len(haystack) == len(content):
+            matches = _iter_literal_led(pattern, literal, content, haystack)
+        else:
+            matches = pattern.finditer(content)
+        for match in matches:
+            m_start, m_end = match.span()
+            # Skip if this span overlaps with an already-seen span
+            if any(s <= m_start and m_end <= e for s, e in seen_spans):
+                continue
+            seen_spans_append((m_start, m_end))
+
+            # Slicing clamps the end at ``len(content)`` on its own.
+            ctx_start = m_start - 60 if m_start > 60 else 0
+            ctx = content[ctx_start:m_end + 60].replace("\n", " ").strip()
+
+            alerts_append(
+                {
+                    "filename": filename,
+                    "type": description,
+                    "match": match[0],
+                    "context": ctx,
+                    "position": m_start,
+                    "deterministic_rule": rule_id,
+                }
+            )
+
+            if len(alerts) >= max_matches:
+                return alerts
     return alerts
 
 
-def detect_leed_references(content: str, filename: str, max_matches: int = 50) -> list[dict]:
+def detect_leed_references(
+    content: str,
+    filename: str,
+    max_matches: int = 50,
+    *,
+    folded: Optional[str] = None,
+) -> list[dict]:
     """Detect LEED-related references in spec content."""
     return _find_matches(
         LEED_PATTERNS,
@@ -201,10 +364,17 @@ def detect_leed_references(content: str, filename: str, max_matches: int = 50) -
         filename,
         max_matches=max_matches,
         rule_id=DETERMINISTIC_RULE_LEED,
+        folded=folded,
     )
 
 
-def detect_placeholders(content: str, filename: str, max_matches: int = 200) -> list[dict]:
+def detect_placeholders(
+    content: str,
+    filename: str,
+    max_matches: int = 200,
+    *,
+    folded: Optional[str] = None,
+) -> list[dict]:
     """Detect unresolved placeholders and editorial markers in spec content."""
     return _find_matches(
         PLACEHOLDER_PATTERNS,
@@ -212,6 +382,7 @@ def detect_placeholders(content: str, filename: str, max_matches: int = 200) ->
         filename,
         max_matches=max_matches,
         rule_id=DETERMINISTIC_RULE_PLACEHOLDER,
+        folded=folded,
     )
 
 
@@ -493,6 +664,7 @@ def detect_empty_sections(
     filename: str,
     *,
     max_matches: int = 50,
+    headings: Optional[list[tuple[str, str, int, int]]] = None,
 ) -> list[dict]:
     """Flag numbered headings whose body content is empty or whitespace.
 
@@ -500,8 +672,13 @@ def detect_empty_sections(
     document) with no body paragraph between them. This catches templated
     DSA specs where an editor deleted the body without removing the
     heading scaffold.
+
+    ``headings`` is a precomputed ``list(_iter_section_headings(content))``
+    so :func:`preprocess_spec` scans the headings once for both structural
+    detectors.
     """
-    headings = list(_iter_section_headings(content))
+    if headings is None:
+        headings = list(_iter_section_headings(content))
     if not headings:
         return []
     alerts: list[dict] = []
@@ -534,15 +711,19 @@ def detect_duplicate_headings(
     filename: str,
     *,
     max_matches: int = 50,
+    headings: Optional[list[tuple[str, str, int, int]]] = None,
 ) -> list[dict]:
     """Flag the same section number appearing more than once.
 
     DSA specs occasionally end up with a second copy of section ``2.01`` after
     a copy/paste edit. The reviewer can still flag it, but catching it
     locally avoids paying tokens for a deterministic structural mistake.
+    ``headings`` is as for :func:`detect_empty_sections`.
     """
+    if headings is None:
+        headings = _iter_section_headings(content)
     counts: dict[str, list[tuple[str, int]]] = {}
-    for number, title, h_start, _ in _iter_section_headings(content):
+    for number, title, h_start, _ in headings:
         counts.setdefault(number, []).append((title, h_start))
 
     alerts: list[dict] = []
@@ -658,6 +839,7 @@ def detect_unresolved_template_markers(
     filename: str,
     *,
     max_matches: int = 200,
+    folded: Optional[str] = None,
 ) -> list[dict]:
     """Flag editorial / template markers missed by ``detect_placeholders``.
 
@@ -672,6 +854,7 @@ def detect_unresolved_template_markers(
         filename,
         max_matches=max_matches,
         rule_id=DETERMINISTIC_RULE_TEMPLATE_MARKER,
+        folded=folded,
     )
 
 
@@ -909,22 +1092,164 @@ def preprocess_spec(
     code_cycle_alerts: list[dict] = []
     if cycle is not None:
         code_cycle_alerts = detect_stale_code_cycle_references(content, filename, cycle)
+    headings = list(_iter_section_headings(content))
     structural_alerts = (
-        detect_empty_sections(content, filename)
-        + detect_duplicate_headings(content, filename)
+        detect_empty_sections(content, filename, headings=headings)
+        + detect_duplicate_headings(content, filename, headings=headings)
     )
+    # One fold shared by the three literal-prefiltered tables below.
+    folded = _casefold_for_scan(content)
     leed_alerts: list[dict] = []
     if vocabulary.flag_leed_references:
-        leed_alerts = detect_leed_references(content, filename)
+        leed_alerts = detect_leed_references(content, filename, folded=folded)
     return PreprocessResult(
         leed_alerts=leed_alerts,
-        placeholder_alerts=detect_placeholders(content, filename),
+        placeholder_alerts=detect_placeholders(content, filename, folded=folded),
         code_cycle_alerts=code_cycle_alerts,
         structural_alerts=structural_alerts,
-        template_marker_alerts=detect_unresolved_template_markers(content, filename),
+        template_marker_alerts=detect_unresolved_template_markers(
+            content, filename, folded=folded
+        ),
         invalid_code_cycle_alerts=detect_invalid_code_cycle_strings(
             content, filename, vocabulary=vocabulary
         ),
         duplicate_paragraph_alerts=detect_duplicate_paragraphs(content, filename),
         polity_alerts=polity_alerts,
     )
+
+
+# Process-local memo for :func:`preprocess_specs`. The detector passes are
+# deterministic in ``(content, filename, cycle, profile_country)``, so a
+# re-run over unchanged specs in the same session (resubmitting after an
+# option toggle, the repair batch) skips the regex scans. Keyed on a BLAKE2b
+# digest rather than the text so the memo does not pin spec content; kept
+# in memory only, like the extraction cache, so no alert context is written
+# to disk.
+_RESULT_CACHE_MAX_ENTRIES = 256
+_result_cache: "OrderedDict[tuple, PreprocessResult]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def _result_cache_key(
+    content: str,
+    filename: str,
+    cycle: Optional[CodeCycle],
+    profile_country: str | None,
+) -> tuple:
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+    return (digest, filename, cycle, profile_country)
+
+
+def clear_preprocess_cache() -> None:
+    """Drop every memoized :func:`preprocess_specs` result."""
+    with _result_cache_lock:
+        _result_cache.clear()
+
+
+def _warm_worker() -> None:
+    """No-op pool task; unpickling it imports this module in a fresh worker."""
+
+
+def start_preprocess_pool(spec_count: int):
+    """Start and warm the preprocess process pool ahead of need, or ``None``.
+
+    ``spawn`` workers pay interpreter start-up plus this module's import
+    (the module registry and its compiled detector vocabularies) before the
+    first spec is scanned. The pipeline starts the pool before extracting
+    text, so that cost overlaps the DOCX parse instead of following it.
+    Sized exactly as :func:`preprocess_specs` would size it (``None`` below
+    the automatic threshold or when the pool cannot start). Hand the result
+    to :func:`preprocess_specs`, which shuts it down.
+    """
+    workers = preprocess_process_workers(spec_count)
+    if not workers:
+        return None
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        ctx = multiprocessing.get_context("spawn")
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+        for _ in range(workers):
+            pool.submit(_warm_worker)
+    except (RuntimeError, OSError):
+        return None
+    return pool
+
+
+def preprocess_specs(
+    items: list[tuple[str, str]],
+    *,
+    cycle: Optional[CodeCycle] = None,
+    profile_country: str | None = None,
+    pool=None,
+) -> list[PreprocessResult]:
+    """Run :func:`preprocess_spec` over ``(content, filename)`` pairs, in order.
+
+    Large projects fan out over a ``spawn`` process pool sized by
+    ``api_config.preprocess_process_workers`` — the detectors are pure-Python
+    regex passes, so threads would serialize on the GIL. Small projects (and
+    any pool failure: spawn refused, a worker died) run serially in-process,
+    which is also the historical behavior. Detector exceptions propagate
+    exactly as they would from the serial loop.
+
+    ``pool`` is an executor from :func:`start_preprocess_pool`; it is used
+    whatever the item count and always shut down before returning.
+
+    Results are memoized per content digest, filename, cycle and profile
+    country; only specs missing from the memo are scanned. Hits are deep
+    copies, so callers may mutate the returned alert lists freely.
+    """
+    keys = [
+        _result_cache_key(content, filename, cycle, profile_country)
+        for content, filename in items
+    ]
+    results: list[Optional[PreprocessResult]] = [None] * len(items)
+    with _result_cache_lock:
+        for i, key in enumerate(keys):
+            cached = _result_cache.get(key)
+            if cached is not None:
+                _result_cache.move_to_end(key)
+                results[i] = copy.deepcopy(cached)
+    misses = [i for i, result in enumerate(results) if result is None]
+    if not misses and pool is not None:
+        # Everything was memoized: the warm-up tasks are the only work queued.
+        pool.shutdown(wait=False, cancel_futures=True)
+        pool = None
+    run_one = partial(preprocess_spec, cycle=cycle, profile_country=profile_country)
+    fresh = _run_preprocess([items[i] for i in misses], run_one, pool) if misses else []
+    with _result_cache_lock:
+        for i, result in zip(misses, fresh):
+            results[i] = result
+            _result_cache[keys[i]] = copy.deepcopy(result)
+            _result_cache.move_to_end(keys[i])
+        while len(_result_cache) > _RESULT_CACHE_MAX_ENTRIES:
+            _result_cache.popitem(last=False)
+    return [result for result in results if result is not None]
+
+
+def _run_preprocess(
+    items: list[tuple[str, str]], run_one, pool
+) -> list[PreprocessResult]:
+    """Scan ``items`` on ``pool``, a fresh process pool, or in-process."""
+    from concurrent.futures.process import BrokenProcessPool
+
+    contents = [content for content, _ in items]
+    filenames = [filename for _, filename in items]
+    if pool is not None:
+        try:
+            with pool:
+                return list(pool.map(run_one, contents, filenames))
+        except (BrokenProcessPool, OSError):
+            pass
+    elif workers := preprocess_process_workers(len(items)):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        try:
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+                return list(pool.map(run_one, contents, filenames))
+        except (BrokenProcessPool, OSError):
+            pass
+    return [run_one(content, filename) for content, filename in items]
@@ -39,6 +39,7 @@ from typing import Any
 
 from ..core.api_config import REVIEW_MODEL_DEFAULT
 from ..core.code_cycles import DEFAULT_CYCLE
+from ..core.json_store import write_json_bytes
 from ..modules import DEFAULT_MODULE, ReviewModule, require_module
 from ..programs import SpecAssignment, require_program
 from .program_pipeline import ProgramSubmission
@@ -284,10 +285,9 @@ def save_pending_batch(pending: PendingBatch, *, path: Path | None = None) -> No
     """Atomically persist ``pending``. Best-effort: never raise on I/O error."""
     target = path or pending_batch_path()
     try:
-        target.parent.mkdir(parents=True, exist_ok=True)
-        tmp = target.with_suffix(".tmp")
-        tmp.write_text(json.dumps(asdict(pending), indent=2), encoding="utf-8")
-        tmp.replace(target)  # atomic rename so a crash mid-write can't truncate
+        # The manifest carries the full project context and is machine-read
+        # only, so it takes the compact path.
+        write_json_bytes(target, asdict(pending))
     except OSError:
         pass
 
@@ -298,10 +298,7 @@ def save_pending_program_run(
     """Atomically persist a routed program manifest. Best-effort."""
     target = path or pending_batch_path()
     try:
-        target.parent.mkdir(parents=True, exist_ok=True)
-        tmp = target.with_suffix(".tmp")
-        tmp.write_text(json.dumps(asdict(pending), indent=2), encoding="utf-8")
-        tmp.replace(target)
+        write_json_bytes(target, asdict(pending))
     except OSError:
         pass
 
@@ -55,6 +55,15 @@ _SECRET_VALUE_PATTERNS = (
 )
 _REDACTED = "<redacted>"
 
+# Single-character level markers for the plain-text timeline in ``to_text``.
+_TEXT_LEVEL_ICONS = {
+    "info": " ",
+    "success": "+",
+    "warning": "!",
+    "error": "X",
+    "step": ">",
+}
+
 
 def _synchronized(method):
     """Serialize access to a report's mutable in-memory state.
@@ -1076,15 +1085,8 @@ class DiagnosticsReport:
         # Timeline
         lines.append("EVENT TIMELINE")
         lines.append("-" * 72)
-        level_icons = {
-            "info": " ",
-            "success": "+",
-            "warning": "!",
-            "error": "X",
-            "step": ">",
-        }
         for e in self.events:
-            icon = level_icons.get(e.level, " ")
+            icon = _TEXT_LEVEL_ICONS.get(e.level, " ")
             ts = datetime.fromtimestamp(e.timestamp).strftime("%H:%M:%S")
             elapsed = f"{e.elapsed:8.2f}s"
             phase_tag = f"[{e.phase}]" if e.phase else ""
@@ -3,25 +3,27 @@
 from __future__ import annotations
 
 import hashlib
+import os
 import re
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import nullcontext
 from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
 from typing import Callable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..drawing_impact import DrawingImpactResult
 
-from ..input.extractor import ExtractedSpec, SUPPORTED_EXTENSIONS
+from ..input.extractor import ExtractedSpec, is_spec_filename
 from ..input.extraction_cache import (
     cache_token_count,
     extract_multiple_specs_cached,
     extraction_cache_stats,
     get_cached_token_count,
 )
-from ..input.preprocessor import preprocess_spec, detect_inconsistent_file_naming
+from ..input.preprocessor import preprocess_specs, start_preprocess_pool, detect_inconsistent_file_naming
 from ..core.tokenizer import (
     RECOMMENDED_MAX,
     count_tokens_via_api,
@@ -40,7 +42,11 @@ from ..review.review_request_builder import (
 from ..review.realtime_review import REALTIME_JOB_SENTINEL, run_realtime_review
 from ..batch.batch import BatchJob, submit_review_batch, retrieve_review_results
 from ..batch.batch_runtime import DEFAULT_REVIEW_POLL_POLICY, poll_batch_bounded
-from ..core.api_config import REVIEW_MODEL_DEFAULT, token_count_preflight_enabled
+from ..core.api_config import (
+    REVIEW_MODEL_DEFAULT,
+    skip_duplicate_specs_enabled,
+    token_count_preflight_enabled,
+)
 from ..verification.verifier import (
     VerificationResult,
     start_verification_batch,
@@ -190,6 +196,11 @@ class PipelineResult:
     # render the warning text inline in a future enhancement without
     # threading new fields through.
     extracted_specs: list[ExtractedSpec] = field(default_factory=list)
+    # ``{skipped_file: reviewed_file}`` for selected files whose extracted
+    # text was identical to an earlier spec and so were not reviewed on their
+    # own. The report lists them under Files Reviewed so a skipped copy is
+    # never silently missing. Empty when nothing was skipped.
+    duplicate_spec_aliases: dict[str, str] = field(default_factory=dict)
 
 
 @dataclass
@@ -223,6 +234,9 @@ class CollectedBatchState:
     duplicate_paragraph_alerts: list[dict] = field(default_factory=list)
     # Wrong-polity token alerts (WS-4, D-15). Empty on profile-less runs.
     polity_alerts: list[dict] = field(default_factory=list)
+    # ``{skipped_file: reviewed_file}`` for identical-text copies (see
+    # ``PipelineResult.duplicate_spec_aliases``).
+    duplicate_spec_aliases: dict[str, str] = field(default_factory=dict)
     # Tracing: the pipeline span_id carries the batch-mode root span across
     # the separate function calls (submit, poll, collect, cross-check,
     # verify, finalize). Default empty string when tracing was disabled at
@@ -231,10 +245,15 @@ class CollectedBatchState:
 
 
 def _get_spec_files(input_dir: Path) -> list[Path]:
-    files = []
-    for ext in SUPPORTED_EXTENSIONS:
-        files.extend(input_dir.glob(f"*{ext}"))
-    return sorted([p for p in files if not p.name.startswith("~$")], key=lambda p: p.name.lower())
+    # One ``os.scandir`` pass instead of a ``Path.glob`` per extension: the
+    # name test is ``is_spec_filename`` (plain string checks, no fnmatch
+    # pattern compiled per call; drops Word ``~$`` lock files), and the sort
+    # key is the lowercased entry name — ``Path`` objects are only built for
+    # the survivors, never compared part-by-part.
+    with os.scandir(input_dir) as it:
+        entries = [e for e in it if is_spec_filename(e.name) and e.is_file()]
+    entries.sort(key=lambda e: e.name.lower())
+    return [Path(e.path) for e in entries]
 
 
 # ---------------------------------------------------------------------------
@@ -583,6 +602,9 @@ class _PreparedSpecs:
     # wide ``inconsistent_filename`` rule is still surfaced because each
     # alert is tagged with the offending filename.
     pre_detected_by_filename: dict[str, list[dict]] = field(default_factory=dict)
+    # ``{skipped_file: reviewed_file}`` for specs dropped because their
+    # extracted text matched an earlier spec's.
+    duplicate_spec_aliases: dict[str, str] = field(default_factory=dict)
 
 
 # How many specs we exact-count before falling back to a top-K selection.
@@ -600,6 +622,7 @@ def _run_exact_token_preflight(
     *,
     model: str,
     log: LogFn,
+    local_estimates: list[int] | None = None,
 ) -> None:
     """Validate each request fits under :data:`RECOMMENDED_MAX` with exact counts.
 
@@ -620,25 +643,32 @@ def _run_exact_token_preflight(
     maximum. ``count_tokens_via_api`` returning ``None`` (preflight
     disabled, missing key, SDK mismatch) is treated as "preflight
     unavailable" — the local gate is the fallback authority.
+
+    ``local_estimates`` (parallel to ``request_specs``) lets the caller
+    share one local tokenization pass between the ranking, the log line,
+    and its own local gate; computed here when omitted.
     """
     if not request_specs:
         return
+    if local_estimates is None:
+        local_estimates = [estimate_local_request_tokens(rs) for rs in request_specs]
 
     if len(request_specs) <= _PREFLIGHT_EXACT_COUNT_ALL_THRESHOLD:
-        candidates = list(request_specs)
+        candidate_idx = list(range(len(request_specs)))
     else:
         # Rank by the FULL local request shape (system + user_message
         # including pre_detected alerts). Reordering files cannot cause a
         # smaller raw spec to bypass exact-count when its alert block
         # makes the real request larger.
         scored = sorted(
-            ((estimate_local_request_tokens(rs), idx, rs) for idx, rs in enumerate(request_specs)),
-            key=lambda triple: triple[0],
+            range(len(request_specs)),
+            key=lambda idx: local_estimates[idx],
             reverse=True,
         )
-        candidates = [rs for _, _, rs in scored[:_PREFLIGHT_EXACT_COUNT_TOP_K]]
+        candidate_idx = scored[:_PREFLIGHT_EXACT_COUNT_TOP_K]
+    candidates = [request_specs[idx] for idx in candidate_idx]
 
-    for rs in candidates:
+    def _exact_count(rs: ReviewRequestSpec) -> int | None:
         cache_key = review_request_cache_key(rs)
         exact_tokens = get_cached_token_count(cache_key)
         if exact_tokens is None:
@@ -646,11 +676,24 @@ def _run_exact_token_preflight(
             exact_tokens = count_tokens_via_api(**count_kwargs)
             if exact_tokens is not None:
                 cache_token_count(cache_key, exact_tokens)
+        return exact_tokens
+
+    # Each uncached count is an HTTP round-trip; issue them concurrently so
+    # preflight costs about one round-trip instead of one per candidate.
+    # ``pool.map`` keeps candidate order, so the log lines and the first
+    # oversize error below are the same as a serial pass.
+    if len(candidates) > 1:
+        with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+            exact_counts = list(pool.map(_exact_count, candidates))
+    else:
+        exact_counts = [_exact_count(rs) for rs in candidates]
+
+    for idx, rs, exact_tokens in zip(candidate_idx, candidates, exact_counts):
         if exact_tokens is None:
             # Preflight unavailable for this spec — the local gate will
             # still apply the model-aware safety factor in the caller.
             continue
-        local = estimate_local_request_tokens(rs)
+        local = local_estimates[idx]
         log(
             f"Token preflight ({rs.filename}, model={model}): "
             f"local~{local:,} | exact={exact_tokens:,}",
@@ -673,14 +716,9 @@ def _prepare_specs(*, input_dir: Path, files: Optional[list[Path]] = None, proje
         raise FileNotFoundError(f"No specification files found in: {input_dir}")
 
     specs: list[ExtractedSpec] = []
-    leed_alerts: list[dict] = []
-    placeholder_alerts: list[dict] = []
-    code_cycle_alerts: list[dict] = []
-    structural_alerts: list[dict] = []
-    template_marker_alerts: list[dict] = []
-    invalid_code_cycle_alerts: list[dict] = []
-    duplicate_paragraph_alerts: list[dict] = []
-    polity_alerts: list[dict] = []
+    # ``(content, filename)`` per kept spec, built alongside ``specs`` in the
+    # extraction loop rather than in a second pass over it.
+    preprocess_inputs: list[tuple[str, str]] = []
     # Per-filename view of the per-spec alerts so the reviewer / batch
     # paths can hand each spec only its own alerts when building the
     # ``<pre_detected>`` block.
@@ -692,25 +730,70 @@ def _prepare_specs(*, input_dir: Path, files: Optional[list[Path]] = None, proje
     # pool maintains the original semantics.
     # Extraction is cached by file identity so repeated runs with toggled
     # options skip the DOCX parse; misses fall through to the parallel
-    # extractor.
-    extracted = extract_multiple_specs_cached(spec_files)
-    for i, (p, spec) in enumerate(zip(spec_files, extracted), start=1):
-        if spec.word_count == 0 or not spec.content.strip():
-            log(f"Skipping {p.name}: no extractable text content", level="warning")
-            progress((i / len(spec_files)) * 25.0, f"Loaded {i}/{len(spec_files)}")
-            continue
-        specs.append(spec)
-        pre = preprocess_spec(
-            spec.content, spec.filename, cycle=cycle, profile_country=profile_country
+    # extractor. Large projects preprocess on a process pool, which is
+    # started (and its workers spawned) first so their start-up overlaps
+    # the extraction.
+    preprocess_pool = start_preprocess_pool(len(spec_files))
+    try:
+        extracted = extract_multiple_specs_cached(spec_files)
+        # Files whose extracted text is identical would be billed for byte-
+        # identical reviews; the first copy (in file order) is reviewed and the
+        # rest are skipped with a warning, like empty files. Deterministic, so
+        # the resume path rebuilds the same spec list (and request indices).
+        skip_duplicates = skip_duplicate_specs_enabled()
+        first_by_digest: dict[bytes, str] = {}
+        duplicate_spec_aliases: dict[str, str] = {}
+        # Throttled to ~20 ticks: each tick is an activity-log line and a UI
+        # dispatch, and one per file floods the log on large projects.
+        total = len(spec_files)
+        step = max(1, total // 20)
+        for i, (p, spec) in enumerate(zip(spec_files, extracted), start=1):
+            if i % step == 0 and i < total:
+                progress((i / total) * 25.0, f"Loaded {i}/{total}")
+            if spec.word_count == 0 or not spec.content.strip():
+                log(f"Skipping {p.name}: no extractable text content", level="warning")
+                continue
+            if skip_duplicates:
+                digest = hashlib.blake2b(spec.content.encode("utf-8"), digest_size=16).digest()
+                original = first_by_digest.get(digest)
+                if original is not None:
+                    log(
+                        f"Skipping {p.name}: text is identical to {original} "
+                        "(reviewed once)",
+                        level="warning",
+                    )
+                    duplicate_spec_aliases[spec.filename] = original
+                    continue
+                first_by_digest[digest] = spec.filename
+            specs.append(spec)
+            preprocess_inputs.append((spec.content, spec.filename))
+        progress(25.0, f"Loaded {total}/{total}")
+        # The detector passes are independent per spec; ``preprocess_specs``
+        # fans large projects out over processes and returns results in input
+        # order, so the alert lists below keep file order.
+        preprocessed = preprocess_specs(
+            preprocess_inputs,
+            cycle=cycle,
+            profile_country=profile_country,
+            pool=preprocess_pool,
         )
-        leed_alerts.extend(pre.leed_alerts)
-        placeholder_alerts.extend(pre.placeholder_alerts)
-        code_cycle_alerts.extend(pre.code_cycle_alerts)
-        structural_alerts.extend(pre.structural_alerts)
-        template_marker_alerts.extend(pre.template_marker_alerts)
-        invalid_code_cycle_alerts.extend(pre.invalid_code_cycle_alerts)
-        duplicate_paragraph_alerts.extend(pre.duplicate_paragraph_alerts)
-        polity_alerts.extend(pre.polity_alerts)
+    finally:
+        # ``preprocess_specs`` shuts the pool down itself; this covers an
+        # extraction error (or a cancelled run) before it is reached.
+        if preprocess_pool is not None:
+            preprocess_pool.shutdown(wait=False, cancel_futures=True)
+
+    # Project-wide alert lists, one ``chain.from_iterable`` per kind rather
+    # than eight ``extend`` calls (and list regrowths) per spec.
+    leed_alerts = list(chain.from_iterable(pre.leed_alerts for pre in preprocessed))
+    placeholder_alerts = list(chain.from_iterable(pre.placeholder_alerts for pre in preprocessed))
+    code_cycle_alerts = list(chain.from_iterable(pre.code_cycle_alerts for pre in preprocessed))
+    structural_alerts = list(chain.from_iterable(pre.structural_alerts for pre in preprocessed))
+    template_marker_alerts = list(chain.from_iterable(pre.template_marker_alerts for pre in preprocessed))
+    invalid_code_cycle_alerts = list(chain.from_iterable(pre.invalid_code_cycle_alerts for pre in preprocessed))
+    duplicate_paragraph_alerts = list(chain.from_iterable(pre.duplicate_paragraph_alerts for pre in preprocessed))
+    polity_alerts = list(chain.from_iterable(pre.polity_alerts for pre in preprocessed))
+    for spec, pre in zip(specs, preprocessed):
         # Cache this spec's alerts under its filename so the reviewer /
         # batch paths can hand them to the prompt builder. Naming-style
         # alerts are appended below once the project-wide check runs
@@ -725,7 +808,6 @@ def _prepare_specs(*, input_dir: Path, files: Optional[list[Path]] = None, proje
             *pre.duplicate_paragraph_alerts,
             *pre.polity_alerts,
         ]
-        progress((i / len(spec_files)) * 25.0, f"Loaded {i}/{len(spec_files)}")
     if not specs:
         raise FileNotFoundError("All files failed extraction. No specs to review.")
 
@@ -780,8 +862,15 @@ def _prepare_specs(*, input_dir: Path, files: Optional[list[Path]] = None, proje
     # owns the prompt construction including the ``<pre_detected>`` alert
     # block and the id-tagged paragraph rendering, so a spec with a small
     # body but a large alert block cannot slip past preflight.
-    request_specs: list[ReviewRequestSpec] = [
-        ReviewRequestSpec(
+    #
+    # The local cl100k estimate is taken in the same pass: one count per
+    # request, shared by the exact-preflight ranking / log line and the
+    # local gate below (each used to re-encode the full system prompt +
+    # user message).
+    request_specs: list[ReviewRequestSpec] = []
+    local_estimates: list[int] = []
+    for spec in specs:
+        rs = ReviewRequestSpec(
             spec_content=spec.content,
             filename=spec.filename,
             model=model,
@@ -789,36 +878,23 @@ def _prepare_specs(*, input_dir: Path, files: Optional[list[Path]] = None, proje
             project_context=project_context,
             paragraph_map=spec.paragraph_map,
             pre_detected_alerts=pre_detected_by_filename.get(spec.filename),
+            run_spec_count=len(specs),
         )
-        for spec in specs
-    ]
-
-    # When the Anthropic ``count_tokens`` endpoint returns a number, that
-    # is the authoritative gate. The local cl100k_base count is only used
-    # as a fast pre-check and as the fallback when the API call is
-    # disabled or fails. Candidates are ranked by the FULL local request
-    # shape (system + user_message including pre_detected alerts) rather
-    # than by raw spec body length, so reordering files cannot cause a
-    # smaller raw spec to bypass exact-count when its wrapper / alerts
-    # make the real request larger.
-    if preflight and token_count_preflight_enabled() and request_specs:
-        _run_exact_token_preflight(
-            request_specs,
-            model=model,
-            log=log,
-        )
-
-    # Per-spec local gate. Runs whether or not the exact preflight fired;
-    # if exact counts are available the candidates are already known safe,
-    # but every spec must still pass the local + safety-factor gate. The
+        request_specs.append(rs)
+        if preflight:
+            local_estimates.append(estimate_local_request_tokens(rs))
+
+    # Per-spec local gate. Every spec must pass the local + safety-factor
+    # gate whether or not exact counts are available, so it runs *before*
+    # the exact preflight: an oversized spec fails on numbers already in
+    # hand instead of after a round of ``count_tokens`` network calls. The
     # model-specific safety multiplier prevents a cl100k_base undercount
     # from masking a real overage; the gate uses the *full* request shape
     # (system + materialized user message with pre_detected alerts) so it
     # does not undercount when alerts dominate the request body.
     if preflight:
         safety = local_estimate_safety_factor(model)
-        for spec, rs in zip(specs, request_specs):
-            total_local = estimate_local_request_tokens(rs)
+        for spec, total_local in zip(specs, local_estimates):
             # The exceeds-limit helper compares (spec + overhead) against the
             # recommended max with the safety factor. We feed it ``total_local``
             # as the spec component and zero overhead so the existing helper
@@ -832,6 +908,22 @@ def _prepare_specs(*, input_dir: Path, files: Optional[list[Path]] = None, proje
                     f"{RECOMMENDED_MAX:,}."
                 )
 
+    # When the Anthropic ``count_tokens`` endpoint returns a number, that
+    # is the authoritative gate. The local cl100k_base count is only used
+    # as a fast pre-check and as the fallback when the API call is
+    # disabled or fails. Candidates are ranked by the FULL local request
+    # shape (system + user_message including pre_detected alerts) rather
+    # than by raw spec body length, so reordering files cannot cause a
+    # smaller raw spec to bypass exact-count when its wrapper / alerts
+    # make the real request larger.
+    if preflight and token_count_preflight_enabled() and request_specs:
+        _run_exact_token_preflight(
+            request_specs,
+            model=model,
+            log=log,
+            local_estimates=local_estimates,
+        )
+
     cache_stats = extraction_cache_stats()
     if cache_stats["hits"]:
         log(
@@ -852,6 +944,7 @@ def _prepare_specs(*, input_dir: Path, files: Optional[list[Path]] = None, proje
         duplicate_paragraph_alerts=duplicate_paragraph_alerts,
         polity_alerts=polity_alerts,
         pre_detected_by_filename=pre_detected_by_filename,
+        duplicate_spec_aliases=duplicate_spec_aliases,
     )
 
 
@@ -895,6 +988,9 @@ class BatchSubmission:
     duplicate_paragraph_alerts: list[dict] = field(default_factory=list)
     # Wrong-polity token alerts (WS-4, D-15). Empty on profile-less runs.
     polity_alerts: list[dict] = field(default_factory=list)
+    # ``{skipped_file: reviewed_file}`` for identical-text copies; rebuilt by
+    # the resume path's re-extraction rather than persisted.
+    duplicate_spec_aliases: dict[str, str] = field(default_factory=dict)
     # Tracing: pipeline span_id carried from start_batch_review through to
     # finalize_batch_result so the batch-mode root span can be closed at
     # the end of the run. Empty string when tracing was disabled.
@@ -1201,6 +1297,7 @@ def _batch_submission_from_prepared(
         invalid_code_cycle_alerts=prepared.invalid_code_cycle_alerts,
         duplicate_paragraph_alerts=prepared.duplicate_paragraph_alerts,
         polity_alerts=prepared.polity_alerts,
+        duplicate_spec_aliases=dict(prepared.duplicate_spec_aliases),
         trace_span_id=(trace_pipeline.span_id if trace_pipeline is not None else ""),
         review_transport=prepared_run.review_transport,
         realtime_results=realtime_results,
@@ -1416,10 +1513,13 @@ def _recover_retryable_review_batch_results(
     # tell the model what was already detected locally. Alerts are
     # deterministic given (content, filename, cycle), so we recompute
     # them here rather than threading the original map through resume
-    # state.
+    # state. ``preprocess_specs`` fans a large repair set out over the
+    # same process pool the first pass uses.
     repair_pre_detected: dict[str, list[dict]] = {}
-    for spec in repair_specs:
-        pre = preprocess_spec(spec.content, spec.filename, cycle=cycle)
+    repair_pre = preprocess_specs(
+        [(spec.content, spec.filename) for spec in repair_specs], cycle=cycle
+    )
+    for spec, pre in zip(repair_specs, repair_pre):
         repair_pre_detected[spec.filename] = [
             *pre.leed_alerts,
             *pre.placeholder_alerts,
@@ -1565,6 +1665,7 @@ def collect_review_batch_results(submission: BatchSubmission, *, log: LogFn = _n
         invalid_code_cycle_alerts=list(submission.invalid_code_cycle_alerts),
         duplicate_paragraph_alerts=list(submission.duplicate_paragraph_alerts),
         polity_alerts=list(getattr(submission, "polity_alerts", None) or []),
+        duplicate_spec_aliases=dict(getattr(submission, "duplicate_spec_aliases", None) or {}),
         # Carry the pipeline span_id through so finalize_batch_result can
         # close the root span at the end of the batch lifecycle.
         trace_span_id=submission.trace_span_id,
@@ -2333,6 +2434,7 @@ def finalize_batch_result(state: CollectedBatchState) -> PipelineResult:
         # path; the empty-list fallback keeps the banner showing 0
         # extraction warnings instead of crashing.
         extracted_specs=list(prepared_specs),
+        duplicate_spec_aliases=dict(getattr(state, "duplicate_spec_aliases", None) or {}),
     )
 
 
@@ -2387,6 +2489,7 @@ def reconstruct_batch_submission(
     leed, placeholder, code_cycle, structural, naming, template, invalid, dup, polity = (
         [], [], [], [], [], [], [], [], [],
     )
+    duplicate_spec_aliases: dict[str, str] = {}
 
     resolved_files = [Path(f) for f in files] if files else None
     if resolved_files and all(p.exists() for p in resolved_files):
@@ -2429,6 +2532,7 @@ def reconstruct_batch_submission(
             invalid = prepared.invalid_code_cycle_alerts
             dup = prepared.duplicate_paragraph_alerts
             polity = prepared.polity_alerts
+            duplicate_spec_aliases = prepared.duplicate_spec_aliases
             if {s.filename for s in prepared.specs} != set(files_reviewed):
                 log(
                     "Resumed spec set differs from the originally reviewed files; "
@@ -2474,6 +2578,7 @@ def reconstruct_batch_submission(
         invalid_code_cycle_alerts=invalid,
         duplicate_paragraph_alerts=dup,
         polity_alerts=polity,
+        duplicate_spec_aliases=duplicate_spec_aliases,
         trace_span_id="",
     )
 
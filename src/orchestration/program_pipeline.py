@@ -247,11 +247,15 @@ class ProgramSubmission:
     @property
     def files_reviewed(self) -> list[str]:
         """Unique specifications represented by actually submitted partitions."""
-        submitted_names = {
-            Path(name).name
+        # One pass over the child partitions yields both the submitted
+        # names and their basenames; the basename set of ``ordered`` is
+        # then kept up to date instead of being rebuilt per child name.
+        submitted = [
+            (name, Path(name).name)
             for child in self.partitions.values()
             for name in child.files_reviewed
-        }
+        ]
+        submitted_names = {base for _, base in submitted}
         ordered = [
             item.spec_id
             for item in self.assignments
@@ -259,12 +263,11 @@ class ProgramSubmission:
         ]
         # Preserve honest child data even for a recovered/legacy submission
         # whose assignment metadata is incomplete.
-        ordered.extend(
-            name
-            for child in self.partitions.values()
-            for name in child.files_reviewed
-            if Path(name).name not in {Path(item).name for item in ordered}
-        )
+        seen_names = {Path(item).name for item in ordered}
+        for name, base in submitted:
+            if base not in seen_names:
+                seen_names.add(base)
+                ordered.append(name)
         return list(dict.fromkeys(ordered))
 
     @property
@@ -39,6 +39,8 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+from ..core.api_config import env_flag_enabled
+from ..core.json_store import write_json_bytes
 from ..orchestration.pipeline import group_findings
 from .report_status import classify_status
 
@@ -58,6 +60,16 @@ from .report_status import classify_status
 SIDECAR_SCHEMA_VERSION = 4
 
 
+def sidecar_json_pretty() -> bool:
+    """Whether the edits sidecar is written indented.
+
+    Off by default: the sidecar is read by a downstream applier, so it goes
+    through :func:`~src.core.json_store.write_json_bytes` like the caches.
+    Set ``SPEC_CRITIC_PRETTY_JSON=1`` to indent it for reading by hand.
+    """
+    return env_flag_enabled("SPEC_CRITIC_PRETTY_JSON")
+
+
 def _serialize_edit_proposal(proposal) -> dict | None:
     """Flatten an ``EditProposal`` into the sidecar's JSON shape."""
     if proposal is None:
@@ -230,9 +242,11 @@ def write_edit_instructions_sidecar(pipeline_result, output_path: Path) -> Path:
     output_path = Path(output_path)
     sidecar_path = output_path.with_name(output_path.stem + ".edits.json")
     data = build_edit_instructions(pipeline_result, report_path=output_path)
-    sidecar_path.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    if sidecar_json_pretty():
+        with sidecar_path.open("w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=2, ensure_ascii=False)
+    else:
+        write_json_bytes(sidecar_path, data, ensure_ascii=False)
     return sidecar_path
 
 
@@ -293,7 +307,6 @@ def write_requirements_profile_sidecar(
         return None
     output_path = Path(output_path)
     profile_path = output_path.with_name(output_path.stem + ".profile.json")
-    profile_path.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    with profile_path.open("w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2, ensure_ascii=False)
     return profile_path
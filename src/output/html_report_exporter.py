@@ -699,6 +699,7 @@ def _render_files_reviewed(
     files_reviewed: list[str],
     failed_review_specs: set[str],
     *,
+    duplicate_spec_aliases: dict[str, str] | None = None,
     heading_level: int = 2,
     id_prefix: str = "",
 ) -> tuple[str, list[str]]:
@@ -713,6 +714,11 @@ def _render_files_reviewed(
         else:
             parts.append(f"<li>{_e(filename)}</li>")
             text_lines.append(f"  - {filename}")
+    # Identical-text copies skipped by ``_prepare_specs`` (skipped -> reviewed).
+    for skipped, reviewed in (duplicate_spec_aliases or {}).items():
+        annotated = f"{skipped} — identical to {reviewed} (reviewed once)"
+        parts.append(f"<li><em>{_e(annotated)}</em></li>")
+        text_lines.append(f"  - {annotated}")
     parts.append("</ul></section>")
     text_lines.append("")
     return "\n".join(parts), text_lines
@@ -3193,6 +3199,7 @@ def _render_single_module_body(
     html_part, text_part = _render_files_reviewed(
         pipeline_result.files_reviewed,
         set(failed_review_specs),
+        duplicate_spec_aliases=getattr(pipeline_result, "duplicate_spec_aliases", None),
         heading_level=heading_level,
         id_prefix=id_prefix,
     )
@@ -3575,6 +3582,12 @@ def render_html_report(
     return _render_single(pipeline_result, stamp, include_chat=include_chat)
 
 
+# Characters encoded per write. The report embeds every finding (and its
+# JSON payload twice over), so encoding the whole document at once held a
+# second full-size copy in memory just to hand it to ``write``.
+_WRITE_CHUNK_CHARS = 1 << 20
+
+
 def write_html_report(
     pipeline_result,
     output_path: Path,
@@ -3586,11 +3599,16 @@ def write_html_report(
 
     Writes bytes (UTF-8) so the CSP script hash always matches the file's
     exact contents — platform newline translation can never corrupt it.
+    The document is encoded in ``_WRITE_CHUNK_CHARS`` slices; slicing a
+    ``str`` never splits a code point, so the bytes are identical to a
+    whole-document encode.
     """
     document = render_html_report(
         pipeline_result, generated_at=generated_at, include_chat=include_chat
     )
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_bytes(document.encode("utf-8"))
+    with output_path.open("wb") as fh:
+        for start in range(0, len(document), _WRITE_CHUNK_CHARS):
+            fh.write(document[start:start + _WRITE_CHUNK_CHARS].encode("utf-8"))
     return output_path
@@ -389,13 +389,16 @@ def _write_title_block(doc: Document, review, files_reviewed: list[str],
 # ---------------------------------------------------------------------------
 
 def _write_files_reviewed(doc: Document, files_reviewed: list[str],
-                          failed_review_specs: set[str] | None = None) -> None:
+                          failed_review_specs: set[str] | None = None,
+                          duplicate_spec_aliases: dict[str, str] | None = None) -> None:
     """Write the files reviewed section with a bullet list.
 
     Any filename in ``failed_review_specs`` is annotated in red with a
     "— review failed (not reviewed)" suffix so the per-file list stays
     honest: a spec that failed review is visually distinct from one that
-    was reviewed clean.
+    was reviewed clean. Selected files skipped because their text was
+    identical to another spec (``duplicate_spec_aliases``, skipped ->
+    reviewed) follow the list, each naming the copy whose review covers it.
     """
     failed = set(failed_review_specs or ())
     doc.add_heading("Files Reviewed", level=1)
@@ -407,6 +410,10 @@ def _write_files_reviewed(doc: Document, files_reviewed: list[str],
             run.font.color.rgb = RGBColor(192, 0, 0)
         else:
             doc.add_paragraph(filename, style='List Bullet')
+    for skipped, reviewed in (duplicate_spec_aliases or {}).items():
+        para = doc.add_paragraph(style='List Bullet')
+        run = para.add_run(f"{skipped} — identical to {reviewed} (reviewed once)")
+        run.italic = True
 
 
 
@@ -3056,6 +3063,7 @@ def export_program_report(program_result, output_path: Path) -> Path:
             doc,
             child.files_reviewed,
             failed_review_specs=set(child.failed_review_specs or []),
+            duplicate_spec_aliases=getattr(child, "duplicate_spec_aliases", None),
         )
         profile_data = RequirementsProfile.from_dict(child.requirements_profile)
         if profile_data is not None:
@@ -3228,6 +3236,7 @@ def export_report(
         doc,
         pipeline_result.files_reviewed,
         failed_review_specs=set(failed_review_specs),
+        duplicate_spec_aliases=getattr(pipeline_result, "duplicate_spec_aliases", None),
     )
     # WS-4 "Jurisdiction & Client Requirements" — between Files Reviewed and
     # the methodology note (D-13); renders only when the run researched a
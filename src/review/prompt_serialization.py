@@ -179,9 +179,24 @@ def wrap_document_block(
     similar) literals inside a document cannot prematurely close or
     redefine the wrapper.
     """
-    attr_str = _render_attrs(attrs)
-    body = escape_text(content or "")
-    return f"<{tag}{attr_str}>\n{body}\n</{tag}>"
+    return "\n".join(document_block_parts(tag, content, attrs=attrs))
+
+
+def document_block_parts(
+    tag: str,
+    content: str | None,
+    *,
+    attrs: Mapping[str, str | None] | None = None,
+) -> tuple[str, str, str]:
+    """Return ``(open_tag, escaped_body, close_tag)`` for a document block.
+
+    ``"\n".join`` of the result is exactly :func:`wrap_document_block`.
+    Multi-document renderers (the ``<corpus>``) splice these pieces into
+    one flat fragment list and join once, instead of materializing every
+    full-size wrapped spec string and then copying it again in the outer
+    join.
+    """
+    return (f"<{tag}{_render_attrs(attrs)}>", escape_text(content or ""), f"</{tag}>")
 
 
 def render_blocks(blocks: Iterable[str]) -> str:
@@ -381,8 +396,11 @@ def render_pre_detected_block(
     # Preserve first-seen rule order so the block is deterministic — the
     # rule order is part of the prompt and shuffling it would silently
     # invalidate any prompt-level cache hits in callers that bypass the
-    # phase-aware cache machinery.
+    # phase-aware cache machinery. Only the first
+    # ``_PRE_DETECTED_EXAMPLES_PER_RULE`` matches per rule are ever shown,
+    # so the rest only bump a counter.
     by_rule: dict[str, list[str]] = {}
+    counts: dict[str, int] = {}
     order: list[str] = []
     for alert in filtered:
         if not isinstance(alert, Mapping):
@@ -393,11 +411,14 @@ def render_pre_detected_block(
             # human-readable ``type`` so the block still says something
             # informative — but do not let an empty string collapse rules.
             rule = str(alert.get("type") or "other").strip() or "other"
-        match_text = str(alert.get("match") or "").strip()
         if rule not in by_rule:
             order.append(rule)
             by_rule[rule] = []
-        by_rule[rule].append(match_text)
+            counts[rule] = 0
+        counts[rule] += 1
+        examples = by_rule[rule]
+        if len(examples) < _PRE_DETECTED_EXAMPLES_PER_RULE:
+            examples.append(str(alert.get("match") or "").strip())
 
     if not order:
         return ""
@@ -408,18 +429,13 @@ def render_pre_detected_block(
         "this list. The final report already records every item below."
     ]
     for rule in order:
-        matches = by_rule[rule]
-        examples = [
-            _truncate_example(m)
-            for m in matches[:_PRE_DETECTED_EXAMPLES_PER_RULE]
-            if m
-        ]
+        examples = [_truncate_example(m) for m in by_rule[rule] if m]
         # When matches are all empty (rule fired without a quotable span,
         # e.g. ``inconsistent_filename`` whose match is the filename), still
         # render the rule + count so the model knows the rule fired.
         examples_str = ", ".join(escape_text(e) for e in examples if e)
         suffix = f": {examples_str}" if examples_str else ""
-        lines.append(f"- {escape_text(rule)} (count={len(matches)}){suffix}")
+        lines.append(f"- {escape_text(rule)} (count={counts[rule]}){suffix}")
 
     body = "\n".join(lines)
     return f"<{TAG_PRE_DETECTED}>\n{body}\n</{TAG_PRE_DETECTED}>"
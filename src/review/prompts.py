@@ -11,6 +11,7 @@ the registry's unique-label bridge (``module_for_cycle``).
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Mapping, Sequence
 
 from ..core.code_cycles import CodeCycle
@@ -51,6 +52,7 @@ _EDITABILITY_CLAUSE = (
 )
 
 
+@functools.lru_cache(maxsize=16)
 def get_system_prompt(cycle: CodeCycle) -> str:
     """Return the reviewer system prompt for a code cycle.
 
@@ -58,7 +60,8 @@ def get_system_prompt(cycle: CodeCycle) -> str:
     severity anchors, rubric example, categories, few-shot examples) come
     from the module that owns ``cycle``. Stable per cycle (the module
     resolution is a pure registry lookup), so the cached-prefix invariant
-    is unchanged.
+    is unchanged — and the result is memoized per (hashable, frozen) cycle:
+    every request build, cache key and local token estimate asks for it.
     """
     module = module_for_cycle(cycle)
     categories = module.review_categories_template.format(
@@ -139,6 +142,81 @@ Categories:
 </review_scope>"""
 
 
+@functools.lru_cache(maxsize=16)
+def system_prompt_tokens(cycle: CodeCycle) -> int:
+    """Local token estimate of :func:`get_system_prompt` for ``cycle``.
+
+    Memoized alongside the prompt itself: the per-spec estimates, the
+    extended-output decision and the GUI gauge all add the same system
+    prompt to every count, so it is tokenized once per cycle.
+    """
+    from ..core.tokenizer import count_tokens
+
+    return count_tokens(get_system_prompt(cycle))
+
+
+@functools.lru_cache(maxsize=4)
+def _single_spec_message_head(
+    cycle: CodeCycle, project_context: str, use_ids: bool
+) -> str:
+    """Spec-independent head of the single-spec user message.
+
+    Everything before the ``<spec>`` block depends only on the cycle, the
+    project context and whether element ids are rendered, so every spec in
+    a run shares it. Memoized so the (often large) project context is
+    escaped and wrapped once per run rather than once per spec per build;
+    a small ``maxsize`` bounds how many contexts stay pinned.
+    """
+    module = module_for_cycle(cycle)
+    context_block = ""
+    if project_context.strip():
+        context_block = wrap_document_block(
+            TAG_PROJECT_CONTEXT, project_context.strip()
+        ) + "\n\n"
+
+    id_hint = (
+        "- Each spec element is wrapped in <para id=\"…\">, <row id=\"…\">, or "
+        "<heading id=\"…\"> tags. When you can identify the exact element the "
+        "finding refers to, include its id in evidenceElementId (and still "
+        "quote the exact text in existingText / anchorText).\n"
+    ) if use_ids else ""
+
+    pinned_standards = cycle.edition_inline_phrase()
+    standards_clause = (
+        f" Pinned standard editions: {pinned_standards}." if pinned_standards else ""
+    )
+
+    code_basis_line = module.review_user_code_basis_line.format(
+        **code_basis_format_kwargs(cycle)
+    )
+    return (
+        f"{module.review_user_intro}\n\n"
+        f"{code_basis_line}{standards_clause}\n\n"
+        "Reminders:\n"
+        "- Review every section in the file.\n"
+        "- Submit findings via the submit_review_findings tool.\n"
+        "- Include confidence (0.0-1.0) with each finding.\n"
+        f"{id_hint}\n"
+        f"{context_block}"
+    )
+
+
+def get_single_spec_user_message_head(
+    project_context: str = "",
+    *,
+    cycle: CodeCycle,
+    paragraph_map: "Sequence[ParagraphMapping] | None" = None,
+) -> str:
+    """Return the run-wide head every single-spec user message starts with.
+
+    :func:`get_single_spec_user_message` for the same arguments always
+    begins with exactly this string; the request builder places a cache
+    breakpoint after it.
+    """
+    use_ids = bool(paragraph_map) and element_ids_enabled()
+    return _single_spec_message_head(cycle, project_context, use_ids)
+
+
 def get_single_spec_user_message(
     spec_content: str,
     filename: str,
@@ -149,29 +227,15 @@ def get_single_spec_user_message(
     pre_detected_alerts: "Sequence[Mapping[str, object]] | None" = None,
 ) -> str:
     """Build user message for reviewing a single spec in isolation."""
-    module = module_for_cycle(cycle)
-    context_block = ""
-    if project_context.strip():
-        context_block = wrap_document_block(
-            TAG_PROJECT_CONTEXT, project_context.strip()
-        ) + "\n\n"
-
     use_ids = bool(paragraph_map) and element_ids_enabled()
     if use_ids:
         spec_block = render_spec_with_ids(
             spec_content, paragraph_map, filename=filename
         )
-        id_hint = (
-            "- Each spec element is wrapped in <para id=\"…\">, <row id=\"…\">, or "
-            "<heading id=\"…\"> tags. When you can identify the exact element the "
-            "finding refers to, include its id in evidenceElementId (and still "
-            "quote the exact text in existingText / anchorText).\n"
-        )
     else:
         spec_block = wrap_document_block(
             TAG_SPEC, spec_content, attrs={"filename": filename}
         )
-        id_hint = ""
 
     pre_detected_block = ""
     if pre_detected_alerts and pre_detected_alerts_enabled():
@@ -183,23 +247,8 @@ def get_single_spec_user_message(
 
     final_task_block = _render_final_task_block(use_ids=use_ids)
 
-    pinned_standards = cycle.edition_inline_phrase()
-    standards_clause = (
-        f" Pinned standard editions: {pinned_standards}." if pinned_standards else ""
-    )
-
-    code_basis_line = module.review_user_code_basis_line.format(
-        **code_basis_format_kwargs(cycle)
-    )
     return (
-        f"{module.review_user_intro}\n\n"
-        f"{code_basis_line}{standards_clause}\n\n"
-        "Reminders:\n"
-        "- Review every section in the file.\n"
-        "- Submit findings via the submit_review_findings tool.\n"
-        "- Include confidence (0.0-1.0) with each finding.\n"
-        f"{id_hint}\n"
-        f"{context_block}"
+        f"{_single_spec_message_head(cycle, project_context, use_ids)}"
         f"{spec_block}"
         f"{pre_detected_block}\n\n"
         f"{final_task_block}\n"
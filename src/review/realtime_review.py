@@ -49,6 +49,10 @@ completion, advances ``progress``, and records
 resume story for this transport — a crash loses in-flight work, which is
 the documented trade-off of the mode (the batch path keeps its pending-state
 persistence and recovery machinery).
+
+Opt-in response cache (``review_cache``): with ``SPEC_CRITIC_REVIEW_CACHE=1``
+a byte-identical request is answered from disk before any client call, and
+the replayed result carries zero tokens and no telemetry row.
 """
 from __future__ import annotations
 
@@ -81,6 +85,13 @@ from .review_request_builder import (
     build_review_request,
     estimate_local_request_tokens,
 )
+from .review_cache import (
+    load_review_message,
+    review_cache_enabled,
+    review_cache_key,
+    review_cache_refresh,
+    store_review_message,
+)
 from .reviewer import ReviewResult, _get_client, review_result_from_message
 
 LogFn = Callable[..., None]
@@ -212,6 +223,7 @@ def build_realtime_review_jobs(
             # design; ``service_tier`` is a batch-path knob.
             force_allow_extended_output=False,
             include_service_tier=False,
+            run_spec_count=len(specs),
         )
         display_name = (
             display_name_factory(spec.filename, idx)
@@ -380,14 +392,17 @@ def _close_review_api_span(handle, result: ReviewResult | None, *, source: str,
         pass
 
 
-def _stream_review_call(client, built, *, model: str, trace_api) -> ReviewResult:
+def _stream_review_call(
+    client, built, *, model: str, trace_api, cache_key: str | None = None
+) -> ReviewResult:
     """One streaming Messages call → classified ``ReviewResult``.
 
     Streaming is required at this size: the review cap (128k output) is far
     past the SDK's non-streaming ceiling. The review request carries no
     server tools, so there is no ``pause_turn`` loop — the stream ends in a
     single turn and classifies through the shared
-    ``review_result_from_message`` core.
+    ``review_result_from_message`` core. With a ``cache_key`` (review cache
+    opted in), a cleanly parsed response is persisted under it.
     """
     call_start = time.time()
     with client.messages.stream(**built.params) as stream:
@@ -397,6 +412,8 @@ def _stream_review_call(client, built, *, model: str, trace_api) -> ReviewResult
     _trace.capture_response_content_blocks(trace_api, resp)
     result = review_result_from_message(resp, model=model)
     result.elapsed_seconds = time.time() - call_start
+    if cache_key is not None and result.parse_status == "ok" and not result.error:
+        store_review_message(cache_key, resp)
     _trace.capture_parse_attempt(
         trace_api,
         status="ok" if result.parse_status == "ok" else str(result.parse_status),
@@ -405,6 +422,25 @@ def _stream_review_call(client, built, *, model: str, trace_api) -> ReviewResult
     return result
 
 
+def _cached_review_result(cache_key: str, *, model: str) -> ReviewResult | None:
+    """Re-classify a cached response; ``None`` unless it parses cleanly.
+
+    Token counts are zeroed: nothing was billed for a replay, and the run's
+    cost summary must not count the original call twice.
+    """
+    message = load_review_message(cache_key)
+    if message is None:
+        return None
+    result = review_result_from_message(message, model=model)
+    if result.parse_status != "ok" or result.error:
+        return None
+    result.input_tokens = 0
+    result.output_tokens = 0
+    result.cache_creation_input_tokens = 0
+    result.cache_read_input_tokens = 0
+    return result
+
+
 def _review_one_spec(
     client,
     prepared_job: _PreparedRealtimeReviewJob,
@@ -431,13 +467,29 @@ def _review_one_spec(
     built = prepared_job.built
     max_output = int(built.params.get("max_tokens") or 0)
 
+    cache_key = review_cache_key(built.params) if review_cache_enabled() else None
+    if cache_key is not None and not review_cache_refresh():
+        cached = _cached_review_result(cache_key, model=model)
+        if cached is not None:
+            # No API call was made, so there is no telemetry row to record.
+            _trace.capture_note(trace_parent, "review served from cache", filename=filename)
+            return _SpecReviewOutcome(
+                job_key=job.job_key,
+                custom_id=custom_id,
+                filename=filename,
+                display_name=display_name,
+                result=cached,
+            )
+
     for attempt in range(attempts_planned):
         is_last_attempt = attempt == attempts_planned - 1
         trace_api = _open_review_api_span(
             trace_parent, filename=filename, model=model, attempt=attempt + 1
         )
         try:
-            result = _stream_review_call(client, built, model=model, trace_api=trace_api)
+            result = _stream_review_call(
+                client, built, model=model, trace_api=trace_api, cache_key=cache_key
+            )
             telemetry.append(
                 _telemetry_row(
                     result,
@@ -458,8 +510,11 @@ def _review_one_spec(
                     trace_parent, filename=filename, model=model, attempt=attempt + 1, repair=True
                 )
                 try:
+                    # A successful repair is stored under the ORIGINAL
+                    # request's key: it is the usable answer for that input.
                     repair_result = _stream_review_call(
-                        client, repair_built, model=model, trace_api=trace_repair
+                        client, repair_built, model=model, trace_api=trace_repair,
+                        cache_key=cache_key,
                     )
                     telemetry.append(
                         _telemetry_row(
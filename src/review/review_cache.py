@@ -0,0 +1,109 @@
+"""Opt-in on-disk cache of real-time review responses.
+
+A real-time review is the most expensive call the app makes (minutes of
+streaming and the bulk of a run's spend). Re-running an unchanged project —
+common while iterating on report wording or project context elsewhere —
+would otherwise pay for byte-identical requests again.
+
+Entries are keyed by a SHA-256 of the fully built Messages request params
+(model, system blocks, messages, tools, output cap, thinking config), so any
+change to the prompt, the spec text, the code cycle, or the model misses.
+The stored value is the raw final API message, not a ``ReviewResult``: a hit
+is re-classified through ``reviewer.review_result_from_message`` exactly
+like a fresh response, so parser fixes apply to cached entries and every
+caller gets its own freshly built ``Finding`` objects.
+
+Design notes:
+    * Off by default. Review responses quote spec text, so persisting them
+      is the same retention decision the extraction cache documents; set
+      ``SPEC_CRITIC_REVIEW_CACHE=1`` to opt in.
+    * ``SPEC_CRITIC_REVIEW_CACHE_REFRESH=1`` skips reads but still writes,
+      forcing a fresh review that replaces the stored entry.
+    * The directory is capped at ``SPEC_CRITIC_REVIEW_CACHE_MAX_MB``
+      (default 256); least-recently-used entries are evicted after each
+      write, as in the extraction cache's disk tier.
+    * Only responses that classified ``parse_status == "ok"`` are stored; a
+      truncated or failed review is never replayed.
+    * Every I/O or decode failure degrades to a miss — the cache can never
+      fail a run.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from ..core.api_config import env_flag_enabled, env_megabytes
+from ..core.json_store import prune_lru_dir, write_json_bytes
+
+# Bumped when the stored entry shape changes incompatibly.
+_CACHE_SCHEMA_VERSION = 1
+_DEFAULT_MAX_MB = 256
+
+
+def review_cache_enabled() -> bool:
+    """Whether real-time review responses are cached on disk."""
+    return env_flag_enabled("SPEC_CRITIC_REVIEW_CACHE")
+
+
+def review_cache_refresh() -> bool:
+    """Whether cache reads are bypassed (entries are still rewritten)."""
+    return env_flag_enabled("SPEC_CRITIC_REVIEW_CACHE_REFRESH")
+
+
+def review_cache_max_bytes() -> int:
+    """Size cap for the cache directory. ``SPEC_CRITIC_REVIEW_CACHE_MAX_MB``."""
+    return env_megabytes("SPEC_CRITIC_REVIEW_CACHE_MAX_MB", default=_DEFAULT_MAX_MB)
+
+
+def default_review_cache_dir() -> Path:
+    """Return the on-disk cache directory.
+
+    Overridable via ``SPEC_CRITIC_REVIEW_CACHE_DIR``. The default is
+    ``~/.spec_critic/review_cache``.
+    """
+    override = os.environ.get("SPEC_CRITIC_REVIEW_CACHE_DIR")
+    if override and override.strip():
+        return Path(os.path.expandvars(os.path.expanduser(override.strip())))
+    return Path.home() / ".spec_critic" / "review_cache"
+
+
+def review_cache_key(params: dict) -> str:
+    """Deterministic digest of the built request params."""
+    canonical = json.dumps(params, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _message_to_dict(message: Any) -> dict:
+    if isinstance(message, dict):
+        return message
+    return message.model_dump(mode="json")
+
+
+def load_review_message(key: str, *, cache_dir: Path | None = None) -> Any | None:
+    """Return the cached API message for ``key``, or ``None`` on any miss."""
+    path = (cache_dir or default_review_cache_dir()) / f"{key}.json"
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("version") != _CACHE_SCHEMA_VERSION:
+            return None
+        from anthropic.types import Message
+
+        message = Message.model_validate(payload["message"])
+        os.utime(path)
+    except Exception:
+        return None
+    return message
+
+
+def store_review_message(key: str, message: Any, *, cache_dir: Path | None = None) -> None:
+    """Atomically persist ``message`` under ``key``. Failures are swallowed."""
+    root = cache_dir or default_review_cache_dir()
+    try:
+        payload = {"version": _CACHE_SCHEMA_VERSION, "message": _message_to_dict(message)}
+        write_json_bytes(root / f"{key}.json", payload, ensure_ascii=False)
+    except Exception:
+        return
+    prune_lru_dir(root, review_cache_max_bytes())
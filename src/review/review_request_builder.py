@@ -53,9 +53,15 @@ from ..core.api_config import (
     review_max_tokens,
     system_prompt_with_cache,
     tools_with_cache,
+    user_content_with_cache,
 )
 from ..core.code_cycles import CodeCycle, DEFAULT_CYCLE
-from .prompts import get_single_spec_user_message, get_system_prompt
+from .prompts import (
+    get_single_spec_user_message,
+    get_single_spec_user_message_head,
+    get_system_prompt,
+    system_prompt_tokens,
+)
 from .structured_schemas import (
     review_findings_tool,
     review_tool_choice,
@@ -96,6 +102,9 @@ class ReviewRequestSpec:
     the 300k output beta is batch-only by API design).
     ``force_allow_extended_output`` is an escape hatch for tests;
     production callers leave it ``None`` and let the builder decide.
+    ``run_spec_count`` is how many review requests in the run share this
+    one's project-context head; the head only gets a cache breakpoint
+    when more than one does.
     """
 
     spec_content: str
@@ -108,6 +117,7 @@ class ReviewRequestSpec:
     retry_instruction: Optional[str] = None
     force_allow_extended_output: Optional[bool] = None
     include_service_tier: Optional[bool] = None
+    run_spec_count: int = 1
 
 
 @dataclass
@@ -154,7 +164,6 @@ def build_user_message(spec: ReviewRequestSpec) -> str:
 def _resolve_extended_output(
     spec: ReviewRequestSpec,
     *,
-    system_prompt: str,
     user_message: str,
 ) -> bool:
     """Decide whether the 300k batch-output beta applies to this request.
@@ -168,7 +177,7 @@ def _resolve_extended_output(
         return bool(spec.force_allow_extended_output)
     if not model_supports_extended_output_beta(spec.model):
         return False
-    approx_input_tokens = count_tokens(system_prompt) + count_tokens(user_message)
+    approx_input_tokens = system_prompt_tokens(spec.cycle) + count_tokens(user_message)
     return approx_input_tokens >= LARGE_REVIEW_INPUT_THRESHOLD
 
 
@@ -179,14 +188,27 @@ def _build_params_from_strings(
     model: str,
     allow_extended_output: bool,
     include_service_tier: bool,
+    user_prefix: str = "",
+    spec_count: int = 1,
 ) -> tuple[dict[str, Any], Optional[list[dict]]]:
     """Build review request kwargs from already-materialized prompts.
 
     Inner helper used by :func:`build_review_request`. Centralizing the
     request-shape construction here keeps the path that counts a request
-    and the path that sends it from drifting.
+    and the path that sends it from drifting. ``user_prefix`` is the
+    run-wide head of ``user_message`` that gets its own cache breakpoint
+    when ``spec_count`` requests share it.
     """
     system_payload = system_prompt_with_cache(system_prompt, phase=PHASE_REVIEW)
+    if user_prefix and user_message.startswith(user_prefix):
+        user_content = user_content_with_cache(
+            user_prefix,
+            user_message[len(user_prefix):],
+            spec_count=spec_count,
+            phase=PHASE_REVIEW,
+        )
+    else:
+        user_content = user_message
 
     use_tool = structured_tool_output_enabled()
     if use_tool:
@@ -203,7 +225,7 @@ def _build_params_from_strings(
         "model": model,
         "max_tokens": output_limit,
         "system": system_payload,
-        "messages": [{"role": "user", "content": user_message}],
+        "messages": [{"role": "user", "content": user_content}],
     }
     apply_thinking_config(params, model=model, phase=PHASE_REVIEW)
     apply_effort_config(params, model=model, phase=PHASE_REVIEW)
@@ -234,9 +256,16 @@ def build_review_request(spec: ReviewRequestSpec) -> BuiltReviewRequest:
     """
     system_prompt = get_system_prompt(spec.cycle)
     user_message = build_user_message(spec)
-    allow_extended = _resolve_extended_output(
-        spec, system_prompt=system_prompt, user_message=user_message
-    )
+    # Only a project context makes the shared head worth a breakpoint; the
+    # bare intro and reminders are a few dozen tokens.
+    user_prefix = ""
+    if spec.project_context.strip():
+        user_prefix = get_single_spec_user_message_head(
+            spec.project_context,
+            cycle=spec.cycle,
+            paragraph_map=spec.paragraph_map,
+        )
+    allow_extended = _resolve_extended_output(spec, user_message=user_message)
     include_tier = (
         spec.include_service_tier
         if spec.include_service_tier is not None
@@ -248,6 +277,8 @@ def build_review_request(spec: ReviewRequestSpec) -> BuiltReviewRequest:
         model=spec.model,
         allow_extended_output=allow_extended,
         include_service_tier=include_tier,
+        user_prefix=user_prefix,
+        spec_count=spec.run_spec_count,
     )
     return BuiltReviewRequest(
         params=params,
@@ -272,17 +303,17 @@ def build_token_count_request(
     paragraph map), same tool definition — so the count cannot
     underestimate.
 
-    The cache-control wrappers on ``system`` and ``tools`` are stripped
-    because they are pricing hints, not part of the input token count.
-    Sending them through ``count_tokens`` either no-ops (raw text
-    returned) or is rejected depending on SDK version; the raw form is
-    portable and gives the same count.
+    The cache-control wrappers on ``system``, ``tools`` and the user
+    message are stripped because they are pricing hints, not part of the
+    input token count. Sending them through ``count_tokens`` either no-ops
+    (raw text returned) or is rejected depending on SDK version; the raw
+    form is portable and gives the same count.
     """
     built = build_review_request(spec)
     count_kwargs: dict[str, Any] = {
         "model": built.model,
         "system": built.system_prompt,
-        "messages": built.params["messages"],
+        "messages": [{"role": "user", "content": built.user_message}],
     }
     if built.tools is not None:
         # Recompute the raw tool list without the cache_control block.
@@ -326,6 +357,5 @@ def estimate_local_request_tokens(spec: ReviewRequestSpec) -> int:
     smaller raw spec to bypass exact-count checks when its wrapper /
     alerts make it larger").
     """
-    system_prompt = get_system_prompt(spec.cycle)
     user_message = build_user_message(spec)
-    return count_tokens(system_prompt) + count_tokens(user_message)
+    return system_prompt_tokens(spec.cycle) + count_tokens(user_message)
@@ -9,9 +9,9 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from ..verification.verifier import VerificationResult
+    from anthropic import Anthropic as _AnthropicClient
 
-from anthropic import Anthropic
+    from ..verification.verifier import VerificationResult
 
 from ..core.api_config import (
     REVIEW_MODEL_DEFAULT,  # re-exported for batch/resume/GUI importers
@@ -412,7 +412,19 @@ def _get_api_key() -> str:
     return key
 
 
-_cached_client: Anthropic | None = None
+def _anthropic_class():
+    """Import the SDK client class on first use.
+
+    The ``anthropic`` package (httpx, pydantic models) is one of the heaviest
+    imports in the app, and everything that only needs ``Finding`` /
+    ``ReviewResult`` (module registry, report, GUI) imports this module.
+    """
+    from anthropic import Anthropic
+
+    return Anthropic
+
+
+_cached_client: _AnthropicClient | None = None
 _cached_key: str | None = None
 # This factory is shared by the tokenizer, batch, cross-check, triage, and
 # verifier modules, which the GUI drives from different worker threads. The
@@ -422,12 +434,12 @@ _cached_key: str | None = None
 _client_lock = threading.Lock()
 
 
-def _get_client() -> Anthropic:
+def _get_client() -> _AnthropicClient:
     global _cached_client, _cached_key
     key = _get_api_key()
     with _client_lock:
         if _cached_client is None or _cached_key != key:
-            _cached_client = Anthropic(api_key=key)
+            _cached_client = _anthropic_class()(api_key=key)
             _cached_key = key
         return _cached_client
 
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import shutil
 import sys
 import time
@@ -88,10 +89,16 @@ def _load_run(trace_dir: Path) -> dict | None:
 
 
 def _iter_run_dirs(root: Path):
-    if not root.exists():
+    # ``scandir`` entries carry the directory bit from the listing itself,
+    # so only candidate run directories pay a ``run.json`` stat.
+    try:
+        with os.scandir(root) as it:
+            names = sorted(entry.name for entry in it if entry.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
         return
-    for child in sorted(root.iterdir()):
-        if child.is_dir() and (child / "run.json").exists():
+    for name in names:
+        child = root / name
+        if (child / "run.json").exists():
             yield child
 
 
@@ -159,6 +159,11 @@ FILE_RUN_META = "run.json"
 # more pending writes than the writer can drain.
 _QUEUE_WARN_THRESHOLD = 100_000
 
+# Buffer size for the JSONL writer handles. Spans and events are a few
+# hundred bytes each, so the default 8 KiB buffer flushed every few dozen
+# lines on a busy run.
+_WRITER_BUFFER_BYTES = 1 << 18
+
 
 class TraceRecorder:
     """One trace per ``run_id``. Multiple instantiations against the same
@@ -492,6 +497,14 @@ class TraceRecorder:
                         writer.write("\n")
                     except Exception as exc:
                         _log.warning("Failed to write trace line to %s: %s", filename, exc)
+                    if self._queue.empty():
+                        # Caught up: push the buffered lines to disk so a
+                        # live trace (or a crash) never lags a burst behind.
+                        for fh in writers.values():
+                            try:
+                                fh.flush()
+                            except Exception as exc:
+                                _log.debug("Failed to flush trace file: %s", exc)
         except Exception as exc:
             _log.error("Trace writer thread crashed: %s", exc, exc_info=True)
         finally:
@@ -500,14 +513,17 @@ class TraceRecorder:
     @contextmanager
     def _open_writers(self) -> Iterator[dict[str, Any]]:
         # Open in append mode so a second start() against the same dir
-        # continues an existing trace rather than truncating.
+        # continues an existing trace rather than truncating. The larger
+        # buffer batches the many small span/event lines of a burst into
+        # fewer syscalls; _writer_loop flushes whenever the queue drains,
+        # and everything is fsynced on exit below.
         handles: dict[str, Any] = {}
         try:
-            handles[FILE_SPANS] = (self._trace_dir / FILE_SPANS).open("a", encoding="utf-8")
-            handles[FILE_EVENTS] = (self._trace_dir / FILE_EVENTS).open("a", encoding="utf-8")
-            handles[FILE_FINDINGS] = (self._trace_dir / FILE_FINDINGS).open("a", encoding="utf-8")
+            handles[FILE_SPANS] = (self._trace_dir / FILE_SPANS).open("a", encoding="utf-8", buffering=_WRITER_BUFFER_BYTES)
+            handles[FILE_EVENTS] = (self._trace_dir / FILE_EVENTS).open("a", encoding="utf-8", buffering=_WRITER_BUFFER_BYTES)
+            handles[FILE_FINDINGS] = (self._trace_dir / FILE_FINDINGS).open("a", encoding="utf-8", buffering=_WRITER_BUFFER_BYTES)
             if self._capture_level == LEVEL_DEFAULT:
-                handles[FILE_PROMPTS] = (self._trace_dir / FILE_PROMPTS).open("a", encoding="utf-8")
+                handles[FILE_PROMPTS] = (self._trace_dir / FILE_PROMPTS).open("a", encoding="utf-8", buffering=_WRITER_BUFFER_BYTES)
             yield handles
         finally:
             for fh in handles.values():
@@ -31,7 +31,6 @@ import hashlib
 import json
 import os
 import re
-import tempfile
 import threading
 import time
 from dataclasses import asdict, dataclass, field
@@ -42,6 +41,7 @@ if TYPE_CHECKING:
     from .verifier import VerificationResult
 
 from ..core.code_cycles import CodeCycle
+from ..core.json_store import write_json_bytes
 
 
 _WHITESPACE_RE = re.compile(r"\s+")
@@ -553,10 +553,10 @@ class VerificationCache:
         """Atomically write the cache to JSON.
 
         Returns the number of entries written. Atomic via temp-file +
-        rename so a crash mid-write cannot corrupt an existing cache file.
+        rename (:func:`~src.core.json_store.write_json_bytes`) so a crash
+        mid-write cannot corrupt an existing cache file.
         """
         target = Path(path) if path is not None else default_cache_path()
-        target.parent.mkdir(parents=True, exist_ok=True)
         with self._lock:
             entries_payload = {
                 key: {
@@ -571,22 +571,7 @@ class VerificationCache:
             "saved_at": time.time(),
             "entries": entries_payload,
         }
-        # Atomic write: temp file in the same directory + rename.
-        tmp_fd, tmp_name = tempfile.mkstemp(
-            prefix=".verification_cache.",
-            suffix=".tmp",
-            dir=str(target.parent),
-        )
-        try:
-            with os.fdopen(tmp_fd, "w", encoding="utf-8") as fp:
-                json.dump(payload, fp, indent=2)
-            os.replace(tmp_name, target)
-        except Exception:
-            try:
-                os.unlink(tmp_name)
-            except OSError:
-                pass
-            raise
+        write_json_bytes(target, payload)
         return count
 
 
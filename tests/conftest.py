@@ -68,6 +68,22 @@ def pytest_collection_modifyitems(
             item.add_marker(skip_marker)
 
 
+@pytest.fixture(autouse=True)
+def _fresh_system_prompt_tokens():
+    """Drop memoized system-prompt token counts around every test.
+
+    ``system_prompt_tokens`` is an ``lru_cache``; a test that stubs the
+    tokenizer would otherwise leave its fake count behind for the next one.
+    """
+    prompts = sys.modules.get("src.review.prompts")
+    if prompts is not None:
+        prompts.system_prompt_tokens.cache_clear()
+    yield
+    prompts = sys.modules.get("src.review.prompts")
+    if prompts is not None:
+        prompts.system_prompt_tokens.cache_clear()
+
+
 # ---------------------------------------------------------------------------
 # Fake Anthropic response fixtures
 # ---------------------------------------------------------------------------
@@ -187,3 +187,105 @@ def test_failed_render_does_not_wedge_the_pump():
     log.log("recovers")  # queued behind the rescheduled tick
     assert _fire(log)
     assert "recovers" in recovered
+
+
+def test_backlogged_file_lines_render_in_one_tick():
+    log = _make_log()
+    log.log("scanning")  # drains immediately, arms the pacing timer
+    log.log_file_batch(["a.docx", "b.docx", "c.docx"])
+    log.log_step("counting")
+
+    assert _fire(log)
+    assert log.rendered[-1] == (
+        "  → a.docx\n           → b.docx\n           → c.docx",
+        "file",
+        False,
+    )
+    assert _fire(log)
+    assert log.rendered[-1] == ("▸ counting", "step", True)
+
+
+class _LinesText:
+    """Minimal line-model of a tk Text widget for ``_append_line``."""
+
+    def __init__(self, at_bottom=True):
+        self.text = ""
+        self.at_bottom = at_bottom
+        self.seen = 0
+
+    def _lines(self):
+        return self.text.split("\n")
+
+    def index(self, _spec):
+        lines = self._lines()
+        return f"{len(lines)}.{len(lines[-1])}"
+
+    def insert(self, _where, chars, _tags=()):
+        self.text += chars
+
+    def delete(self, start, stop):
+        assert start == "1.0"
+        self.text = "\n".join(self._lines()[int(stop.split(".")[0]) - 1:])
+
+    def yview(self):
+        return (0.0, 1.0 if self.at_bottom else 0.5)
+
+    def see(self, _where):
+        self.seen += 1
+
+
+def _make_text_log(inner):
+    log = object.__new__(EnhancedLog)
+    log._textbox = _FakeTextbox()
+    log._textbox._textbox = inner
+    log._scroll_pending = False
+    log._stamp_sec, log._stamp = -1, ""
+    log.idle = []
+    log.after_idle = log.idle.append
+    return log
+
+
+def test_append_line_trims_oldest_history_and_follows_tail(monkeypatch):
+    inner = _LinesText()
+    log = _make_text_log(inner)
+    monkeypatch.setattr(EnhancedLog, "_MAX_LINES", 3)
+
+    for i in range(5):
+        log._append_line(f"line {i}", "info", False)
+
+    assert inner._lines() == ["         line 2", "         line 3", "         line 4"]
+    # The burst schedules a single scroll, run once Tk is idle.
+    assert inner.seen == 0 and len(log.idle) == 1
+    log.idle.pop()()
+    assert inner.seen == 1 and log._scroll_pending is False
+
+
+def test_append_line_leaves_a_scrolled_back_view_alone():
+    inner = _LinesText(at_bottom=False)
+    log = _make_text_log(inner)
+
+    log._append_line("late line", "info", False)
+
+    assert log.idle == [] and inner.seen == 0
+
+
+def test_timestamp_is_formatted_once_per_second(monkeypatch):
+    import time
+
+    inner = _LinesText()
+    log = _make_text_log(inner)
+    formatted = []
+    real_strftime = time.strftime
+
+    def _strftime(fmt, t):
+        formatted.append(fmt)
+        return real_strftime(fmt, t)
+
+    monkeypatch.setattr(time, "time", lambda: 1_700_000_000.25)
+    monkeypatch.setattr(time, "strftime", _strftime)
+    log._append_line("one", "info", True)
+    log._append_line("two", "info", True)
+
+    assert len(formatted) == 1
+    stamp = real_strftime("%H:%M:%S", time.localtime(1_700_000_000))
+    assert inner._lines() == [f"[{stamp}]  one", f"[{stamp}]  two"]
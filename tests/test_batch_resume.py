@@ -364,12 +364,15 @@ class TestRepairFallbackResolvesByFilename:
         monkeypatch.setattr(pl, "submit_review_batch", fake_submit)
         monkeypatch.setattr(pl, "poll_batch_bounded", lambda *a, **k: PollOutcome(terminal=True, terminal_status="ended"))
         monkeypatch.setattr(
-            pl, "preprocess_spec",
-            lambda content, filename, *, cycle: types.SimpleNamespace(
-                leed_alerts=[], placeholder_alerts=[], code_cycle_alerts=[],
-                structural_alerts=[], template_marker_alerts=[],
-                invalid_code_cycle_alerts=[], duplicate_paragraph_alerts=[],
-            ),
+            pl, "preprocess_specs",
+            lambda items, *, cycle: [
+                types.SimpleNamespace(
+                    leed_alerts=[], placeholder_alerts=[], code_cycle_alerts=[],
+                    structural_alerts=[], template_marker_alerts=[],
+                    invalid_code_cycle_alerts=[], duplicate_paragraph_alerts=[],
+                )
+                for _ in items
+            ],
         )
         monkeypatch.setattr(
             pl, "retrieve_review_results",
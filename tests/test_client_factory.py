@@ -40,7 +40,7 @@ class _FakeAnthropic:
 @pytest.fixture
 def fake_client_factory(monkeypatch):
     """Swap in the fake SDK client and reset the module-global cache."""
-    monkeypatch.setattr(reviewer, "Anthropic", _FakeAnthropic)
+    monkeypatch.setattr(reviewer, "_anthropic_class", lambda: _FakeAnthropic)
     monkeypatch.setattr(reviewer, "_cached_client", None)
     monkeypatch.setattr(reviewer, "_cached_key", None)
     _FakeAnthropic.constructed = []
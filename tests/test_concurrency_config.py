@@ -53,3 +53,152 @@ def test_worker_budget_env_is_fresh_bounded_and_typo_safe(
 
     monkeypatch.setenv(env_name, "3")
     assert reader() == 3
+
+
+def test_extraction_process_pool_is_auto_gated_and_overridable(monkeypatch):
+    env = api_config.ENV_EXTRACTION_PROCESSES
+    threshold = api_config.EXTRACTION_PROCESS_MIN_FILES
+    monkeypatch.setattr(api_config.os, "cpu_count", lambda: 4)
+
+    monkeypatch.delenv(env, raising=False)
+    assert api_config.extraction_process_workers(1) == 0
+    assert api_config.extraction_process_workers(threshold - 1) == 0
+    assert api_config.extraction_process_workers(threshold) == 4
+
+    monkeypatch.setenv(env, "off")
+    assert api_config.extraction_process_workers(threshold * 4) == 0
+
+    monkeypatch.setenv(env, "3")
+    assert api_config.extraction_process_workers(2) == 2
+    assert api_config.extraction_process_workers(threshold) == 3
+
+    monkeypatch.setenv(env, "typo")
+    assert api_config.extraction_process_workers(threshold) == 4
+
+    monkeypatch.setenv(env, "-2")
+    assert api_config.extraction_process_workers(threshold * 4) == 0
+
+    monkeypatch.setattr(api_config.os, "cpu_count", lambda: 1)
+    monkeypatch.delenv(env, raising=False)
+    assert api_config.extraction_process_workers(threshold * 4) == 0
+
+
+def test_preprocess_process_pool_is_auto_gated_and_overridable(monkeypatch):
+    env = api_config.ENV_PREPROCESS_PROCESSES
+    threshold = api_config.PREPROCESS_PROCESS_MIN_SPECS
+    monkeypatch.setattr(api_config.os, "cpu_count", lambda: 4)
+
+    monkeypatch.delenv(env, raising=False)
+    assert api_config.preprocess_process_workers(threshold - 1) == 0
+    assert api_config.preprocess_process_workers(threshold) == 4
+
+    monkeypatch.setenv(env, "0")
+    assert api_config.preprocess_process_workers(threshold * 4) == 0
+
+    monkeypatch.setenv(env, "2")
+    assert api_config.preprocess_process_workers(5) == 2
+
+
+def test_preprocess_specs_falls_back_to_serial_when_pool_cannot_start(monkeypatch):
+    import multiprocessing
+
+    from src.core.code_cycles import CALIFORNIA_2025
+    from src.input import preprocessor
+
+    def refuse(_method):
+        raise OSError("spawn refused")
+
+    preprocessor.clear_preprocess_cache()
+    monkeypatch.setenv(api_config.ENV_PREPROCESS_PROCESSES, "2")
+    monkeypatch.setattr(multiprocessing, "get_context", refuse)
+    items = [
+        ("Comply with 2019 CBC. TODO confirm.", "a.docx"),
+        ("PART 1 GENERAL\n\nPART 1 GENERAL", "b.docx"),
+    ]
+
+    results = preprocessor.preprocess_specs(items, cycle=CALIFORNIA_2025)
+
+    assert results == [
+        preprocessor.preprocess_spec(content, name, cycle=CALIFORNIA_2025)
+        for content, name in items
+    ]
+
+
+def test_prestarted_preprocess_pool_is_used_and_shut_down(monkeypatch):
+    from src.core.code_cycles import CALIFORNIA_2025
+    from src.input import preprocessor
+
+    class _Pool:
+        def __init__(self):
+            self.mapped = 0
+            self.closed = False
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self.closed = True
+
+        def map(self, fn, *iterables):
+            self.mapped += 1
+            return map(fn, *iterables)
+
+    preprocessor.clear_preprocess_cache()
+    monkeypatch.delenv(api_config.ENV_PREPROCESS_PROCESSES, raising=False)
+    assert preprocessor.start_preprocess_pool(1) is None
+
+    pool = _Pool()
+    items = [("Comply with 2019 CBC.", "a.docx")]
+    results = preprocessor.preprocess_specs(items, cycle=CALIFORNIA_2025, pool=pool)
+
+    assert pool.mapped == 1 and pool.closed
+    assert results == [
+        preprocessor.preprocess_spec(content, name, cycle=CALIFORNIA_2025)
+        for content, name in items
+    ]
+
+
+def test_preprocess_specs_memoizes_unchanged_specs(monkeypatch):
+    from src.core.code_cycles import CALIFORNIA_2025
+    from src.input import preprocessor
+
+    preprocessor.clear_preprocess_cache()
+    monkeypatch.delenv(api_config.ENV_PREPROCESS_PROCESSES, raising=False)
+    scanned: list[str] = []
+    real = preprocessor.preprocess_spec
+
+    def counting(content, filename, **kwargs):
+        scanned.append(filename)
+        return real(content, filename, **kwargs)
+
+    monkeypatch.setattr(preprocessor, "preprocess_spec", counting)
+    items = [("TODO: confirm.", "a.docx"), ("Comply with 2019 CBC.", "b.docx")]
+    first = preprocessor.preprocess_specs(items, cycle=CALIFORNIA_2025)
+    first[0].template_marker_alerts.clear()
+
+    edited = [items[0], ("Comply with 2022 CBC.", "b.docx")]
+    second = preprocessor.preprocess_specs(edited, cycle=CALIFORNIA_2025)
+
+    # Only the edited spec is rescanned, and a caller mutating a returned
+    # result does not leak into the memo.
+    assert scanned == ["a.docx", "b.docx", "b.docx"]
+    assert second[0].template_marker_alerts
+    preprocessor.clear_preprocess_cache()
+
+
+def test_extract_multiple_specs_overlaps_files_and_keeps_order(monkeypatch):
+    import threading
+    from pathlib import Path
+
+    from src.input import extractor
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_extract(path):
+        barrier.wait()
+        return path.name
+
+    monkeypatch.setattr(extractor, "extract_text", fake_extract)
+    paths = [Path("c.docx"), Path("a.docx"), Path("b.docx")]
+
+    assert extractor.extract_multiple_specs(paths) == ["c.docx", "a.docx", "b.docx"]
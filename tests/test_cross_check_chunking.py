@@ -220,6 +220,33 @@ class TestCrossDivisionLimitationIsKnown:
         assert len(seen_sets) == 1
         assert seen_sets[0] == {"22 11 00 - Water.docx", "23 05 00 - HVAC.docx"}
 
+    def test_unchunked_path_reuses_the_sized_user_message(self, monkeypatch):
+        # The corpus rendered to size the input is handed to run_cross_check
+        # instead of being rendered and tokenized a second time.
+        monkeypatch.setattr(cc, "count_tokens", lambda *_a, **_k: 10)
+        renders: list[int] = []
+        real_build = cc._build_cross_check_input
+
+        def counting_build(specs, existing):
+            renders.append(len(specs))
+            return real_build(specs, existing)
+
+        prepared: list = []
+
+        def fake_run_cross_check(specs, _existing, **kwargs):
+            prepared.append(kwargs.get("_prepared_input"))
+            return _chunk_result("completed")
+
+        monkeypatch.setattr(cc, "_build_cross_check_input", counting_build)
+        monkeypatch.setattr(cc, "run_cross_check", fake_run_cross_check)
+        specs = [_spec("22 11 00 - Water.docx"), _spec("23 05 00 - HVAC.docx")]
+        run_chunked_cross_check(specs, [], cycle=DEFAULT_CYCLE)
+
+        assert renders == [2]
+        user_message, total_tokens = prepared[0]
+        assert "22 11 00 - Water.docx" in user_message
+        assert total_tokens == 20
+
 
 # ===========================================================================
 # 3. Partial chunk failure: other chunks' findings survive; no mis-attribution
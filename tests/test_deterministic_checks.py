@@ -34,7 +34,9 @@ from src.input.preprocessor import (
     DETERMINISTIC_RULE_STALE_CODE_CYCLE,
     DETERMINISTIC_RULE_TEMPLATE_MARKER,
     PreprocessResult,
+    detect_duplicate_headings,
     detect_duplicate_paragraphs,
+    detect_empty_sections,
     detect_invalid_code_cycle_strings,
     detect_stale_code_cycle_references,
     detect_unresolved_template_markers,
@@ -232,6 +234,24 @@ class TestPreprocessSpecAggregator:
         # invalid_code_cycle_alerts is fine to be empty when no code cite.
         assert result.invalid_code_cycle_alerts == []
 
+    def test_structural_alerts_match_standalone_detectors(self) -> None:
+        # preprocess_spec scans the headings once and shares them between
+        # the empty-section and duplicate-heading detectors.
+        content = (
+            "1.01 GENERAL\n\n"
+            "1.02 SUBMITTALS\n\nProvide product data.\n\n"
+            "1.02 SUBMITTALS\n\nProvide shop drawings."
+        )
+        result = preprocess_spec(content, "s.docx")
+        assert result.structural_alerts == (
+            detect_empty_sections(content, "s.docx")
+            + detect_duplicate_headings(content, "s.docx")
+        )
+        assert {a["type"] for a in result.structural_alerts} == {
+            "Empty section",
+            "Duplicate section heading",
+        }
+
 
 # ---------------------------------------------------------------------------
 # Pipeline plumbing — alerts flow from prepare → submission → result
@@ -0,0 +1,63 @@
+"""Progress-bar coalescing in ``diagnostics_controller.make_diag_progress``.
+
+Every progress call still logs its step message, but while a bar update is
+queued for the UI thread, later calls only replace its value — a burst of
+worker progress costs one redraw at the latest percentage.
+"""
+from __future__ import annotations
+
+import pytest
+
+# The controller imports the CTk widgets module; skip cleanly without it
+# (mirrors the repo convention that GUI tests skip without tkinter/ctk).
+pytest.importorskip("customtkinter")
+
+from src.gui.diagnostics_controller import make_diag_progress  # noqa: E402
+
+
+class _FakeApp:
+    def __init__(self) -> None:
+        self.queued: list = []
+        self.steps: list[str] = []
+        self.bar: list[float] = []
+        self._diagnostics_report = None
+        app = self
+
+        class _Log:
+            def log_step(self, msg):
+                app.steps.append(msg)
+
+        class _Bar:
+            def set(self, value):
+                app.bar.append(value)
+
+        self.log = _Log()
+        self.progress_bar = _Bar()
+
+    def _dispatch_if_current(self, epoch, fn):
+        self.queued.append(fn)
+
+    def drain(self) -> None:
+        queued, self.queued = self.queued, []
+        for fn in queued:
+            fn()
+
+
+def test_burst_of_progress_redraws_bar_once_at_latest_value():
+    app = _FakeApp()
+    progress = make_diag_progress(app, "review", run_epoch=1)
+    for pct in (10.0, 20.0, 30.0):
+        progress(pct, f"step {pct:.0f}")
+    app.drain()
+    assert app.steps == ["step 10", "step 20", "step 30"]
+    assert app.bar == [0.3]
+
+
+def test_progress_after_drain_queues_a_new_update():
+    app = _FakeApp()
+    progress = make_diag_progress(app, "review", run_epoch=1)
+    progress(50.0, "half")
+    app.drain()
+    progress(150.0, "done")
+    app.drain()
+    assert app.bar == [0.5, 1.0]
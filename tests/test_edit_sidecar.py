@@ -114,6 +114,21 @@ def test_write_sidecar_creates_file_next_to_report(tmp_path: Path):
     assert data["report_file"] == report_path.name
 
 
+def test_sidecar_is_compact_unless_pretty_requested(tmp_path: Path, monkeypatch):
+    f = _finding_with_edit()
+    result = _StubPipelineResult(review_result=ReviewResult(findings=[f]))
+    report_path = tmp_path / "report.docx"
+
+    monkeypatch.delenv("SPEC_CRITIC_PRETTY_JSON", raising=False)
+    compact = write_edit_instructions_sidecar(result, report_path).read_text(encoding="utf-8")
+    assert "\n" not in compact
+
+    monkeypatch.setenv("SPEC_CRITIC_PRETTY_JSON", "1")
+    pretty = write_edit_instructions_sidecar(result, report_path).read_text(encoding="utf-8")
+    assert '\n  "edit_count": 1' in pretty
+    assert json.loads(pretty)["edits"] == json.loads(compact)["edits"]
+
+
 # ---------------------------------------------------------------------------
 # Per-file fan-out (TRUST_AUDIT P0-1 / P0-2)
 #
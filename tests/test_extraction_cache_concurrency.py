@@ -198,3 +198,117 @@ def test_bad_owned_path_does_not_poison_healthy_shared_waiter(tmp_path, monkeypa
 
     assert [item.filename for item in waiter_result] == ["good.docx"]
     assert calls == Counter({"bad.docx": 1, "good.docx": 1})
+
+
+def test_opt_in_disk_tier_survives_a_fresh_process_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("SPEC_CRITIC_EXTRACTION_CACHE_PERSIST", "1")
+    monkeypatch.setenv("SPEC_CRITIC_EXTRACTION_CACHE_DIR", str(tmp_path / "cache"))
+    original = tmp_path / "original.docx"
+    original.write_bytes(b"same bytes")
+    calls: Counter[str] = Counter()
+
+    def fake_extract(paths, *, max_workers=None):
+        del max_workers
+        calls.update(path.name for path in paths)
+        return [_result(path) for path in paths]
+
+    monkeypatch.setattr("src.input.extractor.extract_multiple_specs", fake_extract)
+
+    _fresh_cache(monkeypatch)
+    first = ec.extract_multiple_specs_cached([original])[0]
+    assert calls == Counter({"original.docx": 1})
+
+    # A new session (empty in-process cache) reading identical bytes under
+    # another name is served from disk with path-derived fields re-derived.
+    _fresh_cache(monkeypatch)
+    renamed = tmp_path / "renamed.docx"
+    renamed.write_bytes(b"same bytes")
+    second = ec.extract_multiple_specs_cached([renamed])[0]
+    assert calls == Counter({"original.docx": 1})
+    assert second.content == first.content
+    assert second.paragraph_map == []
+    assert second.extraction_warnings == ["warning:original.docx"]
+    assert second.filename == "renamed.docx"
+    assert second.source_path == str(renamed)
+    assert second.document_id == "renamed"
+
+    # Changed bytes miss the disk tier.
+    _fresh_cache(monkeypatch)
+    renamed.write_bytes(b"edited bytes")
+    ec.extract_multiple_specs_cached([renamed])
+    assert calls == Counter({"original.docx": 1, "renamed.docx": 1})
+
+
+def test_disk_tier_skips_a_file_saved_mid_parse(tmp_path, monkeypatch):
+    monkeypatch.setenv("SPEC_CRITIC_EXTRACTION_CACHE_PERSIST", "1")
+    monkeypatch.setenv("SPEC_CRITIC_EXTRACTION_CACHE_DIR", str(tmp_path / "cache"))
+    spec = tmp_path / "spec.docx"
+    spec.write_bytes(b"before")
+
+    def editing_extract(paths, *, max_workers=None):
+        del max_workers
+        spec.write_bytes(b"after, longer")
+        return [_result(path) for path in paths]
+
+    monkeypatch.setattr("src.input.extractor.extract_multiple_specs", editing_extract)
+    _fresh_cache(monkeypatch)
+    ec.extract_multiple_specs_cached([spec])
+
+    cache_root = ec.default_disk_cache_dir()
+    assert not cache_root.exists() or not list(cache_root.glob("*.json"))
+
+
+def test_gauge_analysis_parse_is_reused_by_the_run(tmp_path, monkeypatch):
+    from src.gui import token_analysis_controller as tac
+
+    spec = tmp_path / "spec.docx"
+    spec.write_bytes(b"bytes")
+    calls: Counter[str] = Counter()
+
+    def fake_extract(paths, *, max_workers=None):
+        del max_workers
+        calls.update(path.name for path in paths)
+        return [_result(path) for path in paths]
+
+    monkeypatch.setattr("src.input.extractor.extract_multiple_specs", fake_extract)
+    monkeypatch.setattr(tac, "count_tokens", lambda text: len(text))
+    _fresh_cache(monkeypatch)
+
+    analyzed, tokens = tac._extract_and_count(spec)
+    assert tokens == len(analyzed.content)
+    ec.extract_multiple_specs_cached([spec])
+    assert calls == Counter({"spec.docx": 1})
+
+
+def test_superseded_analysis_work_is_a_no_op(tmp_path, monkeypatch):
+    from src.gui import token_analysis_controller as tac
+
+    spec = tmp_path / "spec.docx"
+    spec.write_bytes(b"bytes")
+    calls: Counter[str] = Counter()
+
+    def fake_extract(paths, *, max_workers=None):
+        del max_workers
+        calls.update(path.name for path in paths)
+        return [_result(path) for path in paths]
+
+    monkeypatch.setattr("src.input.extractor.extract_multiple_specs", fake_extract)
+    _fresh_cache(monkeypatch)
+
+    assert tac._extract_and_count(spec, lambda: False) is None
+    assert calls == Counter()
+
+
+def test_analysis_pool_shutdown_releases_the_pool():
+    from src.gui import token_analysis_controller as tac
+
+    pool = tac._analysis_pool()
+    tac.shutdown_analysis_pool()
+    assert tac._analysis_executor is None
+    assert tac._analysis_pool() is not pool
+    tac.shutdown_analysis_pool()
+
+
+def test_disk_tier_is_off_by_default(tmp_path, monkeypatch):
+    monkeypatch.delenv("SPEC_CRITIC_EXTRACTION_CACHE_PERSIST", raising=False)
+    assert ec._disk_cache() is None
@@ -449,6 +449,19 @@ class TestSupplementalInvariants:
         )
         assert with_box.word_count > without.word_count
 
+    def test_word_count_is_counted_per_paragraph_exactly(self, tmp_path: Path):
+        # Counted paragraph by paragraph during extraction; the total must
+        # equal a whitespace split of the joined content (runs of spaces,
+        # tabs and the table-row separators included).
+        path = _build_docx(
+            tmp_path,
+            body_paras=["Provide  ductwork\tper SMACNA.", "  Seal joints. "],
+            textbox_xml=[_drawingml_textbox_paragraph("Boxed words here.")],
+            footnotes=[("1", "See  Section 23 05 00.")],
+        )
+        spec = extract_text_from_docx(path)
+        assert spec.word_count == len(spec.content.split())
+
 
 # ---------------------------------------------------------------------------
 # Tracked changes (Word revision markup) → Accept-All view
@@ -673,3 +686,37 @@ class TestTrackedChangesExtraction:
         spec = extract_text_from_docx(path)  # raises if the invariant breaks
         reconstructed = "\n\n".join(m.text for m in spec.paragraph_map)
         assert reconstructed == spec.content
+
+
+# ---------------------------------------------------------------------------
+# Merged table cells
+# ---------------------------------------------------------------------------
+
+
+class TestMergedTableCells:
+    def test_row_text_matches_python_docx_cell_grid(self, tmp_path: Path):
+        # The table walk reads <w:tc> elements directly; a horizontal span
+        # repeats per grid column and a vertical continuation repeats the
+        # span root's text, exactly as ``_Row.cells`` yields them.
+        doc = Document()
+        table = doc.add_table(rows=3, cols=3)
+        for r in range(3):
+            for c in range(3):
+                table.cell(r, c).text = f"r{r}c{c}"
+        table.cell(0, 0).merge(table.cell(0, 1))
+        table.cell(1, 2).merge(table.cell(2, 2))
+        table.cell(2, 0).text = ""
+        expected = [
+            " | ".join(
+                text for cell in row.cells if (text := cell.text.strip())
+            )
+            for row in table.rows
+        ]
+        out = tmp_path / "merged.docx"
+        doc.save(out)
+
+        spec = extract_text_from_docx(out)
+
+        rows = [m.text for m in spec.paragraph_map if m.element_type == "table_cell"]
+        assert rows == expected
+        assert rows[2] == "r2c1 | r1c2\nr2c2"
@@ -157,6 +157,22 @@ class TestDataPlane:
         result = finalize_batch_result(state)
         assert result.failed_review_specs == []
 
+    def test_duplicate_spec_aliases_flow_to_pipeline_result(self, monkeypatch):
+        # A copy skipped for identical text is not a request, but it must
+        # still reach the report through the submission -> result chain.
+        results = {
+            "review__a__0": ReviewResult(findings=[], parse_status="complete"),
+            "review__b__1": ReviewResult(findings=[], parse_status="complete"),
+            "review__c__2": ReviewResult(findings=[], parse_status="complete"),
+        }
+        monkeypatch.setattr(
+            pl, "retrieve_review_results", lambda job, *, model: dict(results)
+        )
+        submission = self._submission()
+        submission.duplicate_spec_aliases = {"A copy.docx": "A.docx"}
+        result = finalize_batch_result(collect_review_batch_results(submission))
+        assert result.duplicate_spec_aliases == {"A copy.docx": "A.docx"}
+
 
 # ---------------------------------------------------------------------------
 # 2. Summary rollup
@@ -288,3 +304,13 @@ class TestReportRendering:
         # assert the specific failure markers rather than that substring.)
         assert " of 3 (" not in text
         assert "review failed (not reviewed)" not in text
+
+    def test_skipped_duplicate_listed_with_reviewed_copy(self, tmp_path: Path):
+        result = self._clean_result()
+        result.duplicate_spec_aliases = {"A copy.docx": "A.docx"}
+        out = tmp_path / "report.docx"
+        export_report(result, out)
+        text = _all_text_from(Document(str(out)))
+        assert "A copy.docx — identical to A.docx (reviewed once)" in text
+        # The skipped copy was not reviewed, so the count is unchanged.
+        assert "Files Reviewed: 3" in text
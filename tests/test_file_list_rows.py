@@ -0,0 +1,88 @@
+"""Row reuse in ``FileListPanel.load_files``.
+
+Each re-analysis reloads the spec list; rows are pooled so a reload
+reconfigures the CTk widgets it already built instead of destroying and
+recreating them. Built via ``object.__new__`` with ``_build_row`` stubbed, so
+no Tk root is required (same approach as ``test_activity_log_pump``).
+"""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("customtkinter")
+
+from src.gui.widgets import FileListPanel  # noqa: E402
+
+
+class _Var:
+    def __init__(self, panel):
+        self._panel = panel
+        self.value = True
+
+    def set(self, value):
+        self.value = value
+        self._panel._on_checkbox_change()  # mirrors the trace_add callback
+
+    def get(self):
+        return self.value
+
+
+class _Widget:
+    def __init__(self):
+        self.packed = False
+        self.options = {}
+
+    def pack(self, **_kwargs):
+        self.packed = True
+
+    def pack_forget(self):
+        self.packed = False
+
+    def configure(self, **kwargs):
+        self.options.update(kwargs)
+
+
+def _make_panel():
+    panel = object.__new__(FileListPanel)
+    panel._file_data = []
+    panel._rows = []
+    panel._loading = False
+    panel._expanded = False
+    panel.changes = 0
+    panel._on_selection_change = lambda: setattr(panel, "changes", panel.changes + 1)
+    panel.count_label = _Widget()
+    panel.expand_label = _Widget()
+    panel._pack_self = lambda: None
+
+    def _build_row():
+        row = {
+            "frame": _Widget(),
+            "var": _Var(panel),
+            "name_label": _Widget(),
+            "tokens_label": _Widget(),
+        }
+        panel._rows.append(row)
+        return row
+
+    panel._build_row = _build_row
+    return panel
+
+
+def _fd(name, tokens=100):
+    return {"path": name, "filename": name, "tokens": tokens}
+
+
+def test_reload_reuses_rows_and_hides_the_surplus():
+    panel = _make_panel()
+    panel.load_files([_fd("a"), _fd("b"), _fd("c")])
+    first_rows = list(panel._rows)
+
+    panel.load_files([_fd("d", 2500), _fd("e")], selection={"e": False})
+
+    assert panel._rows == first_rows
+    assert [r["frame"].packed for r in panel._rows] == [True, True, False]
+    assert panel._rows[0]["name_label"].options["text"] == "d"
+    assert panel._rows[0]["tokens_label"].options["text"] == "2,500"
+    assert panel.get_selected_files() == ["d"]
+    assert panel.count_label.options["text"] == "1/2 selected"
+    assert panel.changes == 0  # loading never reports a user selection change
@@ -12,6 +12,7 @@ the real ``SpecReviewApp`` so no Tk root is needed.
 """
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -19,7 +20,9 @@ import pytest
 from src.gui.file_selection_controller import (
     apply_selected_specs,
     clear_selection,
+    find_missing_specs,
     merge_selected_specs,
+    snapshot_spec_dirs,
 )
 from src.gui.token_analysis_controller import resolve_initial_selection
 from src.gui.token_analysis_controller import (
@@ -224,6 +227,28 @@ def test_mixed_selection_keeps_only_supported():
     assert app._selected_files == [_docx("folderA", "s1")]
 
 
+def test_word_lock_files_and_uppercase_suffix():
+    app = _FakeApp()
+    apply_selected_specs(
+        app,
+        [Path("/folderA/~$s1.docx"), Path("/folderA/S2.DOCX"), _docx("folderA", "s1")],
+    )
+    assert app._selected_files == [Path("/folderA/S2.DOCX"), _docx("folderA", "s1")]
+
+
+def test_folder_discovery_applies_the_same_filter(tmp_path):
+    # ``pipeline._get_spec_files`` (one ``os.scandir`` pass) shares
+    # ``is_spec_filename`` with the GUI filter above: lock files and
+    # non-specs are dropped, a directory named like a spec is not a file,
+    # and the order is case-insensitive by name.
+    from src.orchestration.pipeline import _get_spec_files
+
+    for name in ("b.docx", "A2.DOCX", "~$b.docx", "notes.txt"):
+        (tmp_path / name).write_bytes(b"x")
+    (tmp_path / "folder.docx").mkdir()
+    assert _get_spec_files(tmp_path) == [tmp_path / "A2.DOCX", tmp_path / "b.docx"]
+
+
 # --------------------------------------------------------------------------
 # clear_selection (Clear button)
 # --------------------------------------------------------------------------
@@ -275,6 +300,74 @@ def test_can_load_again_after_clear():
     assert app.analyzed_with[-1] == [_docx("folderB", "s2")]
 
 
+# --------------------------------------------------------------------------
+# find_missing_specs (Run-click existence check)
+# --------------------------------------------------------------------------
+def test_missing_check_skips_unchanged_folder(tmp_path):
+    spec = tmp_path / "s1.docx"
+    spec.write_bytes(b"x")
+    snapshot = snapshot_spec_dirs([spec])
+    assert find_missing_specs([spec], snapshot) == []
+
+
+def test_missing_check_rescans_folder_after_delete(tmp_path):
+    keep, gone = tmp_path / "keep.docx", tmp_path / "gone.docx"
+    keep.write_bytes(b"x")
+    gone.write_bytes(b"x")
+    snapshot = snapshot_spec_dirs([keep, gone])
+    gone.unlink()
+    # Force a visible mtime change even on coarse-resolution filesystems.
+    stamp = snapshot[str(tmp_path)][0] + 10_000_000_000
+    os.utime(tmp_path, ns=(stamp, stamp))
+    assert find_missing_specs([keep, gone], snapshot) == [gone]
+
+
+def test_adding_files_does_not_mask_earlier_delete(tmp_path):
+    # Delete a selected file, then add another from the same folder: the
+    # folder must not be re-snapshotted, or the delete would be vouched for.
+    first, second = tmp_path / "s1.docx", tmp_path / "s2.docx"
+    first.write_bytes(b"x")
+    second.write_bytes(b"x")
+    app = _FakeApp()
+    apply_selected_specs(app, [first])
+    first.unlink()
+    stamp = app._selected_dir_snapshot[str(tmp_path)][0] + 10_000_000_000
+    os.utime(tmp_path, ns=(stamp, stamp))
+    apply_selected_specs(app, [second])
+    assert find_missing_specs(app._selected_files, app._selected_dir_snapshot) == [first]
+
+
+def test_adding_files_snapshots_only_new_folders(tmp_path):
+    folder_a, folder_b = tmp_path / "a", tmp_path / "b"
+    folder_a.mkdir()
+    folder_b.mkdir()
+    (folder_a / "s1.docx").write_bytes(b"x")
+    (folder_b / "s2.docx").write_bytes(b"x")
+    app = _FakeApp()
+    apply_selected_specs(app, [folder_a / "s1.docx"])
+    before = dict(app._selected_dir_snapshot)
+    apply_selected_specs(app, [folder_b / "s2.docx"])
+    assert app._selected_dir_snapshot[str(folder_a)] == before[str(folder_a)]
+    assert str(folder_b) in app._selected_dir_snapshot
+
+
+def test_missing_check_does_not_vouch_for_unlisted_names(tmp_path):
+    # A dropped/typed path is only filtered by name; an unchanged folder
+    # must not vouch for a file its listing never contained.
+    present = tmp_path / "s1.docx"
+    present.write_bytes(b"x")
+    never = tmp_path / "typo.docx"
+    snapshot = snapshot_spec_dirs([present, never])
+    assert find_missing_specs([present, never], snapshot) == [never]
+
+
+def test_missing_check_without_snapshot_stats_every_file(tmp_path):
+    present = tmp_path / "s1.docx"
+    present.write_bytes(b"x")
+    absent = tmp_path / "nope.docx"
+    assert find_missing_specs([present, absent], None) == [absent]
+
+
 # --------------------------------------------------------------------------
 # resolve_initial_selection (checkbox-state preservation across reload)
 # --------------------------------------------------------------------------
@@ -18,6 +18,7 @@ Skips when tkinter is unavailable (the controller imports
 from __future__ import annotations
 
 import copy
+import time
 from pathlib import Path
 
 import pytest
@@ -83,6 +84,10 @@ class TestExportHtmlController:
         text = out.read_bytes().decode("utf-8")
         assert text.startswith("<!DOCTYPE html>")
         assert "SENTINEL-ISSUE-MULTIFILE" in text
+        for _ in range(200):  # the browser is launched off the UI thread
+            if opened:
+                break
+            time.sleep(0.01)
         assert opened and opened[0].startswith("file://")
         assert result == snapshot  # read-only input
 
@@ -128,6 +133,58 @@ class TestExportHtmlController:
         assert callable(report_controller.export_report_to_file)
 
 
+class TestExportDocxController:
+    def test_sidecars_written_beside_report(self, monkeypatch, tmp_path):
+        app = _FakeApp()
+        out = tmp_path / "report.docx"
+        monkeypatch.setattr(
+            report_controller.filedialog, "asksaveasfilename", lambda **kw: str(out)
+        )
+        monkeypatch.setattr(
+            report_controller, "export_report", lambda result, path: path.write_bytes(b"docx")
+        )
+        status = report_controller.export_report_to_file(app, build_full_pipeline_result())
+        assert status == "success"
+        assert (tmp_path / "report.edits.json").is_file()
+        assert app.log.successes[0] == f"Report saved: {out}"
+        assert any("report.edits.json" in m for m in app.log.successes)
+
+    def test_failed_report_writes_no_sidecars(self, monkeypatch, tmp_path):
+        app = _FakeApp()
+        out = tmp_path / "report.docx"
+        monkeypatch.setattr(
+            report_controller.filedialog, "asksaveasfilename", lambda **kw: str(out)
+        )
+
+        def _boom(result, path):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(report_controller, "export_report", _boom)
+        status = report_controller.export_report_to_file(app, build_full_pipeline_result())
+        assert status == "error"
+        assert any("disk full" in e for e in app.log.errors)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_failed_report_keeps_earlier_sidecars(self, monkeypatch, tmp_path):
+        # Re-saving over an earlier export: a failure must not delete the
+        # sidecars that still describe the earlier report.
+        app = _FakeApp()
+        out = tmp_path / "report.docx"
+        earlier = tmp_path / "report.edits.json"
+        earlier.write_text("{}", encoding="utf-8")
+        monkeypatch.setattr(
+            report_controller.filedialog, "asksaveasfilename", lambda **kw: str(out)
+        )
+
+        def _boom(result, path):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(report_controller, "export_report", _boom)
+        status = report_controller.export_report_to_file(app, build_full_pipeline_result())
+        assert status == "error"
+        assert earlier.read_text(encoding="utf-8") == "{}"
+
+
 class TestAdditiveGuiWiring:
     """Source-level pins: the hook is additive and the lifecycle is untouched."""
 
@@ -1093,6 +1093,16 @@ class TestAlertsNeverTruncated:
         assert "and 4 more" not in html
 
 
+class TestDuplicateSpecAliases:
+    def test_skipped_copy_listed_under_files_reviewed(self):
+        result = build_empty_pipeline_result()
+        result.duplicate_spec_aliases = {"Section_22_1000 copy.docx": "Section_22_1000.docx"}
+        html = render_html_report(result, generated_at=GENERATED)
+        annotated = "Section_22_1000 copy.docx — identical to Section_22_1000.docx (reviewed once)"
+        assert annotated in html
+        assert annotated in _plaintext(html)
+
+
 class TestProfileReport:
     def setup_method(self):
         self.result = build_profile_pipeline_result()
@@ -1388,6 +1398,16 @@ class TestWriteFile:
         text = out.read_bytes().decode("utf-8")
         assert "Ünïcode—Spec ⚡" in text
 
+    def test_chunked_write_matches_whole_document_encode(self, tmp_path, monkeypatch):
+        import src.output.html_report_exporter as exporter
+
+        monkeypatch.setattr(exporter, "_WRITE_CHUNK_CHARS", 7)
+        out = tmp_path / "review.html"
+        result = build_hostile_pipeline_result()
+        write_html_report(result, out, generated_at=GENERATED)
+        expected = render_html_report(result, generated_at=GENERATED).encode("utf-8")
+        assert out.read_bytes() == expected
+
 
 class TestLargeReport:
     def test_many_findings_render(self):
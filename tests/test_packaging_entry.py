@@ -0,0 +1,34 @@
+"""Guard the frozen Windows entry point's process-pool bootstrap.
+
+The PyInstaller build freezes ``packaging/windows/app_entry.py``, not
+``main.py``. Spawned extraction/preprocess workers re-execute that script in
+the frozen exe, so ``multiprocessing.freeze_support()`` must run before any
+argv handling or GUI import — otherwise every worker opens another window.
+"""
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+_PACKAGING_DIR = Path(__file__).resolve().parent.parent / "packaging" / "windows"
+
+
+def _main_body() -> list[ast.stmt]:
+    tree = ast.parse((_PACKAGING_DIR / "app_entry.py").read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "main":
+            return node.body
+    raise AssertionError("app_entry.py defines no main()")
+
+
+def test_pyinstaller_analysis_targets_app_entry() -> None:
+    spec = (_PACKAGING_DIR / "spec-critic.spec").read_text(encoding="utf-8")
+    assert '"app_entry.py"' in spec
+
+
+def test_frozen_entry_calls_freeze_support_first() -> None:
+    first = _main_body()[0]
+    assert isinstance(first, ast.Expr) and isinstance(first.value, ast.Call)
+    func = first.value.func
+    assert isinstance(func, ast.Attribute) and func.attr == "freeze_support"
+    assert isinstance(func.value, ast.Name) and func.value.id == "multiprocessing"
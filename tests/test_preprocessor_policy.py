@@ -25,12 +25,18 @@ Two independent features land in this file because they share the same module
 """
 from __future__ import annotations
 
+import re
+from pathlib import Path
 
 import pytest
 
 from src.core.code_cycles import CALIFORNIA_2025
 from src.input.preprocessor import (
     DETERMINISTIC_RULE_STALE_CODE_CYCLE,
+    LEED_PATTERNS,
+    PLACEHOLDER_PATTERNS,
+    _find_matches,
+    _required_literal,
     detect_stale_code_cycle_references,
 )
 from src.review.prompt_serialization import (
@@ -111,6 +117,17 @@ class TestRenderPreDetectedBlock:
         listed = sum(1 for i in range(8) if f"[TBD-{i}]" in out)
         assert listed <= 3, f"expected ≤3 examples shown, got {listed}"
 
+    def test_examples_are_the_first_matches_seen(self) -> None:
+        # Only the leading examples are kept while the rest are counted, so
+        # the shown examples are always the first ones in alert order.
+        alerts = [
+            _alert("f.docx", "placeholder", f"[TBD-{i}]") for i in range(50)
+        ]
+        out = render_pre_detected_block(alerts, filename="f.docx")
+        shown = [i for i in range(50) if f"[TBD-{i}]" in out]
+        assert shown == list(range(len(shown)))
+        assert "placeholder (count=50)" in out
+
     def test_truncates_long_match_text(self) -> None:
         long_match = "X" * 500
         alerts = [_alert("f.docx", "placeholder", long_match)]
@@ -272,6 +289,8 @@ class TestPipelinePerSpecAlertMap:
         for fname in ("23 21 13 - A.docx", "23 22 13 - B.docx"):
             doc = Document()
             doc.add_paragraph("PART 1 - GENERAL")
+            # Distinct per file: identical specs are collapsed to one review.
+            doc.add_paragraph(f"SECTION {fname[:8]}")
             doc.add_paragraph("This is a LEED Gold project.")
             doc.add_paragraph("Coordinate with [INSERT PROJECT NAME].")
             doc.add_paragraph("Refer to TODO: confirm capacity later.")
@@ -306,6 +325,104 @@ class TestPipelinePerSpecAlertMap:
                 assert alert["filename"] == f.name
 
 
+class TestPipelineSkipsIdenticalSpecs:
+    """Specs whose extracted text is identical are reviewed once."""
+
+    def _patch_extractor(self, monkeypatch, contents):
+        from src.input.extractor import ExtractedSpec
+
+        specs = [
+            ExtractedSpec(
+                filename=f"spec_{i}.docx",
+                content=text,
+                word_count=len(text.split()),
+                source_path="",
+                source_format="docx",
+                paragraph_map=None,
+            )
+            for i, text in enumerate(contents)
+        ]
+        monkeypatch.setattr(
+            "src.orchestration.pipeline.extract_multiple_specs_cached",
+            lambda paths: specs,
+        )
+        return [Path(f"/tmp/{s.filename}") for s in specs]
+
+    def test_duplicate_text_is_skipped_with_warning(
+        self, monkeypatch, stub_count_tokens
+    ) -> None:
+        from src.orchestration.pipeline import _prepare_specs
+
+        files = self._patch_extractor(
+            monkeypatch,
+            ["PART 1 - GENERAL\nPipe.", "PART 1 - GENERAL\nDuct.", "PART 1 - GENERAL\nPipe."],
+        )
+        logged: list[tuple[str, str]] = []
+        prepared = _prepare_specs(
+            input_dir=Path("/tmp"),
+            files=files,
+            log=lambda msg, level="info": logged.append((level, msg)),
+            cycle=CALIFORNIA_2025,
+        )
+        assert [s.filename for s in prepared.specs] == ["spec_0.docx", "spec_1.docx"]
+        assert "spec_2.docx" not in prepared.pre_detected_by_filename
+        assert prepared.duplicate_spec_aliases == {"spec_2.docx": "spec_0.docx"}
+        assert any(
+            level == "warning" and "spec_2.docx" in msg and "spec_0.docx" in msg
+            for level, msg in logged
+        )
+
+    def test_opt_out_reviews_every_copy(
+        self, monkeypatch, stub_count_tokens
+    ) -> None:
+        from src.orchestration.pipeline import _prepare_specs
+
+        monkeypatch.setenv("SPEC_CRITIC_SKIP_DUPLICATE_SPECS", "0")
+        files = self._patch_extractor(monkeypatch, ["Same text.", "Same text."])
+        prepared = _prepare_specs(
+            input_dir=Path("/tmp"), files=files, cycle=CALIFORNIA_2025
+        )
+        assert len(prepared.specs) == 2
+        assert prepared.duplicate_spec_aliases == {}
+
+
+class TestPipelineLoadProgress:
+    """Per-file "Loaded i/N" ticks are throttled, not dropped."""
+
+    def test_large_run_reports_throttled_load_progress(
+        self, monkeypatch, stub_count_tokens
+    ) -> None:
+        from src.input.extractor import ExtractedSpec
+        from src.orchestration.pipeline import _prepare_specs
+
+        specs = [
+            ExtractedSpec(
+                filename=f"spec_{i}.docx",
+                content=f"PART 1 - GENERAL\nItem {i}.",
+                word_count=5,
+                source_path="",
+                source_format="docx",
+                paragraph_map=None,
+            )
+            for i in range(100)
+        ]
+        monkeypatch.setattr(
+            "src.orchestration.pipeline.extract_multiple_specs_cached",
+            lambda paths: specs,
+        )
+        ticks: list[str] = []
+        _prepare_specs(
+            input_dir=Path("/tmp"),
+            files=[Path(f"/tmp/{s.filename}") for s in specs],
+            progress=lambda pct, msg, **_kw: ticks.append(msg),
+            cycle=CALIFORNIA_2025,
+        )
+        loaded = [m for m in ticks if m.startswith("Loaded ")]
+        assert loaded[0] == "Loaded 5/100"
+        assert loaded[-1] == "Loaded 100/100"
+        assert len(loaded) == 20
+
+
 class TestBatchSubmissionFeedsAlerts:
     """``submit_review_batch`` must pass each spec's alerts into the prompt."""
 
@@ -458,3 +575,57 @@ class TestStaleCycleSuppression:
         years = {a["found_year"] for a in alerts}
         assert "2019" not in years
         assert "2022" in years
+
+
+# ---------------------------------------------------------------------------
+# Required-literal prefilter
+# ---------------------------------------------------------------------------
+
+class TestRequiredLiteralPrefilter:
+    @pytest.mark.parametrize(
+        ("pattern", "literal"),
+        [
+            (r"(?i)\[\s*INSERT[^\]]*\]", "INSERT"),
+            (r"\bLorem ipsum\b", "Lorem ipsum"),
+            (r"_{3,}", ""),
+            (r"TODO|FIXME", ""),
+            (r"(ab)cd", "cd"),
+            (r"abc?", "ab"),
+            (r"(?x)a b", ""),
+        ],
+    )
+    def test_extracted_literal(self, pattern: str, literal: str) -> None:
+        assert _required_literal(pattern) == literal
+
+    @pytest.mark.parametrize(
+        "text", ["[\u0130NSERT here]", "[\u0131nsert here]", "[\u017felect one]"]
+    )
+    def test_unicode_case_variants_still_match(self, text: str) -> None:
+        # ``re`` IGNORECASE treats these as matching ASCII letters; the
+        # prefilter must not skip the pattern on them.
+        alerts = _find_matches(PLACEHOLDER_PATTERNS, text, "s.docx", 10)
+        assert [a["match"] for a in alerts] == [text]
+
+    def test_absent_literal_yields_no_alerts(self) -> None:
+        content = "Provide piping per Section 23 21 13.\n" * 50
+        assert _find_matches(PLACEHOLDER_PATTERNS, content, "s.docx", 10) == []
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "LEED-NC and leed silver, not LEEDS or reLEED; USGBC.",
+            # "ß" folds to two characters, so offsets do not line up and
+            # the plain regex scan must take over.
+            "Stra\u00dfe LEED ci, \u0131eed? LEED.",
+        ],
+    )
+    def test_literal_led_scan_matches_finditer(self, content: str) -> None:
+        expected = []
+        for pattern, _ in LEED_PATTERNS:
+            for match in re.finditer(pattern, content):
+                expected.append((match.start(), match.group(0)))
+        alerts = _find_matches(LEED_PATTERNS, content, "s.docx", 50)
+        found = {(a["position"], a["match"]) for a in alerts}
+        assert found <= set(expected)
+        # Span dedup only drops hits nested in an earlier, longer one.
+        assert {pos for pos, _ in expected} == {a["position"] for a in alerts}
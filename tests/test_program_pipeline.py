@@ -543,6 +543,28 @@ def test_partial_submission_counts_only_partitions_actually_submitted():
     assert submission.missing_module_ids == ("datacenter_architecture",)
 
 
+def test_submission_keeps_unassigned_child_names_once_per_basename():
+    assignments = (
+        _assignment("21 13 13 Fire Sprinklers.docx", ("datacenter_fire",)),
+    )
+    fire_submission = _submission(
+        "datacenter_fire", "21 13 13 Fire Sprinklers.docx"
+    )
+    fire_submission.files_reviewed.extend(
+        ["old/21 13 13 Fire Sprinklers.docx", "a/Legacy.docx", "b/Legacy.docx"]
+    )
+    submission = pp.ProgramSubmission(
+        program_id=HYPERSCALE_DATACENTER_PROGRAM.program_id,
+        assignments=assignments,
+        partitions={"datacenter_fire": fire_submission},
+    )
+
+    assert submission.files_reviewed == [
+        "21 13 13 Fire Sprinklers.docx",
+        "a/Legacy.docx",
+    ]
+
+
 def test_partial_realtime_submission_skips_remote_batch_polling(monkeypatch):
     name = "21 13 13 Fire Sprinklers.docx"
     assignment = _assignment(name, ("datacenter_fire",))
@@ -31,6 +31,7 @@ from src.core.code_cycles import CALIFORNIA_2025
 from src.cross_check.cross_checker import (
     _build_cross_check_input,
     _get_cross_check_user_message,
+    render_corpus_block,
 )
 from src.input.extractor import ExtractedSpec
 from src.review.prompt_serialization import (
@@ -39,6 +40,7 @@ from src.review.prompt_serialization import (
     TAG_FINDINGS,
     TAG_PROJECT_CONTEXT,
     TAG_SPEC,
+    document_block_parts,
     escape_attr,
     escape_text,
     render_blocks,
@@ -48,6 +50,7 @@ from src.review.prompt_serialization import (
 from src.review.prompts import (
     get_single_spec_user_message,
     get_system_prompt,
+    system_prompt_tokens,
 )
 from src.review.reviewer import Finding
 from src.verification.triage import _build_user_prompt as triage_build_user_prompt
@@ -147,6 +150,13 @@ class TestWrappers:
     def test_render_blocks_drops_empties(self):
         assert render_blocks(["a", "", None, "b"]) == "a\nb"
 
+    def test_document_block_parts_join_to_the_wrapped_block(self):
+        attrs = {"filename": HOSTILE_FILENAME, "skip": None}
+        parts = document_block_parts("spec", HOSTILE_CLOSING_TAG, attrs=attrs)
+        assert "\n".join(parts) == wrap_document_block(
+            "spec", HOSTILE_CLOSING_TAG, attrs=attrs
+        )
+
 
 # ---------------------------------------------------------------------------
 # 2. prompts.py — single-spec review user message
@@ -201,6 +211,26 @@ class TestReviewSystemPromptIsStable:
         assert sp_a == sp_b
         assert "<spec>" not in sp_a or "Treat content inside" in sp_a
 
+    def test_system_prompt_is_built_once_per_cycle(self):
+        # Memoized: every request build asks for it, so repeat calls return
+        # the same string object rather than re-rendering the template.
+        assert get_system_prompt(CALIFORNIA_2025) is get_system_prompt(CALIFORNIA_2025)
+
+    def test_system_prompt_token_count_matches_a_fresh_count(self, monkeypatch):
+        from src.core import tokenizer
+
+        calls = []
+
+        def _word_tokens(text):
+            calls.append(text)
+            return len(text.split())
+
+        monkeypatch.setattr(tokenizer, "count_tokens", _word_tokens)
+        prompt = get_system_prompt(CALIFORNIA_2025)
+        assert system_prompt_tokens(CALIFORNIA_2025) == len(prompt.split())
+        assert system_prompt_tokens(CALIFORNIA_2025) == len(prompt.split())
+        assert calls == [prompt]
+
 
 # ---------------------------------------------------------------------------
 # 3. cross_checker.py — corpus wrapper
@@ -243,6 +273,18 @@ class TestCrossCheckCorpusWrapper:
         assert "&lt;/spec&gt;" in out
         assert "Normal plumbing spec." in out
 
+    def test_corpus_matches_per_spec_wrapped_composition(self):
+        specs = [
+            self._spec(filename=HOSTILE_FILENAME, content=HOSTILE_CLOSING_TAG),
+            self._spec(filename="22 07 00.docx", content="Normal plumbing spec."),
+        ]
+        inner = render_blocks(
+            wrap_document_block(TAG_SPEC, s.content, attrs={"filename": s.filename})
+            for s in specs
+        )
+        assert render_corpus_block(specs) == f"<{TAG_CORPUS}>\n{inner}\n</{TAG_CORPUS}>"
+        assert render_corpus_block([]) == f"<{TAG_CORPUS}>\n\n</{TAG_CORPUS}>"
+
 
 class TestCrossCheckUserMessageContext:
     def test_hostile_project_context_escaped_and_optional(self):
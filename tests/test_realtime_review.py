@@ -62,6 +62,7 @@ from src.review.review_request_builder import (
     RETRY_TRUNCATED_REVIEW_INSTRUCTION,
     ReviewRequestSpec,
     build_review_request,
+    build_token_count_request,
 )
 from src.review.reviewer import Finding, ReviewResult
 from src.tracing import activate_span
@@ -308,6 +309,156 @@ class TestRunnerHappyPath:
             run_realtime_review([])
 
 
+class TestUserPrefixCacheBreakpoint:
+    def _spec(
+        self, filename: str, project_context: str, run_spec_count: int = 2
+    ) -> ReviewRequestSpec:
+        return ReviewRequestSpec(
+            spec_content=f"Body of {filename}.",
+            filename=filename,
+            model=REVIEW_MODEL_DEFAULT,
+            project_context=project_context,
+            force_allow_extended_output=False,
+            run_spec_count=run_spec_count,
+        )
+
+    def test_project_context_head_is_a_shared_cached_block(self):
+        a = build_review_request(self._spec("a.docx", "Campus <B> context"))
+        b = build_review_request(self._spec("b.docx", "Campus <B> context"))
+
+        head_a, rest_a = a.params["messages"][0]["content"]
+        head_b, rest_b = b.params["messages"][0]["content"]
+        assert head_a == head_b
+        assert "cache_control" in head_a and "cache_control" not in rest_a
+        assert "&lt;B&gt;" in head_a["text"]
+        assert head_a["text"] + rest_a["text"] == a.user_message
+        assert "b.docx" in rest_b["text"]
+
+    def test_single_spec_run_keeps_plain_string(self):
+        # A lone request never reads the head back, so a breakpoint would
+        # only add the cache-write premium.
+        solo = build_review_request(self._spec("a.docx", "Campus context", 1))
+        assert solo.params["messages"][0]["content"] == solo.user_message
+
+    def test_no_context_keeps_plain_string_and_counts_strip_blocks(self):
+        plain = build_review_request(self._spec("a.docx", ""))
+        assert plain.params["messages"][0]["content"] == plain.user_message
+
+        built, count_kwargs = build_token_count_request(
+            self._spec("a.docx", "Campus context")
+        )
+        assert count_kwargs["messages"] == [
+            {"role": "user", "content": built.user_message}
+        ]
+
+
+class TestReviewResponseCache:
+    @pytest.fixture
+    def store(self, monkeypatch):
+        entries: dict[str, object] = {}
+        monkeypatch.setenv("SPEC_CRITIC_REVIEW_CACHE", "1")
+        monkeypatch.delenv("SPEC_CRITIC_REVIEW_CACHE_REFRESH", raising=False)
+        monkeypatch.setattr(rt, "store_review_message", entries.__setitem__)
+        monkeypatch.setattr(rt, "load_review_message", entries.get)
+        return entries
+
+    def test_unchanged_request_is_replayed_without_an_api_call(self, monkeypatch, store):
+        client = FakeRealtimeClient(lambda kwargs: review_tool_use_response())
+        monkeypatch.setattr(rt, "_get_client", lambda: client)
+        diagnostics = FakeDiagnostics()
+
+        first, _ = run_realtime_review([_spec("a.docx")])
+        second, _ = run_realtime_review([_spec("a.docx")], diagnostics=diagnostics)
+
+        assert len(client.calls) == 1
+        assert len(store) == 1
+        replay = second["review__a__0"]
+        assert replay.parse_status == "ok"
+        assert [f.issue for f in replay.findings] == [
+            f.issue for f in first["review__a__0"].findings
+        ]
+        assert replay.findings[0] is not first["review__a__0"].findings[0]
+        assert (replay.input_tokens, replay.output_tokens) == (0, 0)
+        assert diagnostics.calls == []
+
+    def test_changed_content_misses_and_refresh_bypasses_reads(self, monkeypatch, store):
+        client = FakeRealtimeClient(lambda kwargs: review_tool_use_response())
+        monkeypatch.setattr(rt, "_get_client", lambda: client)
+
+        run_realtime_review([_spec("a.docx")])
+        run_realtime_review([_spec("a.docx", content="Different spec text entirely.")])
+        assert len(client.calls) == 2
+
+        monkeypatch.setenv("SPEC_CRITIC_REVIEW_CACHE_REFRESH", "1")
+        run_realtime_review([_spec("a.docx")])
+        assert len(client.calls) == 3
+
+    def test_truncated_response_is_not_stored(self, monkeypatch, store):
+        client = FakeRealtimeClient(lambda kwargs: max_tokens_incomplete_response())
+        monkeypatch.setattr(rt, "_get_client", lambda: client)
+
+        run_realtime_review([_spec("a.docx")])
+
+        assert store == {}
+
+    def test_store_and_load_round_trip_on_disk(self, tmp_path):
+        types = pytest.importorskip("anthropic.types")
+        from src.review import review_cache
+
+        message = types.Message.model_validate(
+            {
+                "id": "msg_1",
+                "type": "message",
+                "role": "assistant",
+                "model": REVIEW_MODEL_DEFAULT,
+                "content": [
+                    {
+                        "type": "tool_use",
+                        "id": "toolu_1",
+                        "name": "submit_review_findings",
+                        "input": {"findings": [], "note": "caf\u00e9"},
+                    }
+                ],
+                "stop_reason": "tool_use",
+                "stop_sequence": None,
+                "usage": {"input_tokens": 10, "output_tokens": 5},
+            }
+        )
+        review_cache.store_review_message("k1", message, cache_dir=tmp_path)
+
+        loaded = review_cache.load_review_message("k1", cache_dir=tmp_path)
+        assert loaded.model_dump(mode="json") == message.model_dump(mode="json")
+        assert review_cache.load_review_message("k2", cache_dir=tmp_path) is None
+        assert [p.name for p in tmp_path.iterdir()] == ["k1.json"]
+
+    def test_store_evicts_least_recently_used_entries_past_the_cap(
+        self, monkeypatch, tmp_path
+    ):
+        import os
+
+        from src.review import review_cache
+
+        monkeypatch.setenv("SPEC_CRITIC_REVIEW_CACHE_MAX_MB", "1")
+        blob = {"content": [{"type": "text", "text": "x" * 400_000}]}
+        for i, key in enumerate(("old", "mid")):
+            review_cache.store_review_message(key, blob, cache_dir=tmp_path)
+            os.utime(tmp_path / f"{key}.json", ns=(i * 10**9, i * 10**9))
+        review_cache.store_review_message("new", blob, cache_dir=tmp_path)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["mid.json", "new.json"]
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("SPEC_CRITIC_REVIEW_CACHE", raising=False)
+        called = []
+        monkeypatch.setattr(rt, "load_review_message", lambda key: called.append(key))
+        client = FakeRealtimeClient(lambda kwargs: review_tool_use_response())
+        monkeypatch.setattr(rt, "_get_client", lambda: client)
+
+        run_realtime_review([_spec("a.docx")])
+
+        assert called == []
+
+
 # ===========================================================================
 # 3-4. Truncation parity with the batch path (inline repair, failed-review
 #      surfacing through collect → finalize)
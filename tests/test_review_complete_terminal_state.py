@@ -132,3 +132,19 @@ class TestTerminalState:
         levels = [lvl for _phase, lvl, _msg in app.finalize_calls]
         assert "warning" in levels
         assert "success" not in levels
+
+
+def test_pending_reset_is_cancelled_when_the_next_run_starts():
+    from src.gui.review_run_controller import _cancel_pending_reset
+
+    app = _make_app()
+    cancelled: list[str] = []
+    app.after = lambda _ms, _fn: "after#7"
+    app.after_cancel = cancelled.append
+
+    on_review_complete(app, _result(error=None))
+    assert app._reset_after_id == "after#7"
+
+    _cancel_pending_reset(app)
+    assert cancelled == ["after#7"]
+    assert app._reset_after_id is None
@@ -402,6 +402,74 @@ class TestPipelinePreflightExactCountAuthoritative:
         )
 
 
+class TestPipelinePreflightCountsLocallyOnce:
+    """Ranking, the preflight log line and the local gate share one count."""
+
+    def test_each_request_is_estimated_once(
+        self, monkeypatch, stub_client
+    ):
+        from src.orchestration import pipeline
+
+        from src.input.extractor import ExtractedSpec
+
+        # Above the exact-count-all threshold so the top-K ranking runs too.
+        # Distinct bodies so identical-spec collapsing keeps every file.
+        count = pipeline._PREFLIGHT_EXACT_COUNT_ALL_THRESHOLD + 2
+        specs = [
+            ExtractedSpec(
+                filename=f"spec_{i}.docx",
+                content=f"Sample spec content {i}.",
+                word_count=4,
+                source_path="",
+                source_format="docx",
+                paragraph_map=None,
+            )
+            for i in range(count)
+        ]
+        monkeypatch.setattr(
+            "src.orchestration.pipeline.extract_multiple_specs_cached",
+            lambda paths: specs,
+        )
+        monkeypatch.setattr("src.orchestration.pipeline.get_cached_token_count", lambda key: None)
+        monkeypatch.setattr("src.orchestration.pipeline.cache_token_count", lambda key, value: None)
+        stub_client.return_tokens = 100
+        estimated: list[str] = []
+        real_estimate = pipeline.estimate_local_request_tokens
+
+        def _counting_estimate(rs):
+            estimated.append(rs.filename)
+            return real_estimate(rs)
+
+        monkeypatch.setattr(pipeline, "estimate_local_request_tokens", _counting_estimate)
+
+        pipeline._prepare_specs(
+            input_dir=Path("/tmp"),
+            files=[Path(f"/tmp/{s.filename}") for s in specs],
+            model=MODEL_OPUS_48,
+        )
+
+        assert sorted(estimated) == sorted(s.filename for s in specs)
+
+    def test_local_gate_fails_before_any_exact_count_call(
+        self, monkeypatch, patched_extractor, stub_client
+    ):
+        from src.orchestration import pipeline
+
+        monkeypatch.setattr("src.orchestration.pipeline.get_cached_token_count", lambda key: None)
+        monkeypatch.setattr("src.orchestration.pipeline.cache_token_count", lambda key, value: None)
+        monkeypatch.setattr(
+            pipeline, "estimate_local_request_tokens", lambda rs: RECOMMENDED_MAX * 2
+        )
+
+        with pytest.raises(ValueError, match="cl100k tokens"):
+            pipeline._prepare_specs(
+                input_dir=Path("/tmp"),
+                files=patched_extractor,
+                model=MODEL_OPUS_48,
+            )
+        assert stub_client.calls == []
+
+
 # ---------------------------------------------------------------------------
 # Output cap defense-in-depth
 # ---------------------------------------------------------------------------
@@ -0,0 +1,76 @@
+"""Redundant-repaint guards in ``TokenGauge``.
+
+Each CTk colour/text ``configure`` repaints the widget's canvas, so the gauge
+only pushes values that changed. Built via ``object.__new__`` with recording
+stand-ins, so no Tk root is required (same approach as
+``test_activity_log_pump``).
+"""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("customtkinter")
+
+from src.gui.widgets import COLORS, TokenGauge  # noqa: E402
+
+
+class _Widget:
+    def __init__(self):
+        self.calls = []
+
+    def configure(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+def _make_gauge(max_tokens=1000):
+    gauge = object.__new__(TokenGauge)
+    gauge.max_tokens = max_tokens
+    gauge._animating = True  # keep the animation loop out of the test
+    gauge._target_pct = gauge._current_pct = 0.0
+    gauge._target_color = COLORS["accent"]
+    gauge._bar_width = 200
+    gauge._shown_bar = (0, COLORS["accent"])
+    gauge._shown_title = gauge._shown_status = gauge._shown_update = None
+    gauge._max_suffix = f" / {max_tokens:,}"
+    for name in ("title_label", "count_label", "status_label", "progress_bar"):
+        setattr(gauge, name, _Widget())
+    return gauge
+
+
+def test_repeated_update_does_not_repaint_unchanged_labels():
+    gauge = _make_gauge()
+    gauge.update_gauge(500, file_count=3)
+    gauge.update_gauge(500, file_count=3)
+
+    assert len(gauge.title_label.calls) == 1
+    assert len(gauge.status_label.calls) == 1
+
+    gauge.update_gauge(500, file_count=3, is_exact=True)
+    assert gauge.title_label.calls[-1] == {"text": "LARGEST SPEC CAPACITY"}
+    assert len(gauge.status_label.calls) == 1
+
+
+def test_bar_is_only_reconfigured_when_width_or_colour_moves():
+    gauge = _make_gauge()
+    gauge.update_gauge(500, file_count=1)
+    gauge._current_pct = gauge._target_pct
+
+    gauge._update_bar()
+    gauge._update_bar()
+
+    assert len(gauge.progress_bar.calls) == 1
+    assert gauge.progress_bar.calls[0]["width"] == 100
+    assert gauge.progress_bar.calls[0]["fg_color"].lower() == COLORS["success"].lower()
+
+
+def test_identical_update_is_a_no_op_until_reset():
+    gauge = _make_gauge()
+    gauge.update_gauge(1500, file_count=2)
+    gauge.update_gauge(1500, file_count=2)
+
+    assert gauge.count_label.calls == [{"text": "1,500 / 1,000"}]
+
+    gauge.reset()
+    gauge.update_gauge(1500, file_count=2)
+    assert gauge.count_label.calls[-1] == {"text": "1,500 / 1,000"}
+    assert len(gauge.count_label.calls) == 3
@@ -19,6 +19,7 @@ All tests are hermetic — no network, no real API key required.
 from __future__ import annotations
 
 import json
+import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -229,6 +230,26 @@ def test_concurrent_writers_produce_well_formed_jsonl(trace_dir: Path, clean_env
         set_recorder(None)
 
 
+def test_idle_writer_flushes_lines_before_stop(trace_dir: Path, clean_env: None) -> None:
+    """A quiet queue pushes buffered lines to disk without waiting for stop()."""
+    rec = TraceRecorder(run_id="flush1", trace_dir=trace_dir, capture_level=LEVEL_DEFAULT)
+    rec.start()
+    try:
+        with rec.span(KIND_REVIEW, "review") as s:
+            rec.add_event(s, "note", marker="live")
+        deadline = time.monotonic() + 5.0
+        body = ""
+        while time.monotonic() < deadline:
+            path = trace_dir / FILE_EVENTS
+            body = path.read_text() if path.exists() else ""
+            if "live" in body:
+                break
+            time.sleep(0.01)
+        assert "live" in body
+    finally:
+        rec.stop()
+
+
 # ---- Hook resilience ---------------------------------------------------
 def test_hooks_swallow_recorder_exceptions(trace_dir: Path, clean_env: None) -> None:
     """A capture hook calling a broken recorder must not raise."""
@@ -772,3 +793,16 @@ def test_batch_verification_span_skips_local_skip_and_cache_hit(recorder: TraceR
     spans = [json.loads(line) for line in spans_path.read_text().strip().split("\n")] if spans_path.read_text().strip() else []
     vspans = [s for s in spans if s["kind"] == "verification_initial"]
     assert len(vspans) == 0
+
+
+def test_cli_run_listing_keeps_only_run_directories_in_name_order(tmp_path: Path) -> None:
+    from src.tracing.cli import _iter_run_dirs
+
+    for name in ("run-b", "run-a"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "run.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "no-meta").mkdir()
+    (tmp_path / "stray.json").write_text("{}", encoding="utf-8")
+
+    assert [p.name for p in _iter_run_dirs(tmp_path)] == ["run-a", "run-b"]
+    assert list(_iter_run_dirs(tmp_path / "missing")) == []
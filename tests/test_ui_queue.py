@@ -0,0 +1,124 @@
+"""Tests for the single-drain UI work queue (``src/gui/ui_queue.py``).
+
+Hermetic: the module is tkinter-free, so a fake app that records ``after``
+calls stands in for the Tk root.
+"""
+from __future__ import annotations
+
+from src.gui import ui_queue
+from src.gui.ui_queue import (
+    UI_DRAIN_BATCH,
+    UI_POLL_INTERVAL_MS,
+    drain_ui_queue,
+    post_to_ui,
+    start_ui_queue,
+    stop_ui_queue,
+)
+
+
+class _FakeApp:
+    def __init__(self) -> None:
+        self.scheduled: list[tuple[int, object]] = []
+        self.cancelled: list = []
+        self.reported: list = []
+
+    def after(self, delay, fn):
+        self.scheduled.append((delay, fn))
+        return f"after#{len(self.scheduled)}"
+
+    def after_cancel(self, after_id) -> None:
+        self.cancelled.append(after_id)
+
+    def report_callback_exception(self, exc_type, exc, tb) -> None:
+        self.reported.append(exc_type)
+
+
+def test_post_without_queue_falls_back_to_after_zero():
+    app = _FakeApp()
+    calls = []
+    post_to_ui(app, lambda: calls.append(1))
+    assert len(app.scheduled) == 1
+    delay, fn = app.scheduled[0]
+    assert delay == 0
+    fn()
+    assert calls == [1]
+
+
+def test_posts_are_queued_not_scheduled_individually():
+    app = _FakeApp()
+    start_ui_queue(app)
+    assert [d for d, _ in app.scheduled] == [UI_POLL_INTERVAL_MS]
+    calls = []
+    for i in range(5):
+        post_to_ui(app, lambda i=i: calls.append(i))
+    # No per-event timers were registered.
+    assert len(app.scheduled) == 1
+    assert drain_ui_queue(app) == 5
+    assert calls == [0, 1, 2, 3, 4]
+    assert app.scheduled[-1][0] == UI_POLL_INTERVAL_MS
+
+
+def test_drain_is_capped_per_tick_and_repolls_immediately():
+    app = _FakeApp()
+    start_ui_queue(app)
+    calls = []
+    for i in range(UI_DRAIN_BATCH + 3):
+        post_to_ui(app, lambda i=i: calls.append(i))
+    assert drain_ui_queue(app) == UI_DRAIN_BATCH
+    assert app.scheduled[-1][0] == 1
+    assert drain_ui_queue(app) == 3
+    assert calls == list(range(UI_DRAIN_BATCH + 3))
+
+
+def test_raising_callback_is_reported_and_does_not_stop_the_drain():
+    app = _FakeApp()
+    start_ui_queue(app)
+    calls = []
+
+    def boom():
+        raise RuntimeError("boom")
+
+    post_to_ui(app, boom)
+    post_to_ui(app, lambda: calls.append("after"))
+    assert drain_ui_queue(app) == 2
+    assert app.reported == [RuntimeError]
+    assert calls == ["after"]
+
+
+def test_tick_is_armed_before_callbacks_run():
+    # A callback that opens a modal spins a nested event loop; the next
+    # drain tick must already be scheduled so later posts keep flowing.
+    app = _FakeApp()
+    start_ui_queue(app)
+    armed_during_callback = []
+    post_to_ui(app, lambda: armed_during_callback.append(len(app.scheduled)))
+    assert drain_ui_queue(app) == 1
+    assert armed_during_callback == [2]
+    # Exactly one tick is pending afterwards.
+    assert len(app.scheduled) == 2
+
+
+def test_stop_inside_a_callback_is_not_undone():
+    app = _FakeApp()
+    start_ui_queue(app)
+    # The stop lands in a full batch, which would otherwise re-poll at once.
+    for _ in range(UI_DRAIN_BATCH - 1):
+        post_to_ui(app, lambda: None)
+    post_to_ui(app, lambda: stop_ui_queue(app))
+    assert drain_ui_queue(app) == UI_DRAIN_BATCH
+    assert app._ui_queue_after_id is None
+
+
+def test_stop_cancels_the_pending_tick():
+    app = _FakeApp()
+    start_ui_queue(app)
+    pending = app._ui_queue_after_id
+    stop_ui_queue(app)
+    assert app.cancelled == [pending]
+    assert app._ui_queue_after_id is None
+    stop_ui_queue(app)
+    assert app.cancelled == [pending]
+
+
+def test_module_is_tkinter_free():
+    assert "tkinter" not in vars(ui_queue)
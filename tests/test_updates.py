@@ -267,8 +267,7 @@ class _RedirectedResponse:
 def test_fetch_manifest_rejects_redirect_downgrade(monkeypatch) -> None:
     payload = json.dumps(_manifest()).encode("utf-8")
     monkeypatch.setattr(
-        updates.urllib.request,
-        "urlopen",
+        "urllib.request.urlopen",
         lambda request, timeout=None: _RedirectedResponse(payload, "http://evil/latest.json"),
     )
     with pytest.raises(UpdateError):
@@ -280,8 +279,7 @@ def test_fetch_manifest_accepts_https_redirect(monkeypatch) -> None:
     # https-to-https redirect must keep working.
     payload = json.dumps(_manifest()).encode("utf-8")
     monkeypatch.setattr(
-        updates.urllib.request,
-        "urlopen",
+        "urllib.request.urlopen",
         lambda request, timeout=None: _RedirectedResponse(
             payload, "https://objects.githubusercontent.com/latest.json"
         ),
@@ -292,9 +290,7 @@ def test_fetch_manifest_accepts_https_redirect(monkeypatch) -> None:
 
 def test_open_url_rejects_redirect_downgrade_and_closes(monkeypatch) -> None:
     resp = _RedirectedResponse(b"exe bytes", "http://evil/SpecCriticSetup.exe")
-    monkeypatch.setattr(
-        updates.urllib.request, "urlopen", lambda request, timeout=None: resp
-    )
+    monkeypatch.setattr("urllib.request.urlopen", lambda request, timeout=None: resp)
     with pytest.raises(UpdateError):
         updates._open_url("https://host/SpecCriticSetup.exe", timeout=1.0)
     assert resp.closed  # the rejected connection is not leaked
@@ -164,3 +164,15 @@ def test_legacy_entry_missing_keys_loads_at_defaults(tmp_path: Path):
     assert restored.models_disagreed is False
     assert restored.correction is None
     assert restored.rejected_sources == []
+
+
+def test_cache_file_is_written_compact(tmp_path: Path):
+    cache = VerificationCache()
+    cache.put(_finding(), cycle=DEFAULT_CYCLE, result=_fully_populated_grounded_result())
+    cache_path = tmp_path / "cache.json"
+    assert cache.save_to_disk(cache_path) == 1
+
+    text = cache_path.read_text(encoding="utf-8")
+    # Machine-read only: no indentation, so the C encoder handles it.
+    assert "\n" not in text
+    assert '"entries":{' in text